@@ -1,17 +1,36 @@
 from typing import List
 from .config import RedisScheme, RedisConfig
 from .base.redis_client import RedisClient
-from .enum import ExpireEnum
+from .enum import ExpireEnum, PriorityEnum, BitUnitEnum, OverflowEnum
 from .exception import (
     OldRedisVersionException,
     InvalidOptionsCombinationException,
     InvalidArgumentTypeException,
     UnexpectedReturnTypeException,
+    AdmissionRejectedException,
+    ClientClosedException,
+    CodecNotAvailableException,
 )
+from .codec import Codec, available_codecs, get_codec, register_codec
+from .compression import Compression, Compressor, DictionaryCompressor
 from .string.string_model import StringModel
 from .string.int_model import IntModel
 from .string.float_model import FloatModel
 from .string.bool_model import BoolModel
+from .string.bytes_model import BytesModel
+from .string.pydantic_model import PydanticModel
+from .string.sharded_int_model import ShardedIntModel
+from .string.large_object_model import LargeObjectModel
+from .bitmap.bitmap_model import BitmapModel
+from .bitmap.int_array_model import IntArrayModel
+from .string.bulk import get_many, getex_many, set_many
+from .string.write_behind import IncrementBuffer
+from .string.write_coalescing import WriteCoalescer
+from .cache.local_cache import LocalCache
+from .cache.negative_cache import NegativeCache
+from .cache.near_cache import NearCacheInvalidator
+from .cache.cache_aside import cached
+from .cache.swr import stale_while_revalidate
 
 __all__: List[str] = [
     # base
@@ -20,14 +39,48 @@ __all__: List[str] = [
     "RedisClient",
     # enum
     "ExpireEnum",
+    "PriorityEnum",
+    "BitUnitEnum",
+    "OverflowEnum",
     # error
     "OldRedisVersionException",
     "InvalidOptionsCombinationException",
     "InvalidArgumentTypeException",
     "UnexpectedReturnTypeException",
+    "AdmissionRejectedException",
+    "ClientClosedException",
+    "CodecNotAvailableException",
+    # codec
+    "Codec",
+    "available_codecs",
+    "get_codec",
+    "register_codec",
+    # compression
+    "Compression",
+    "Compressor",
+    "DictionaryCompressor",
     # model
     "StringModel",
     "IntModel",
     "FloatModel",
     "BoolModel",
+    "BytesModel",
+    "PydanticModel",
+    "ShardedIntModel",
+    "LargeObjectModel",
+    "BitmapModel",
+    "IntArrayModel",
+    # bulk
+    "get_many",
+    "getex_many",
+    "set_many",
+    # write-behind
+    "IncrementBuffer",
+    "WriteCoalescer",
+    # cache
+    "LocalCache",
+    "NegativeCache",
+    "NearCacheInvalidator",
+    "cached",
+    "stale_while_revalidate",
 ]
@@ -0,0 +1,159 @@
+"""Module containing the admission controller used to shed load"""
+
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
+import asyncio
+import heapq
+import itertools
+
+from pydantic import BaseModel
+
+from aiorediantic.enum import PriorityEnum
+from aiorediantic.exception import AdmissionRejectedException
+
+_PRIORITY_RANK: Dict[PriorityEnum, int] = {
+    PriorityEnum.HIGH: 0,
+    PriorityEnum.NORMAL: 1,
+    PriorityEnum.LOW: 2,
+}
+
+
+class AdmissionStats(BaseModel):
+    """A snapshot of the admission controller counters"""
+
+    max_inflight: int
+    max_queue: int
+    inflight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    queued_total: int = 0
+    rejected_low_priority: int = 0
+    rejected_queue_full: int = 0
+    rejected_queue_timeout: int = 0
+
+    @property
+    def rejected(self) -> int:
+        return (
+            self.rejected_low_priority
+            + self.rejected_queue_full
+            + self.rejected_queue_timeout
+        )
+
+
+class AdmissionController:
+    """
+    Caps the number of in-flight operations and the number of operations
+    waiting for a slot.
+
+    HIGH priority waiters are woken before NORMAL ones. LOW priority operations
+    are never queued: they are rejected as soon as the in-flight count reaches
+    max_inflight * low_priority_ratio.
+    """
+
+    def __init__(
+        self,
+        max_inflight: int,
+        max_queue: int = 0,
+        queue_timeout: Optional[float] = None,
+        low_priority_ratio: float = 1.0,
+    ) -> None:
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be greater than 0")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        if not 0 < low_priority_ratio <= 1:
+            raise ValueError("low_priority_ratio must be in range (0, 1]")
+
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.low_priority_limit = max(1, int(max_inflight * low_priority_ratio))
+
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._sequence = itertools.count()
+        self.inflight = 0
+        self.queued = 0
+        self._admitted = 0
+        self._queued_total = 0
+        self._rejected_low_priority = 0
+        self._rejected_queue_full = 0
+        self._rejected_queue_timeout = 0
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            max_inflight=self.max_inflight,
+            max_queue=self.max_queue,
+            inflight=self.inflight,
+            queued=self.queued,
+            admitted=self._admitted,
+            queued_total=self._queued_total,
+            rejected_low_priority=self._rejected_low_priority,
+            rejected_queue_full=self._rejected_queue_full,
+            rejected_queue_timeout=self._rejected_queue_timeout,
+        )
+
+    def _limit(self, priority: PriorityEnum) -> int:
+        if priority == PriorityEnum.LOW:
+            return self.low_priority_limit
+        return self.max_inflight
+
+    async def acquire(self, priority: PriorityEnum = PriorityEnum.NORMAL) -> None:
+        if self.inflight < self._limit(priority) and not self.queued:
+            self.inflight += 1
+            self._admitted += 1
+            return
+
+        if priority == PriorityEnum.LOW:
+            self._rejected_low_priority += 1
+            raise AdmissionRejectedException(
+                f"LOW priority operation rejected: {self.inflight} operations in flight, limit {self.low_priority_limit}"
+            )
+        if self.queued >= self.max_queue:
+            self._rejected_queue_full += 1
+            raise AdmissionRejectedException(
+                f"{priority.value} priority operation rejected: admission queue is full ({self.max_queue})"
+            )
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, (_PRIORITY_RANK[priority], next(self._sequence), future)
+        )
+        self.queued += 1
+        self._queued_total += 1
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except BaseException as ex:
+            if future.done() and not future.cancelled():
+                # the slot was handed over while we were giving up on it
+                self.release()
+            else:
+                future.cancel()
+                self.queued -= 1
+            if isinstance(ex, asyncio.TimeoutError):
+                self._rejected_queue_timeout += 1
+                raise AdmissionRejectedException(
+                    f"{priority.value} priority operation rejected: no slot within {self.queue_timeout} seconds"
+                ) from None
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            # hand the slot over to the waiter, inflight stays the same
+            future.set_result(None)
+            self.queued -= 1
+            self._admitted += 1
+            return
+        self.inflight -= 1
+
+    @asynccontextmanager
+    async def admit(
+        self, priority: PriorityEnum = PriorityEnum.NORMAL
+    ) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
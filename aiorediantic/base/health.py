@@ -0,0 +1,189 @@
+"""Module containing the background health checker of the connection pool"""
+from typing import Any, List, Optional
+import asyncio
+import time as mod_time
+import weakref
+
+from pydantic import BaseModel
+import aioredis
+from aioredis.connection import Connection
+
+from aiorediantic.utils import str_if_byte
+
+
+class ConnectionHealth(BaseModel):
+    """Round trip times (in seconds) of a single pooled connection"""
+
+    rtt: float
+    last_rtt: float
+    checks: int = 0
+
+
+class HealthStatus(BaseModel):
+    """A snapshot of the health checker state"""
+
+    healthy: bool
+    latency: Optional[float] = None
+    latency_threshold: Optional[float] = None
+    rounds: int = 0
+    failed_rounds: int = 0
+    checks: int = 0
+    evicted: int = 0
+    connections: List[ConnectionHealth] = []
+
+
+class HealthChecker:
+    """
+    Pings the idle connections of a pool on a schedule.
+
+    Each check takes an idle connection out of the pool so that no request can
+    pick it up meanwhile, sends a PING and puts it back. Connections that fail
+    or time out are evicted from the pool. Round trip times are smoothed with an
+    exponentially weighted moving average, per connection and for the client.
+
+    The client is unhealthy when the last round could not reach Redis at all or
+    when the smoothed latency is above latency_threshold.
+    """
+
+    smoothing: float = 0.2
+
+    def __init__(
+        self,
+        client: aioredis.Redis,
+        interval: float,
+        timeout: float = 1.0,
+        latency_threshold: Optional[float] = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+
+        self.client = client
+        self.interval = interval
+        self.timeout = timeout
+        self.latency_threshold = latency_threshold
+        self.latency: Optional[float] = None
+        self._connections: "weakref.WeakKeyDictionary[Connection, ConnectionHealth]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._task: "Optional[asyncio.Task[None]]" = None
+        self._rounds = 0
+        self._failed_rounds = 0
+        self._last_round_failed = False
+        self._checks = 0
+        self._evicted = 0
+
+    @property
+    def healthy(self) -> bool:
+        if self._last_round_failed:
+            return False
+        if self.latency_threshold is not None and self.latency is not None:
+            return self.latency <= self.latency_threshold
+        return True
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def status(self) -> HealthStatus:
+        return HealthStatus(
+            healthy=self.healthy,
+            latency=self.latency,
+            latency_threshold=self.latency_threshold,
+            rounds=self._rounds,
+            failed_rounds=self._failed_rounds,
+            checks=self._checks,
+            evicted=self._evicted,
+            connections=[health.copy() for health in self._connections.values()],
+        )
+
+    def _record(self, conn: Connection, rtt: float) -> None:
+        self._checks += 1
+        if self.latency is None:
+            self.latency = rtt
+        else:
+            self.latency += self.smoothing * (rtt - self.latency)
+
+        health = self._connections.get(conn)
+        if health is None:
+            self._connections[conn] = ConnectionHealth(rtt=rtt, last_rtt=rtt, checks=1)
+            return
+        health.rtt += self.smoothing * (rtt - health.rtt)
+        health.last_rtt = rtt
+        health.checks += 1
+
+    async def _ping(self, conn: Connection) -> None:
+        await conn.send_command("PING")
+        response: Any = await conn.read_response()
+        if str_if_byte(response) != "PONG":
+            raise aioredis.ResponseError(f"Unexpected PING response {response!r}")
+
+    async def _evict(self, pool: aioredis.ConnectionPool, conn: Connection) -> None:
+        self._evicted += 1
+        self._connections.pop(conn, None)
+        await conn.disconnect()
+        async with pool._lock:  # pyright: ignore
+            if conn in pool._in_use_connections:  # pyright: ignore
+                pool._in_use_connections.remove(conn)  # pyright: ignore
+                pool._created_connections -= 1  # pyright: ignore
+
+    async def _check(self, pool: aioredis.ConnectionPool, conn: Connection) -> bool:
+        started = mod_time.perf_counter()
+        try:
+            await conn.connect()
+            await asyncio.wait_for(self._ping(conn), self.timeout)
+        except (aioredis.RedisError, OSError, asyncio.TimeoutError):
+            await self._evict(pool, conn)
+            return False
+
+        self._record(conn, mod_time.perf_counter() - started)
+        await pool.release(conn)
+        return True
+
+    async def check(self) -> None:
+        """Run one round of checks over the idle connections"""
+        pool: aioredis.ConnectionPool = self.client.connection_pool
+        async with pool._lock:  # pyright: ignore
+            # take the idle connections out of the pool so requests can not use them
+            idle: List[Connection] = pool._available_connections  # pyright: ignore
+            borrowed = list(idle)
+            pool._available_connections.clear()  # pyright: ignore
+            pool._in_use_connections.update(borrowed)  # pyright: ignore
+
+        if not borrowed and not pool._in_use_connections:  # pyright: ignore
+            # nothing is connected yet, probe with a fresh connection
+            try:
+                borrowed = [await pool.get_connection("PING")]
+            except (aioredis.RedisError, OSError):
+                self._end_round(failed=True)
+                return
+
+        results = await asyncio.gather(*(self._check(pool, conn) for conn in borrowed))
+        self._end_round(failed=bool(borrowed) and not any(results))
+
+    def _end_round(self, failed: bool) -> None:
+        self._rounds += 1
+        self._last_round_failed = failed
+        if failed:
+            self._failed_rounds += 1
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception:
+                self._end_round(failed=True)
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,129 @@
+"""Module containing the rolling latency sketch used for adaptive timeouts"""
+from typing import Callable, Dict, List, Optional, Sequence
+import math
+import time as mod_time
+
+from pydantic import BaseModel
+
+
+class LatencySnapshot(BaseModel):
+    """An exportable copy of a LatencySketch, latencies are in seconds"""
+
+    relative_accuracy: float
+    window: float
+    count: int
+    quantiles: Dict[float, float] = {}
+    buckets: Dict[int, int] = {}
+
+
+class LatencySketch:
+    """
+    Log-bucketed latency histogram with a bounded relative error.
+
+    A recorded value x goes to bucket ceil(log(x, gamma)) where
+    gamma = (1 + relative_accuracy) / (1 - relative_accuracy), so every
+    quantile is estimated within relative_accuracy of the real value.
+
+    The sketch is rolling: samples are kept in a current and a previous window
+    and windows older than that are dropped, so quantiles reflect the last
+    `window` to `2 * window` seconds.
+    """
+
+    min_value: float = 1e-6
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        window: float = 60.0,
+        clock: Callable[[], float] = mod_time.monotonic,
+    ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in range (0, 1)")
+        if window <= 0:
+            raise ValueError("window must be greater than 0")
+
+        self.relative_accuracy = relative_accuracy
+        self.window = window
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._clock = clock
+        self._started = clock()
+        self._current: Dict[int, int] = {}
+        self._previous: Dict[int, int] = {}
+        self._current_count = 0
+        self._previous_count = 0
+
+    def _rotate(self) -> None:
+        now = self._clock()
+        elapsed = now - self._started
+        if elapsed < self.window:
+            return
+
+        if elapsed < 2 * self.window:
+            self._previous, self._previous_count = self._current, self._current_count
+        else:
+            self._previous, self._previous_count = {}, 0
+        self._current, self._current_count = {}, 0
+        self._started = now
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(max(value, self.min_value)) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    @property
+    def count(self) -> int:
+        self._rotate()
+        return self._current_count + self._previous_count
+
+    def record(self, seconds: float) -> None:
+        self._rotate()
+        index = self._index(seconds)
+        self._current[index] = self._current.get(index, 0) + 1
+        self._current_count += 1
+
+    def _merged(self) -> Dict[int, int]:
+        buckets = dict(self._previous)
+        for index, count in self._current.items():
+            buckets[index] = buckets.get(index, 0) + count
+        return buckets
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Return the estimated latency (in seconds) at quantile q, q in [0, 1].
+        None when no sample was recorded in the rolling window.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("quantile must be in range [0, 1]")
+
+        total = self.count
+        if not total:
+            return None
+
+        rank = q * (total - 1)
+        seen = 0
+        buckets = self._merged()
+        indexes: List[int] = sorted(buckets)
+        for index in indexes:
+            seen += buckets[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(indexes[-1])
+
+    def snapshot(
+        self, quantiles: Sequence[float] = (0.5, 0.9, 0.99)
+    ) -> LatencySnapshot:
+        values: Dict[float, float] = {}
+        for q in quantiles:
+            value = self.quantile(q)
+            if value is not None:
+                values[q] = value
+
+        return LatencySnapshot(
+            relative_accuracy=self.relative_accuracy,
+            window=self.window,
+            count=self.count,
+            quantiles=values,
+            buckets=self._merged(),
+        )
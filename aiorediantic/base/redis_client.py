@@ -1,26 +1,116 @@
-from typing import Any, Optional
-from pydantic import BaseModel
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+from contextlib import asynccontextmanager
+from pydantic import BaseModel, PrivateAttr
+import asyncio
+import os
+import threading
+import time as mod_time
 import aioredis
+from aioredis.exceptions import ConnectionError, TimeoutError
 
 
 from aiorediantic import RedisConfig, RedisScheme
+from aiorediantic.enum import PriorityEnum
+from aiorediantic.exception import ClientClosedException
+from .admission import AdmissionController
+from .latency import LatencySketch
+from .health import HealthChecker
+from .single_flight import SingleFlight
 
 
 def original_response(r: Any) -> Any:
     return r
 
 
+class _LoopState:
+    """Connection pool and loop bound objects of one event loop in one process"""
+
+    def __init__(self) -> None:
+        self.client: Optional[aioredis.Redis] = None
+        self.admission: Optional[AdmissionController] = None
+        self.health: Optional[HealthChecker] = None
+        self.single_flight = SingleFlight()
+        self.inflight = 0
+        self.closing = False
+        self.drained: "Optional[asyncio.Future[None]]" = None
+
+
 class RedisClient(BaseModel):
-    _client: Optional[aioredis.Redis] = None
+    """
+    Lazily creates one aioredis client (and its connection pool) per event loop
+    and per process, so the same RedisClient and models can be used from
+    pre-forked workers and from threads running their own event loop.
+
+    The state of a loop references the loop (connections, futures, tasks), it
+    is never garbage collected with it: it is removed by aclose() from the
+    loop, or by the first use of the client from a new loop once the loop is
+    closed (e.g. by asyncio.run()).
+    """
+
+    _pid: int = PrivateAttr(default_factory=os.getpid)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _states: Dict[asyncio.AbstractEventLoop, _LoopState] = PrivateAttr(
+        default_factory=dict
+    )
+    _detached: _LoopState = PrivateAttr(default_factory=_LoopState)
+    _latency: Dict[str, LatencySketch] = {}
+    _close_callbacks: List[Callable[[], Awaitable[None]]] = []
     config: RedisConfig
 
     class Config:
         arbitrary_types_allowed = True
         underscore_attrs_are_private = True
+        # models must share the client state (pool, admission controller)
+        copy_on_model_validation = "none"
+
+    def _state(self) -> _LoopState:
+        pid = os.getpid()
+        if pid != self._pid:
+            with self._lock:
+                if pid != self._pid:
+                    # forked: sockets, futures and tasks belong to the parent process
+                    self._states = {}
+                    self._detached = _LoopState()
+                    self._latency = {}
+                    self._pid = pid
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._detached
+
+        state = self._states.get(loop)
+        if state is None:
+            with self._lock:
+                state = self._states.get(loop)
+                if state is None:
+                    self._drop_closed_loops()
+                    state = self._states[loop] = _LoopState()
+        return state
+
+    def _drop_closed_loops(self) -> None:
+        """
+        Remove the states of the closed loops, called with _lock held. Their
+        loop can not run disconnect() anymore, the connections are closed
+        when the pool is garbage collected.
+        """
+        for loop in [loop for loop in self._states if loop.is_closed()]:
+            del self._states[loop]
 
     @property
     def client(self) -> aioredis.Redis:
-        if not self._client:
+        """aioredis client of the running event loop in the current process"""
+        state = self._state()
+        if not state.client:
             kwargs: dict[str, Any] = {
                 "host": self.config.host,
                 "port": self.config.port,
@@ -51,11 +141,251 @@ class RedisClient(BaseModel):
                         "ssl_check_hostname": self.config.ssl_check_hostname,
                     }
                 )
-            self._client = aioredis.from_url(  # pyright: ignore
-                self.config.scheme, **kwargs
+            client = aioredis.from_url(self.config.scheme, **kwargs)  # pyright: ignore
+            client.response_callbacks["EXPIRE"] = int  # type: ignore
+            client.response_callbacks["EXPIREAT"] = int  # type: ignore
+            client.response_callbacks["SET"] = original_response  # type: ignore
+            client.response_callbacks["PERSIST"] = int  # type: ignore
+            state.client = client
+        return state.client
+
+    @property
+    def admission(self) -> Optional[AdmissionController]:
+        state = self._state()
+        if state.admission is None and self.config.admission_max_inflight:
+            state.admission = AdmissionController(
+                max_inflight=self.config.admission_max_inflight,
+                max_queue=self.config.admission_max_queue,
+                queue_timeout=self.config.admission_queue_timeout,
+                low_priority_ratio=self.config.admission_low_priority_ratio,
+            )
+        return state.admission
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        """Coalescing group used by the models created with coalesce=True"""
+        return self._state().single_flight
+
+    @property
+    def health(self) -> Optional[HealthChecker]:
+        state = self._state()
+        if state.health is None and self.config.background_health_check_interval:
+            state.health = HealthChecker(
+                client=self.client,
+                interval=self.config.background_health_check_interval,
+                timeout=self.config.background_health_check_timeout,
+                latency_threshold=self.config.background_health_check_latency_threshold,
+            )
+        return state.health
+
+    @property
+    def healthy(self) -> bool:
+        """Readiness signal, always True when the background health check is disabled"""
+        health = self.health
+        return health is None or health.healthy
+
+    def start_health_check(self) -> None:
+        """Start the background health check, it is also started by the first command"""
+        health = self.health
+        if health is not None:
+            health.start()
+
+    @property
+    def latency(self) -> Dict[str, LatencySketch]:
+        """Rolling latency sketch of every command executed so far, by command name"""
+        return self._latency
+
+    def latency_sketch(self, command: str) -> LatencySketch:
+        sketch = self._latency.get(command)
+        if sketch is None:
+            sketch = self._latency[command] = LatencySketch(
+                relative_accuracy=self.config.latency_relative_accuracy,
+                window=self.config.latency_window,
             )
-            self._client.response_callbacks["EXPIRE"] = int  # type: ignore
-            self._client.response_callbacks["EXPIREAT"] = int  # type: ignore
-            self._client.response_callbacks["SET"] = original_response  # type: ignore
-            self._client.response_callbacks["PERSIST"] = int  # type: ignore
-        return self._client
+        return sketch
+
+    def timeout_for(self, command: str) -> Optional[float]:
+        """
+        Return the adaptive timeout of command:
+        quantile latency * multiplier, clamped to [adaptive_timeout_min, adaptive_timeout_max].
+        None when adaptive timeout is disabled or there are not enough samples yet.
+        """
+        if not self.config.adaptive_timeout:
+            return None
+
+        sketch = self._latency.get(command)
+        if sketch is None or sketch.count < self.config.adaptive_timeout_min_samples:
+            return None
+
+        latency = sketch.quantile(self.config.adaptive_timeout_quantile)
+        if latency is None:
+            return None
+        return min(
+            max(
+                latency * self.config.adaptive_timeout_multiplier,
+                self.config.adaptive_timeout_min,
+            ),
+            self.config.adaptive_timeout_max,
+        )
+
+    async def _execute(
+        self, *args: Any, timeout: Optional[float], **options: Any
+    ) -> Any:
+        client = self.client
+        if timeout is None:
+            return await client.execute_command(*args, **options)  # type: ignore
+
+        pool = client.connection_pool
+        command_name = args[0]
+        conn = await pool.get_connection(command_name, **options)
+        try:
+            await conn.send_command(*args)
+            return await asyncio.wait_for(
+                client.parse_response(conn, command_name, **options), timeout
+            )
+        except (ConnectionError, TimeoutError):
+            await conn.disconnect()
+            raise
+        except asyncio.TimeoutError:
+            # the reply is still pending on this connection, it can not be reused
+            await conn.disconnect()
+            raise TimeoutError(
+                f"{command_name} timed out after adaptive timeout of {timeout:.4f} seconds"
+            ) from None
+        finally:
+            await pool.release(conn)
+
+    async def _timed_execute(self, *args: Any, **options: Any) -> Any:
+        command = str(args[0]).upper()
+        timeout = self.timeout_for(command)
+        started = mod_time.perf_counter()
+        try:
+            response = await self._execute(*args, timeout=timeout, **options)
+        except TimeoutError:
+            # timeouts are recorded too, otherwise an adaptive timeout
+            # that became too tight could never grow back
+            self.latency_sketch(command).record(mod_time.perf_counter() - started)
+            raise
+        self.latency_sketch(command).record(mod_time.perf_counter() - started)
+        return response
+
+    @asynccontextmanager
+    async def _operation(self, priority: PriorityEnum) -> AsyncIterator[None]:
+        state = self._state()
+        if state.closing:
+            raise ClientClosedException(
+                "RedisClient is closing, no new command is accepted"
+            )
+
+        if self.config.background_health_check_interval and not (
+            state.health and state.health.running
+        ):
+            self.start_health_check()
+
+        state.inflight += 1
+        try:
+            admission = self.admission
+            if admission is None:
+                yield
+            else:
+                async with admission.admit(priority):
+                    yield
+        finally:
+            state.inflight -= 1
+            drained = state.drained
+            if not state.inflight and drained is not None and not drained.done():
+                drained.set_result(None)
+
+    async def execute_command(
+        self, *args: Any, priority: PriorityEnum = PriorityEnum.NORMAL, **options: Any
+    ) -> Any:
+        async with self._operation(priority):
+            return await self._timed_execute(*args, **options)
+
+    async def execute_pipeline(
+        self,
+        commands: Sequence[Sequence[Any]],
+        priority: PriorityEnum = PriorityEnum.NORMAL,
+        transaction: bool = False,
+    ) -> List[Any]:
+        """
+        Send commands in a single round trip and return their parsed responses.
+        The pipeline is admitted, tracked and drained like a single command.
+        """
+        async with self._operation(priority):
+            started = mod_time.perf_counter()
+            pipe = self.client.pipeline(transaction=transaction)
+            for command in commands:
+                pipe.execute_command(*command)  # type: ignore
+            response: List[Any] = await pipe.execute()  # type: ignore
+            self.latency_sketch("PIPELINE").record(mod_time.perf_counter() - started)
+            return response
+
+    def add_close_callback(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Register a coroutine function awaited by aclose() before the pools are
+        closed, e.g. to flush buffered writes or stop a subscriber.
+        """
+        self._close_callbacks.append(callback)
+
+    def remove_close_callback(self, callback: Callable[[], Awaitable[None]]) -> None:
+        if callback in self._close_callbacks:
+            self._close_callbacks.remove(callback)
+
+    async def aclose(self, grace_period: Optional[float] = None) -> None:
+        """
+        Shutdown the client deterministically:
+            1. await the close callbacks, they can still send commands.
+            2. reject new commands and wait for the in-flight ones to finish.
+            3. stop the background health check.
+            4. disconnect every connection of the pool.
+        Steps 1 and 2 share grace_period (config.shutdown_grace_period by default),
+        the pool is closed when it runs out even if commands are still in flight.
+
+        Only the pool of the running event loop is closed, a client used from
+        several loops must be closed from each of them.
+        The client can be used again after aclose(), it reconnects lazily.
+        """
+        if grace_period is None:
+            grace_period = self.config.shutdown_grace_period
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + grace_period
+        error: Optional[BaseException] = None
+
+        for callback in list(self._close_callbacks):
+            try:
+                await asyncio.wait_for(callback(), max(deadline - loop.time(), 0))
+            except Exception as ex:
+                error = error or ex
+
+        state = self._state()
+        state.closing = True
+        try:
+            if state.inflight:
+                state.drained = loop.create_future()
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(state.drained), max(deadline - loop.time(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+            if state.health is not None:
+                await state.health.stop()
+
+            if state.client is not None:
+                await state.client.close()
+                await state.client.connection_pool.disconnect()
+        finally:
+            with self._lock:
+                if self._states.get(loop) is state:
+                    del self._states[loop]
+
+        if error is not None:
+            raise error
+
+    async def __aenter__(self) -> "RedisClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
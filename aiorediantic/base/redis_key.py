@@ -25,13 +25,16 @@ class RedisKey(RedisModel):
         Removes the current object key.
         Return 1 if key is exists or 0 if key is not exists.
         """
-        return await self.client.delete(self.redisKey)  # pyright: ignore
+        try:
+            return await self.execute_command("DEL", self.redisKey)
+        finally:
+            self._invalidate_local()
 
     async def exists(self) -> int:
         """
         Return 1 if key is exists or 0 if key is not exists.
         """
-        return await self.client.exists(self.redisKey)  # pyright: ignore
+        return await self.execute_command("EXISTS", self.redisKey)
 
     async def expire(
         self, seconds: ExpiryT, option: Optional[ExpireEnum] = None
@@ -63,9 +66,10 @@ class RedisKey(RedisModel):
         if option:
             pieces.append(option.value)
 
-        return await self.client.execute_command(  # pyright: ignore
-            "EXPIRE", self.redisKey, *pieces
-        )
+        try:
+            return await self.execute_command("EXPIRE", self.redisKey, *pieces)
+        finally:
+            self._invalidate_local()
 
     async def expireat(
         self, epoch_in_seconds: AbsExpiryT, option: Optional[ExpireEnum] = None
@@ -97,9 +101,10 @@ class RedisKey(RedisModel):
         if option:
             pieces.append(option.value)
 
-        return await self.client.execute_command(  # pyright: ignore
-            "EXPIREAT", self.redisKey, *pieces
-        )
+        try:
+            return await self.execute_command("EXPIREAT", self.redisKey, *pieces)
+        finally:
+            self._invalidate_local()
 
     async def pexpire(
         self, milliseconds: ExpiryT, option: Optional[ExpireEnum] = None
@@ -136,9 +141,10 @@ class RedisKey(RedisModel):
         if option:
             pieces.append(option.value)
 
-        return await self.client.execute_command(  # pyright: ignore
-            "PEXPIRE", self.redisKey, *pieces
-        )
+        try:
+            return await self.execute_command("PEXPIRE", self.redisKey, *pieces)
+        finally:
+            self._invalidate_local()
 
     async def pexpireat(
         self, epoch_in_milliseconds: AbsExpiryT, option: Optional[ExpireEnum] = None
@@ -175,9 +181,10 @@ class RedisKey(RedisModel):
         if option:
             pieces.append(option.value)
 
-        return await self.client.execute_command(  # pyright: ignore
-            "PEXPIREAT", self.redisKey, *pieces
-        )
+        try:
+            return await self.execute_command("PEXPIREAT", self.redisKey, *pieces)
+        finally:
+            self._invalidate_local()
 
     async def ttl(self) -> int:
         """
@@ -191,7 +198,7 @@ class RedisKey(RedisModel):
         Starting with Redis version 2.8.0: Added -2 reply.
         """
 
-        return await self.client.ttl(self.redisKey)  # pyright: ignore
+        return await self.execute_command("TTL", self.redisKey)
 
     async def pttl(self) -> int:
         """
@@ -210,7 +217,7 @@ class RedisKey(RedisModel):
                 f"Current version: {self.redisVersion} is not support PTTL operation. Required version: {version_2_6_0}"
             )
 
-        return await self.client.pttl(self.redisKey)  # pyright: ignore
+        return await self.execute_command("PTTL", self.redisKey)
 
     async def unlink(self) -> int:
         """
@@ -226,7 +233,10 @@ class RedisKey(RedisModel):
                 f"Current version: {self.redisVersion} is not support UNLINK operation. Required version: {version_4_0_0}"
             )
 
-        return await self.client.unlink(self.redisKey)  # pyright: ignore
+        try:
+            return await self.execute_command("UNLINK", self.redisKey)
+        finally:
+            self._invalidate_local()
 
     async def persist(self) -> int:
         """
@@ -241,4 +251,4 @@ class RedisKey(RedisModel):
                 f"Current version: {self.redisVersion} is not support PERSIST operation. Required version: {version_2_2_0}"
             )
 
-        return await self.client.persist(self.redisKey)  # pyright: ignore
+        return await self.execute_command("PERSIST", self.redisKey)
@@ -1,19 +1,24 @@
-from typing import Any, Optional, Type
+from typing import Any, Optional, Type, TypeVar
 from pydantic import BaseModel, create_model
 from packaging.version import Version
 import aioredis
 
 
 from aiorediantic.config import RedisConfig
+from aiorediantic.enum import PriorityEnum
 from .redis_client import RedisClient
 
 
+ModelT = TypeVar("ModelT", bound="RedisModel")
+
+
 class RedisModel(BaseModel):
     _redisKey: Optional[str] = None
     redisClient: RedisClient
     keyFormat: str
     vars: BaseModel = BaseModel()
     redisVersion: Version = Version("1.0.0")
+    priority: PriorityEnum = PriorityEnum.NORMAL
 
     class Config:
         arbitrary_types_allowed = True
@@ -23,6 +28,14 @@ class RedisModel(BaseModel):
     def client(self) -> aioredis.Redis:
         return self.redisClient.client
 
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        return await self.redisClient.execute_command(
+            *args, priority=self.priority, **options
+        )
+
+    def _invalidate_local(self) -> None:
+        """Called after every local write or delete of key, drops local copies of it"""
+
     @property
     def config(self) -> RedisConfig:
         return self.redisClient.config
@@ -33,9 +46,12 @@ class RedisModel(BaseModel):
             self._redisKey = self.keyFormat.format(**self.vars.dict())
         return self._redisKey
 
-    def __call__(self, **kwargs: Any):
+    def __call__(self: ModelT, **kwargs: Any) -> ModelT:
+        """Return a copy of the model bound to the key built from kwargs"""
         dynamicModel: Type[BaseModel] = create_model("vars", **kwargs)  # type: ignore
-        self.vars = dynamicModel()
+        obj = self.copy()
+        obj.vars = dynamicModel()
+        obj._redisKey = None
 
-        self.redisVersion = Version(self.config.redis_version)
-        return self
+        obj.redisVersion = Version(self.config.redis_version)
+        return obj
@@ -0,0 +1,55 @@
+"""Module containing the single-flight request coalescing"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+import asyncio
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class SingleFlightStats(BaseModel):
+    """Counters of a SingleFlight group"""
+
+    inflight: int = 0
+    executed: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls with the same key.
+
+    The first caller of a key runs the call in its own task, every caller that
+    arrives while it is in flight awaits that same task and gets the same result
+    (or exception). Cancelling one caller does not cancel the shared call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: "Dict[Hashable, asyncio.Future[Any]]" = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            inflight=len(self._calls),
+            executed=self._executed,
+            coalesced=self._coalesced,
+        )
+
+    def _done(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # mark the exception as retrieved when every caller has been cancelled
+            task.exception()
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            self._executed += 1
+            task.add_done_callback(lambda done: self._done(key, done))
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
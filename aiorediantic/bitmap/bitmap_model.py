@@ -0,0 +1,207 @@
+from typing import Any, Dict, Iterable, List, Optional
+from packaging.version import Version
+
+
+from aiorediantic import (
+    InvalidArgumentTypeException,
+    InvalidOptionsCombinationException,
+)
+from aiorediantic.types import FieldT
+from aiorediantic.enum import BitUnitEnum
+from aiorediantic.base.redis_key import RedisKey
+from aiorediantic.exception import OldRedisVersionException
+
+
+version_2_2_0: Version = Version("2.2.0")
+version_2_6_0: Version = Version("2.6.0")
+version_2_8_7: Version = Version("2.8.7")
+version_3_2_0: Version = Version("3.2.0")
+version_6_0_0: Version = Version("6.0.0")
+version_7_0_0: Version = Version("7.0.0")
+
+
+def _offset(offset: int) -> int:
+    if type(offset) != int or offset < 0:
+        raise InvalidArgumentTypeException(
+            "BitmapModel allow only non negative INT offsets"
+        )
+    return offset
+
+
+def _bit(value: bool) -> int:
+    if type(value) != bool:
+        raise InvalidArgumentTypeException("BitmapModel allow to set only BOOL value")
+    return 1 if value else 0
+
+
+class BitmapModel(RedisKey):
+    """
+    Boolean flags stored as the bits of a single string key, the flag of
+    offset i is the bit i. One bit per flag instead of one key per flag
+    (BoolModel), and bulk reads and writes take a single BITFIELD command.
+    """
+
+    def _range_args(
+        self, start: Optional[int], end: Optional[int], unit: Optional[BitUnitEnum]
+    ) -> List[FieldT]:
+        if end is not None and start is None:
+            raise InvalidOptionsCombinationException("end requires start option")
+        if unit is not None and end is None:
+            raise InvalidOptionsCombinationException(
+                "BYTE and BIT options require start and end options"
+            )
+        if unit is not None and self.redisVersion < version_7_0_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support BYTE and BIT options. Required version: {version_7_0_0}",
+            )
+
+        pieces: List[FieldT] = []
+        if start is not None:
+            pieces.append(start)
+        if end is not None:
+            pieces.append(end)
+        if unit is not None:
+            pieces.append(unit.value)
+        return pieces
+
+    async def setbit(self, offset: int, value: bool) -> bool:
+        """
+        @Available since: 2.2.0
+        Set or clear the flag at offset, the bitmap grows as needed.
+
+        Return
+            previous value of the flag.
+        """
+        if self.redisVersion < version_2_2_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support SETBIT operation. Required version: {version_2_2_0}",
+            )
+        res: int = await self.execute_command(
+            "SETBIT", self.redisKey, _offset(offset), _bit(value)
+        )
+        return bool(res)
+
+    async def getbit(self, offset: int) -> bool:
+        """
+        @Available since: 2.2.0
+        Get the flag at offset.
+
+        Return
+            value of the flag.
+            False when offset is beyond the bitmap or key does not exist.
+        """
+        if self.redisVersion < version_2_2_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support GETBIT operation. Required version: {version_2_2_0}",
+            )
+        res: int = await self.execute_command("GETBIT", self.redisKey, _offset(offset))
+        return bool(res)
+
+    async def getbits(self, offsets: Iterable[int]) -> List[bool]:
+        """
+        @Available since: 3.2.0
+        Get the flags at offsets with a single BITFIELD (BITFIELD_RO since 6.0.0,
+        which can be served by replicas).
+
+        Return
+            list of the flags, in the order of offsets.
+        """
+        if self.redisVersion < version_3_2_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support BITFIELD operation. Required version: {version_3_2_0}",
+            )
+        pieces: List[FieldT] = []
+        for offset in offsets:
+            pieces.extend(("GET", "u1", _offset(offset)))
+        if not pieces:
+            return []
+
+        command = "BITFIELD_RO" if self.redisVersion >= version_6_0_0 else "BITFIELD"
+        res: List[Any] = await self.execute_command(command, self.redisKey, *pieces)
+        return [bool(value) for value in res]
+
+    async def setbits(self, values: Dict[int, bool]) -> List[bool]:
+        """
+        @Available since: 3.2.0
+        Set many flags, {offset: value}, with a single BITFIELD.
+
+        Return
+            list of the previous values of the flags, in the order of values.
+        """
+        if self.redisVersion < version_3_2_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support BITFIELD operation. Required version: {version_3_2_0}",
+            )
+        pieces: List[FieldT] = []
+        for offset, value in values.items():
+            pieces.extend(("SET", "u1", _offset(offset), _bit(value)))
+        if not pieces:
+            return []
+
+        res: List[Any] = await self.execute_command("BITFIELD", self.redisKey, *pieces)
+        return [bool(value) for value in res]
+
+    async def bitcount(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        unit: Optional[BitUnitEnum] = None,
+    ) -> int:
+        """
+        @Available since: 2.6.0
+        Count the flags set, in the whole bitmap or between start and end
+        (inclusive, negative indexes count from the end).
+
+        Return
+            number of flags set.
+            0 when key does not exist.
+
+        Options:
+            BYTE -- start and end are byte indexes (default).
+            BIT -- start and end are bit indexes.
+
+        History
+            Starting with Redis version 7.0.0: Added the BYTE|BIT option.
+        """
+        if self.redisVersion < version_2_6_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support BITCOUNT operation. Required version: {version_2_6_0}",
+            )
+        if start is not None and end is None:
+            raise InvalidOptionsCombinationException(
+                "start and end options must be used together"
+            )
+        pieces: List[FieldT] = self._range_args(start, end, unit)
+        return await self.execute_command("BITCOUNT", self.redisKey, *pieces)
+
+    async def bitpos(
+        self,
+        bit: bool,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        unit: Optional[BitUnitEnum] = None,
+    ) -> int:
+        """
+        @Available since: 2.8.7
+        Find the offset of the first flag equal to bit, in the whole bitmap or
+        between start and end (inclusive, negative indexes count from the end).
+
+        Return
+            offset of the first flag equal to bit.
+            -1 when bit is True and no flag is set.
+            The first offset after the bitmap when bit is False and every flag is
+            set, unless end is given.
+
+        Options:
+            BYTE -- start and end are byte indexes (default).
+            BIT -- start and end are bit indexes.
+
+        History
+            Starting with Redis version 7.0.0: Added the BYTE|BIT option.
+        """
+        if self.redisVersion < version_2_8_7:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support BITPOS operation. Required version: {version_2_8_7}",
+            )
+        pieces: List[FieldT] = self._range_args(start, end, unit)
+        return await self.execute_command("BITPOS", self.redisKey, _bit(bit), *pieces)
@@ -0,0 +1,235 @@
+from typing import Any, Dict, Iterable, List, Optional
+from array import array
+from packaging.version import Version
+import re
+import sys
+
+
+from pydantic import validator
+
+
+from aiorediantic import InvalidArgumentTypeException
+from aiorediantic.types import FieldT
+from aiorediantic.enum import OverflowEnum
+from aiorediantic.base.redis_key import RedisKey
+from aiorediantic.exception import OldRedisVersionException
+
+
+version_3_2_0: Version = Version("3.2.0")
+version_6_0_0: Version = Version("6.0.0")
+
+_ENCODING = re.compile(r"^([iu])(\d+)$")
+
+
+def _index(index: int) -> int:
+    if type(index) != int or index < 0:
+        raise InvalidArgumentTypeException(
+            "IntArrayModel allow only non negative INT indexes"
+        )
+    return index
+
+
+def _value(value: int) -> int:
+    if type(value) != int:
+        raise InvalidArgumentTypeException("IntArrayModel allow to set only INT value")
+    return value
+
+
+class IntArrayModel(RedisKey):
+    """
+    Fixed width integer array packed in a single string key with BITFIELD,
+    element i is the integer of `encoding` (i8, u16, i32, u5...) at bit offset
+    i * width. Thousands of small counters per entity take one key and a single
+    command to read or update.
+
+    overflow (WRAP, SAT or FAIL) applies to the set and incrby operations,
+    with FAIL the operations which would overflow are not performed and return None.
+    """
+
+    encoding: str = "u8"
+    overflow: OverflowEnum = OverflowEnum.WRAP
+
+    @validator("encoding")
+    def encoding_must_be_validate(cls, encoding: str) -> str:
+        match = _ENCODING.match(encoding)
+        if match is None:
+            raise ValueError("encoding must be i<bits> or u<bits>")
+        signed, width = match.group(1) == "i", int(match.group(2))
+        if not (1 <= width <= (64 if signed else 63)):
+            raise ValueError(
+                "encoding supports up to 64 bits signed and 63 bits unsigned"
+            )
+        return encoding
+
+    @property
+    def signed(self) -> bool:
+        return self.encoding[0] == "i"
+
+    @property
+    def width(self) -> int:
+        return int(self.encoding[1:])
+
+    def _check_version(self) -> None:
+        if self.redisVersion < version_3_2_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support BITFIELD operation. Required version: {version_3_2_0}",
+            )
+
+    async def _bitfield(
+        self, pieces: List[FieldT], readonly: bool = False
+    ) -> List[Any]:
+        self._check_version()
+        if readonly:
+            command = (
+                "BITFIELD_RO" if self.redisVersion >= version_6_0_0 else "BITFIELD"
+            )
+            return await self.execute_command(command, self.redisKey, *pieces)
+        return await self.execute_command(
+            "BITFIELD", self.redisKey, "OVERFLOW", self.overflow.value, *pieces
+        )
+
+    def _typecode(self) -> str:
+        """Smallest array typecode holding an element"""
+        for typecode in ("bhilq" if self.signed else "BHILQ"):
+            if array(typecode).itemsize * 8 >= self.width:
+                return typecode
+        raise ValueError(f"No array typecode holds {self.encoding}")
+
+    async def get(self, index: int) -> int:
+        """
+        @Available since: 3.2.0
+        Get the element at index.
+
+        Return
+            int value of the element.
+            0 when index is beyond the array or key does not exist.
+        """
+        res: List[Any] = await self._bitfield(
+            ["GET", self.encoding, f"#{_index(index)}"], readonly=True
+        )
+        return res[0]
+
+    async def get_many(self, indexes: Iterable[int]) -> List[int]:
+        """
+        @Available since: 3.2.0
+        Get the elements at indexes with a single BITFIELD.
+
+        Return
+            list of the int values, in the order of indexes.
+        """
+        pieces: List[FieldT] = []
+        for index in indexes:
+            pieces.extend(("GET", self.encoding, f"#{_index(index)}"))
+        if not pieces:
+            return []
+        return await self._bitfield(pieces, readonly=True)
+
+    async def set(self, index: int, value: int) -> Optional[int]:
+        """
+        @Available since: 3.2.0
+        Set the element at index, the array grows as needed.
+
+        Return
+            previous value of the element.
+            None when overflow is FAIL and value does not fit the encoding.
+        """
+        res: List[Any] = await self.set_many({index: value})
+        return res[0]
+
+    async def set_many(self, values: Dict[int, int]) -> List[Optional[int]]:
+        """
+        @Available since: 3.2.0
+        Set many elements, {index: value}, with a single BITFIELD.
+
+        Return
+            list of the previous values, in the order of values.
+            None for the values not set because of the FAIL overflow.
+        """
+        pieces: List[FieldT] = []
+        for index, value in values.items():
+            pieces.extend(("SET", self.encoding, f"#{_index(index)}", _value(value)))
+        if not pieces:
+            return []
+        return await self._bitfield(pieces)
+
+    async def incrby(self, index: int, amount: int) -> Optional[int]:
+        """
+        @Available since: 3.2.0
+        Increment the element at index by amount (negative to decrement).
+
+        Return
+            new value of the element.
+            None when overflow is FAIL and the result does not fit the encoding.
+        """
+        res: List[Any] = await self.incrby_many({index: amount})
+        return res[0]
+
+    async def incrby_many(self, amounts: Dict[int, int]) -> List[Optional[int]]:
+        """
+        @Available since: 3.2.0
+        Increment many elements, {index: amount}, with a single BITFIELD.
+
+        Return
+            list of the new values, in the order of amounts.
+            None for the increments not performed because of the FAIL overflow.
+        """
+        pieces: List[FieldT] = []
+        for index, amount in amounts.items():
+            pieces.extend(
+                ("INCRBY", self.encoding, f"#{_index(index)}", _value(amount))
+            )
+        if not pieces:
+            return []
+        return await self._bitfield(pieces)
+
+    async def _read(self, start: int, count: Optional[int]) -> "array[int]":
+        result: "array[int]" = array(self._typecode())
+        if count is not None and count <= 0:
+            return result
+
+        width = self.width
+        if result.itemsize * 8 != width or self.config.decode_responses:
+            # no typecode of exactly the width (e.g. u4, i24, u48), decoded by Redis
+            if count is None:
+                length: int = await self.execute_command("STRLEN", self.redisKey)
+                count = length * 8 // width - start
+            result.extend(await self.get_many(range(start, start + count)))
+            return result
+
+        # the typecode has exactly the width of an element
+        size = result.itemsize
+        end = -1 if count is None else (start + count) * size - 1
+        data: bytes = await self.execute_command(
+            "GETRANGE", self.redisKey, start * size, end
+        )
+        # a partial or missing element reads as zeros, like BITFIELD beyond the string
+        data += b"\0" * (-len(data) % size)
+        if count is not None:
+            data += b"\0" * (count * size - len(data))
+        result.frombytes(data)
+        if sys.byteorder == "little":
+            result.byteswap()
+        return result
+
+    async def values(self, start: int = 0, count: Optional[int] = None) -> "array[int]":
+        """
+        Read count elements from index start, or every element from start to
+        the end of the string when count is None.
+        Encodings of 8, 16, 32 and 64 bits, the widths of an array typecode,
+        are read with a single GETRANGE and decoded locally, the others
+        (i24, u48...) with a single BITFIELD.
+
+        Return
+            array.array of the smallest typecode holding the encoding.
+        """
+        return await self._read(_index(start), count)
+
+    async def values_numpy(self, start: int = 0, count: Optional[int] = None) -> Any:
+        """
+        values() as a numpy.ndarray of the smallest dtype holding the encoding,
+        numpy has to be installed.
+        """
+        import numpy
+
+        values = await self._read(_index(start), count)
+        return numpy.frombuffer(values, dtype=values.typecode).copy()
@@ -0,0 +1,115 @@
+"""Module containing the cache-aside decorator"""
+from typing import Any, Awaitable, Callable, List, TypeVar
+import asyncio
+import functools
+import inspect
+import string
+
+
+from aiorediantic.types import ExpiryT
+from aiorediantic.string.abstract_string import AbstractStringModel
+from aiorediantic.cache.lock import KeyLock
+
+T = TypeVar("T")
+
+
+def key_builder(
+    model: AbstractStringModel, func: Callable[..., Any]
+) -> Callable[..., AbstractStringModel]:
+    """Return a function building the model object of the arguments of func"""
+    signature = inspect.signature(func)
+    fields: List[str] = []
+    for _, field, _, _ in string.Formatter().parse(model.keyFormat):
+        if field:
+            name = field.split(".", 1)[0].split("[", 1)[0]
+            if name not in fields:
+                fields.append(name)
+
+    missing = [name for name in fields if name not in signature.parameters]
+    if missing:
+        raise ValueError(
+            f"keyFormat fields {missing} are not arguments of {func.__qualname__}"
+        )
+
+    def key(*args: Any, **kwargs: Any) -> AbstractStringModel:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return model(**{name: bound.arguments[name] for name in fields})
+
+    return key
+
+
+def cached(
+    model: AbstractStringModel,
+    ex: ExpiryT,
+    lock_px: ExpiryT = 10000,
+    wait_timeout: float = 10.0,
+    poll_interval: float = 0.05,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Cache the result of an async function in the key built by model from the
+    function arguments, the fields of model.keyFormat are taken by name:
+
+        @cached(StringModel(redisClient=client, keyFormat="user:{user_id}"), ex=60)
+        async def user_name(user_id: int) -> str:
+            ...
+
+    A hit is returned without calling the function. On a miss only the caller
+    holding the "<key>:lock" key (SET NX PX lock_px) calls it and sets the key
+    with ex, the others poll the key every poll_interval seconds until it is
+    set or the lock is released. After wait_timeout seconds a waiter calls the
+    function itself without caching its result. Concurrent misses in the same
+    event loop share a single load.
+
+    The decorated function gets an invalidate(*args, **kwargs) coroutine
+    deleting the key of these arguments.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        key = key_builder(model, func)
+
+        async def load(obj: AbstractStringModel, call: Callable[[], Awaitable[T]]) -> T:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + wait_timeout
+            lock = KeyLock(obj, px=lock_px)
+
+            # the first read may be served by the local caches, the polls may not
+            read = obj._get
+            while True:
+                # a hit is any reply but None, an empty value included
+                value = await read()
+                if value is not None:
+                    return obj._parse_res(value, get=True)
+                read = obj._fetch
+
+                if await lock.acquire():
+                    try:
+                        # the previous holder may have set it since the last read
+                        value = await obj._fetch()
+                        if value is not None:
+                            return obj._parse_res(value, get=True)
+                        result = await call()
+                        await obj.set(result, ex=ex)  # type: ignore
+                        return result
+                    finally:
+                        await lock.release()
+
+                if loop.time() >= deadline:
+                    return await call()
+                await asyncio.sleep(poll_interval)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            obj = key(*args, **kwargs)
+            call: Callable[[], Awaitable[T]] = functools.partial(func, *args, **kwargs)
+            return await obj.redisClient.single_flight.do(
+                (wrapper, obj.redisKey), lambda: load(obj, call)
+            )
+
+        async def invalidate(*args: Any, **kwargs: Any) -> None:
+            await key(*args, **kwargs).delete()
+
+        wrapper.invalidate = invalidate  # type: ignore
+        return wrapper
+
+    return decorator
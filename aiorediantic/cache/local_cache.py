@@ -0,0 +1,153 @@
+"""Module containing the in-process LRU/TTL cache used in front of model reads"""
+from typing import Any, Hashable, Optional, Tuple
+from collections import OrderedDict
+import threading
+import time as mod_time
+
+from pydantic import BaseModel
+
+
+class LocalCacheStats(BaseModel):
+    """Counters of a LocalCache"""
+
+    entries: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry expiry.
+
+    The cache is bounded by max_entries and, optionally, by max_bytes (the
+    size of an entry is the length of its key and of its value). ttl, when set,
+    caps the lifetime of every entry. The cache is thread-safe, so it can be
+    shared by models used from several event loops.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than 0")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float], int]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def stats(self) -> LocalCacheStats:
+        with self._lock:
+            return LocalCacheStats(
+                entries=len(self._entries),
+                bytes=self._bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+            )
+
+    @property
+    def generation(self) -> int:
+        """
+        Incremented by every invalidation. A reader that fetched a value while
+        the generation changed must not store it, it may be older than the write.
+        """
+        return self._generation
+
+    def _size(self, key: Hashable, value: Any) -> int:
+        size = len(key) if isinstance(key, (str, bytes)) else 0
+        if isinstance(value, (str, bytes, bytearray, memoryview)):
+            size += len(value)
+        return size
+
+    def _pop(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (True, value) on a hit and (False, None) on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= mod_time.monotonic():
+                self._pop(key)
+                self._expirations += 1
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> bool:
+        """
+        Store value for at most ttl seconds (and at most the cache ttl).
+        Nothing is stored when generation is given and an invalidation happened since.
+        """
+        if self.ttl is not None:
+            ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl is not None and ttl <= 0:
+            return False
+
+        size = self._size(key, value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        expires_at = None if ttl is None else mod_time.monotonic() + ttl
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+                self._evictions += 1
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            if key in self._entries:
+                self._pop(key)
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
@@ -0,0 +1,47 @@
+"""Module containing the short lived lock used by the caching decorators"""
+from typing import Optional
+import uuid
+
+
+from aiorediantic.types import ExpiryT
+from aiorediantic.base.redis_model import RedisModel
+from aiorediantic.string.string_model import StringModel
+
+# delete the lock only when it is still held by the caller
+_RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class KeyLock:
+    """
+    Lock of the key of obj, held in "<key>:<suffix>" with SET NX PX px.
+    It expires by itself after px, release() deletes it only when it is still
+    held by this KeyLock, never a lock taken over by another worker since.
+    """
+
+    def __init__(self, obj: RedisModel, px: ExpiryT, suffix: str = "lock") -> None:
+        self.lock: StringModel = StringModel(
+            redisClient=obj.redisClient,
+            keyFormat="{key}:" + suffix,
+            priority=obj.priority,
+        )(key=obj.redisKey)
+        self.px = px
+        self._token: Optional[str] = None
+
+    async def acquire(self) -> bool:
+        token = uuid.uuid4().hex
+        if await self.lock.set(token, nx=True, px=self.px):
+            self._token = token
+            return True
+        return False
+
+    async def release(self) -> None:
+        token, self._token = self._token, None
+        if token is not None:
+            await self.lock.execute_command(
+                "EVAL", _RELEASE_SCRIPT, 1, self.lock.redisKey, token
+            )
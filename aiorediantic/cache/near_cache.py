@@ -0,0 +1,172 @@
+"""Module containing the keyspace notification driven near cache invalidation"""
+from typing import Any, Dict, List, Optional, Sequence, Set
+import asyncio
+import string
+
+from pydantic import BaseModel
+import aioredis
+
+from aiorediantic.base.redis_client import RedisClient
+from aiorediantic.base.redis_model import RedisModel
+from aiorediantic.cache.local_cache import LocalCache
+from aiorediantic.utils import str_if_byte
+
+_GLOB_SPECIAL = "\\*?[]"
+
+
+def key_pattern(keyFormat: str) -> str:
+    """Return the glob pattern matching every key built from keyFormat"""
+    pattern: List[str] = []
+    for literal, field, _, _ in string.Formatter().parse(keyFormat):
+        pattern.extend("\\" + c if c in _GLOB_SPECIAL else c for c in literal)
+        if field is not None:
+            pattern.append("*")
+    return "".join(pattern)
+
+
+class NearCacheStats(BaseModel):
+    """Counters of a NearCacheInvalidator"""
+
+    subscribed: bool = False
+    messages: int = 0
+    invalidations: int = 0
+    batches: int = 0
+    resubscribes: int = 0
+
+
+class NearCacheInvalidator:
+    """
+    Keep the local caches of models coherent without CLIENT TRACKING.
+
+    Subscribes (PSUBSCRIBE on a connection of its own) to the keyspace
+    notifications of every model keyFormat and drops the local copies of the
+    keys changed or expired by any client. Keys are collected and invalidated in
+    batches of at most batch_size, or after batch_interval seconds, yielding to
+    the event loop between chunks so a burst of events does not block it.
+
+    When the subscription is lost, it resubscribes after reconnect_delay
+    seconds and clears the caches, notifications may have been missed meanwhile.
+
+    Redis only publishes keyspace events when notify-keyspace-events enables
+    them ("K" and the event classes), configure_server=True adds "KA" to the
+    current server setting at subscription time.
+    """
+
+    def __init__(
+        self,
+        redisClient: RedisClient,
+        models: Sequence[RedisModel],
+        batch_size: int = 512,
+        batch_interval: float = 0.01,
+        chunk_size: int = 128,
+        reconnect_delay: float = 1.0,
+        configure_server: bool = False,
+    ) -> None:
+        self.redisClient = redisClient
+        self.caches: List[LocalCache] = []
+        for model in models:
+            for cache in (
+                getattr(model, "localCache", None),
+                getattr(model, "negativeCache", None),
+            ):
+                if cache is not None and all(cache is not c for c in self.caches):
+                    self.caches.append(cache)
+
+        db = redisClient.config.db
+        self.patterns: List[str] = sorted(
+            {f"__keyspace@{db}__:{key_pattern(model.keyFormat)}" for model in models}
+        )
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.chunk_size = chunk_size
+        self.reconnect_delay = reconnect_delay
+        self.configure_server = configure_server
+        self._task: "Optional[asyncio.Task[None]]" = None
+        self._stats = NearCacheStats()
+
+    def stats(self) -> NearCacheStats:
+        return self._stats.copy()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _clear(self) -> None:
+        for cache in self.caches:
+            cache.clear()
+
+    async def _apply(self, keys: Set[str]) -> None:
+        pending = list(keys)
+        for start in range(0, len(pending), self.chunk_size):
+            chunk = pending[start : start + self.chunk_size]
+            for key in chunk:
+                for cache in self.caches:
+                    cache.invalidate(key)
+            self._stats.invalidations += len(chunk)
+            await asyncio.sleep(0)
+        self._stats.batches += 1
+
+    async def _enable_notifications(self) -> None:
+        config: Dict[Any, Any] = await self.redisClient.client.config_get(  # type: ignore
+            "notify-keyspace-events"
+        )
+        current = str(str_if_byte(next(iter(config.values()), "")) or "")
+        flags = "".join(sorted(set(current) | set("KA")))
+        await self.redisClient.client.config_set(  # type: ignore
+            "notify-keyspace-events", flags
+        )
+
+    async def _listen(self, pubsub: aioredis.client.PubSub) -> None:
+        loop = asyncio.get_running_loop()
+        pending: Set[str] = set()
+        deadline = 0.0
+        while True:
+            timeout = max(deadline - loop.time(), 0) if pending else self.batch_interval
+            message: Optional[Dict[str, Any]] = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=timeout
+            )
+            if message is not None and message["type"] == "pmessage":
+                self._stats.messages += 1
+                channel = str(str_if_byte(message["channel"]))
+                if not pending:
+                    deadline = loop.time() + self.batch_interval
+                pending.add(channel.split(":", 1)[1])
+
+            if pending and (len(pending) >= self.batch_size or loop.time() >= deadline):
+                keys, pending = pending, set()
+                await self._apply(keys)
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = self.redisClient.client.pubsub()
+            try:
+                if self.configure_server:
+                    await self._enable_notifications()
+                await pubsub.psubscribe(*self.patterns)
+                self._stats.subscribed = True
+                # changes made while not subscribed were never notified
+                self._clear()
+                await self._listen(pubsub)
+            except (aioredis.RedisError, OSError):
+                self._stats.resubscribes += 1
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                self._stats.subscribed = False
+                await pubsub.reset()
+
+    def start(self) -> None:
+        """Start listening on the running loop, aclose() of the client stops it"""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+            self.redisClient.add_close_callback(self.stop)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        self.redisClient.remove_close_callback(self.stop)
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,25 @@
+"""Module containing the negative cache of missing keys"""
+from typing import Hashable, Optional
+
+from .local_cache import LocalCache
+
+
+class NegativeCache(LocalCache):
+    """
+    Bounded cache of the keys known to be missing, every entry lives for ttl seconds.
+
+    Keep ttl short: a key created by another client stays invisible to the
+    local reads for up to ttl seconds. Local writes clear the entry at once.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl: float = 1.0) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        super().__init__(max_entries=max_entries, ttl=ttl)
+
+    def contains(self, key: Hashable) -> bool:
+        found, _ = self.get(key)
+        return found
+
+    def add(self, key: Hashable, generation: Optional[int] = None) -> bool:
+        return self.set(key, True, generation=generation)
@@ -0,0 +1,180 @@
+"""Module containing the stale-while-revalidate caching decorator"""
+from typing import Any, Awaitable, Callable, Optional, Set, Tuple, TypeVar
+import asyncio
+import datetime
+import functools
+import math
+import random
+import time as mod_time
+
+
+from aiorediantic.types import ExpiryT, StrBytesT
+from aiorediantic.string.abstract_string import AbstractStringModel
+from aiorediantic.cache.cache_aside import key_builder
+from aiorediantic.cache.lock import KeyLock
+
+T = TypeVar("T")
+
+# write the new envelope only when key still holds the one read ("" when missing)
+_REPLACE_SCRIPT = """
+local current = redis.call("GET", KEYS[1])
+if (current or "") ~= ARGV[1] then
+    return 0
+end
+redis.call("SET", KEYS[1], ARGV[2], "PX", ARGV[3])
+return 1
+"""
+
+
+def _seconds(value: ExpiryT) -> float:
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+def pack(value: Any, delta: float, expiry: float) -> str:
+    """Envelope stored in the key: "<delta>:<soft expiry>:<encoded value>" """
+    return f"{delta!r}:{expiry!r}:{value}"
+
+
+def unpack(raw: str) -> Optional[Tuple[float, float, str]]:
+    """Return (delta, soft expiry, encoded value), None when raw is not an envelope"""
+    try:
+        delta, expiry, value = raw.split(":", 2)
+        return float(delta), float(expiry), value
+    except ValueError:
+        return None
+
+
+def should_refresh(
+    delta: float,
+    expiry: float,
+    beta: float = 1.0,
+    now: Optional[float] = None,
+    rand: Callable[[], float] = random.random,
+) -> bool:
+    """
+    XFetch probabilistic early expiration: True when
+        now - delta * beta * log(rand()) >= expiry
+    The longer the value took to compute (delta) and the closer the soft expiry,
+    the more likely, so refreshes of a popular key are spread before its expiry
+    instead of all happening at it. beta > 1 favors earlier refreshes.
+    """
+    if now is None:
+        now = mod_time.time()
+    return now - delta * beta * math.log(1.0 - rand()) >= expiry
+
+
+def stale_while_revalidate(
+    model: AbstractStringModel,
+    ttl: ExpiryT,
+    stale_ttl: ExpiryT,
+    beta: float = 1.0,
+    lock_px: ExpiryT = 10000,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Cache the result of an async function in the key built by model from the
+    function arguments (see cached()), together with the time it took to
+    compute and its soft expiry, ttl seconds after it was computed.
+
+    The key itself expires stale_ttl seconds after the soft expiry. Until then a
+    read always returns the cached value, and when should_refresh() says so (at
+    the latest once the soft expiry passed) it starts a background refresh.
+    Only one worker refreshes a key at a time, it holds "<key>:refresh"
+    (SET NX PX lock_px). A failed refresh keeps serving the stale value.
+    A refresh only replaces the envelope it read, a value written or deleted
+    meanwhile (a newer refresh, invalidate()) is kept.
+
+    Only a read of a missing key waits for the function, concurrent misses in
+    the same event loop share a single call.
+
+    The decorated function gets an invalidate(*args, **kwargs) coroutine
+    deleting the key of these arguments.
+    """
+    soft_ttl = _seconds(ttl)
+    hard_ttl = soft_ttl + _seconds(stale_ttl)
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        key = key_builder(model, func)
+        refreshing: "Set[asyncio.Future[Any]]" = set()
+
+        async def refresh(
+            obj: AbstractStringModel,
+            call: Callable[[], Awaitable[T]],
+            previous: StrBytesT,
+        ) -> T:
+            started = mod_time.perf_counter()
+            result = await call()
+            delta = mod_time.perf_counter() - started
+            raw = pack(obj._encode(result), delta, mod_time.time() + soft_ttl)
+            try:
+                await obj.execute_command(
+                    "EVAL",
+                    _REPLACE_SCRIPT,
+                    1,
+                    obj.redisKey,
+                    previous or "",
+                    raw,
+                    int(hard_ttl * 1000),
+                )
+            finally:
+                obj._invalidate_local()
+            return result
+
+        async def revalidate(
+            obj: AbstractStringModel,
+            call: Callable[[], Awaitable[T]],
+            previous: StrBytesT,
+        ) -> None:
+            lock = KeyLock(obj, px=lock_px, suffix="refresh")
+            if not await lock.acquire():
+                return
+            try:
+                await refresh(obj, call, previous)
+            finally:
+                await lock.release()
+
+        def done(task: "asyncio.Future[Any]") -> None:
+            refreshing.discard(task)
+            if not task.cancelled():
+                # a failed refresh is retried by the next reads
+                task.exception()
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            obj = key(*args, **kwargs)
+            call: Callable[[], Awaitable[T]] = functools.partial(func, *args, **kwargs)
+            single_flight = obj.redisClient.single_flight
+
+            previous = await obj._get()
+            envelope = None
+            if previous is not None:
+                envelope = unpack(
+                    previous.decode(obj.config.encoding)
+                    if isinstance(previous, bytes)
+                    else previous
+                )
+            if envelope is None:
+                return await single_flight.do(
+                    (wrapper, obj.redisKey), lambda: refresh(obj, call, previous)
+                )
+
+            delta, expiry, value = envelope
+            if should_refresh(delta, expiry, beta):
+                task = asyncio.ensure_future(
+                    single_flight.do(
+                        (wrapper, "refresh", obj.redisKey),
+                        lambda: revalidate(obj, call, previous),
+                    )
+                )
+                refreshing.add(task)
+                task.add_done_callback(done)
+            return obj._parse_res(value, get=True)
+
+        async def invalidate(*args: Any, **kwargs: Any) -> None:
+            await key(*args, **kwargs).delete()
+
+        wrapper.invalidate = invalidate  # type: ignore
+        return wrapper
+
+    return decorator
@@ -0,0 +1,155 @@
+"""Module containing the value codecs and their registry"""
+from typing import Any, Callable, Dict, List, Optional
+from abc import ABC, abstractmethod
+import json
+import pickle
+
+
+from pydantic.json import pydantic_encoder
+
+
+from aiorediantic.exception import CodecNotAvailableException
+
+
+class Codec(ABC):
+    """
+    Serializer of the values of a model, dumps() returns the bytes stored in
+    Redis and loads() reads them back. Values are the plain python structures
+    of a pydantic model (dict(), lists, str, numbers...), the types JSON does
+    not know (datetime, UUID, Decimal...) are written the way pydantic does.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Bytes stored in Redis for value"""
+
+    @abstractmethod
+    def loads(self, data: Any) -> Any:
+        """Value of the bytes data written by dumps()"""
+
+
+class JsonCodec(Codec):
+    """stdlib json, always available"""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(
+            value, default=pydantic_encoder, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+
+    def loads(self, data: Any) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """orjson, it has to be installed"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, default=pydantic_encoder)
+
+    def loads(self, data: Any) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """msgpack, it has to be installed. Values are binary, not readable as text"""
+
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, default=pydantic_encoder, use_bin_type=True)
+
+    def loads(self, data: Any) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+class PickleCodec(Codec):
+    """
+    pickle, never picked by default: loads() runs arbitrary code, only use it
+    when every writer of the keys is trusted.
+    """
+
+    name = "pickle"
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: Any) -> Any:
+        return pickle.loads(data)
+
+
+# fastest first, the default codec is the first one whose package is installed
+DEFAULT_CODECS: List[str] = ["orjson", "msgpack", "json"]
+
+_factories: Dict[str, Callable[[], Codec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+    PickleCodec.name: PickleCodec,
+}
+_codecs: Dict[str, Codec] = {}
+
+
+def register_codec(name: str, factory: Callable[[], Codec]) -> None:
+    """
+    Register a codec under name, replacing the previous one. factory may
+    raise ImportError when the codec depends on a package not installed.
+    """
+    _factories[name] = factory
+    _codecs.pop(name, None)
+
+
+def available_codecs() -> List[str]:
+    """Names of the registered codecs usable in this environment"""
+    names: List[str] = []
+    for name in _factories:
+        try:
+            get_codec(name)
+        except CodecNotAvailableException:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """
+    Return the codec registered under name, or the default one (the first
+    of DEFAULT_CODECS available) when name is None.
+    """
+    if name is None:
+        for default in DEFAULT_CODECS:
+            try:
+                return get_codec(default)
+            except CodecNotAvailableException:
+                continue
+        raise CodecNotAvailableException("None of the default codecs is available")
+
+    codec = _codecs.get(name)
+    if codec is not None:
+        return codec
+
+    factory = _factories.get(name)
+    if factory is None:
+        raise CodecNotAvailableException(f"Codec {name} is not registered")
+    try:
+        codec = _codecs[name] = factory()
+    except ImportError:
+        raise CodecNotAvailableException(
+            f"Codec {name} requires a package which is not installed"
+        )
+    return codec
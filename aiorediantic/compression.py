@@ -0,0 +1,446 @@
+"""Module containing the transparent compression of string values"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from abc import ABC, abstractmethod
+import collections
+import lzma
+import random
+import struct
+import zlib
+
+
+from aiorediantic.types import FieldT, StrBytesT
+from aiorediantic.enum import PriorityEnum
+from aiorediantic.base.redis_client import RedisClient
+from aiorediantic.exception import (
+    CodecNotAvailableException,
+    UnexpectedReturnTypeException,
+)
+
+# A stored value starting with a byte from 0xF8 is framed by this header byte.
+# UTF-8 text never contains these bytes, so uncompressed text is stored as it is
+# and the values written before compression was enabled are still read. Binary
+# values are read back unchanged when their first byte is not a known header
+# or when they do not decompress, see Compression.
+RAW_HEADER = 0xF8
+
+
+class Compressor(ABC):
+    """Compression algorithm, header is the byte prefixed to the values it compressed"""
+
+    name: str = ""
+    header: int = 0
+
+    @abstractmethod
+    def compress(self, data: Any) -> bytes:
+        """Compressed bytes of data"""
+
+    @abstractmethod
+    def decompress(self, data: Any) -> bytes:
+        """Bytes of data compressed by compress()"""
+
+    async def prepare(self, data: Any) -> None:
+        """Load what decompress(data) needs, when it is not in memory yet"""
+
+
+class ZlibCompressor(Compressor):
+    name = "zlib"
+    header = 0xF9
+
+    def __init__(self, level: Optional[int] = None) -> None:
+        self.level = 6 if level is None else level
+
+    def compress(self, data: Any) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: Any) -> bytes:
+        return zlib.decompress(data)
+
+
+class LzmaCompressor(Compressor):
+    name = "lzma"
+    header = 0xFA
+
+    def __init__(self, level: Optional[int] = None) -> None:
+        self.level = 6 if level is None else level
+
+    def compress(self, data: Any) -> bytes:
+        return lzma.compress(data, preset=self.level)
+
+    def decompress(self, data: Any) -> bytes:
+        return lzma.decompress(data)
+
+
+class Lz4Compressor(Compressor):
+    """lz4 frame, the lz4 package has to be installed"""
+
+    name = "lz4"
+    header = 0xFB
+
+    def __init__(self, level: Optional[int] = None) -> None:
+        import lz4.frame
+
+        self._frame = lz4.frame
+        self.level = 0 if level is None else level
+
+    def compress(self, data: Any) -> bytes:
+        return self._frame.compress(data, compression_level=self.level)
+
+    def decompress(self, data: Any) -> bytes:
+        return self._frame.decompress(data)
+
+
+class ZstdCompressor(Compressor):
+    """zstd, the zstandard package has to be installed"""
+
+    name = "zstd"
+    header = 0xFC
+
+    def __init__(self, level: Optional[int] = None) -> None:
+        import zstandard
+
+        self.level = 3 if level is None else level
+        self._compressor = zstandard.ZstdCompressor(level=self.level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: Any) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: Any) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+# KEYS[1]: hash of the dictionaries, ARGV[1]: the dictionary to publish
+_PUBLISH_SCRIPT = """
+local version = redis.call("HINCRBY", KEYS[1], "version", 1)
+redis.call("HSET", KEYS[1], "dict:" .. version, ARGV[1])
+redis.call("HSET", KEYS[1], "current", version)
+return version
+"""
+
+_VERSION = struct.Struct(">I")
+
+
+class _ZlibDictionary:
+    """raw deflate (no zlib header and checksum, 6 bytes less per value) primed with data"""
+
+    def __init__(self, data: Optional[bytes], level: Optional[int]) -> None:
+        options: Dict[str, Any] = {} if not data else {"zdict": data}
+        level = 6 if level is None else level
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, -15, **options)
+        self._decompressor = zlib.decompressobj(-15, **options)
+
+    def compress(self, data: Any) -> bytes:
+        compressor = self._compressor.copy()
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data: Any) -> bytes:
+        decompressor = self._decompressor.copy()
+        return decompressor.decompress(data) + decompressor.flush()
+
+
+class _ZstdDictionary:
+    def __init__(self, data: Optional[bytes], level: Optional[int]) -> None:
+        import zstandard
+
+        options: Dict[str, Any] = {}
+        if data:
+            options["dict_data"] = zstandard.ZstdCompressionDict(data)
+        self._compressor = zstandard.ZstdCompressor(
+            level=3 if level is None else level, write_dict_id=False, **options
+        )
+        self._decompressor = zstandard.ZstdDecompressor(**options)
+
+    def compress(self, data: Any) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: Any) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+def train_zlib_dictionary(samples: Sequence[bytes], size: int = 32768) -> bytes:
+    """
+    Preset dictionary for zlib from samples: the samples sharing the most
+    8 bytes substrings with the others, the most shared last (deflate encodes
+    the nearest matches with the fewest bits), up to size bytes.
+    """
+    shingles: "collections.Counter[bytes]" = collections.Counter()
+    unique = list(dict.fromkeys(bytes(sample) for sample in samples if sample))
+    for sample in unique:
+        shingles.update({sample[i : i + 8] for i in range(len(sample) - 7)})
+
+    def score(sample: bytes) -> float:
+        count = len(sample) - 7
+        if count < 1:
+            return 0.0
+        return sum(shingles[sample[i : i + 8]] for i in range(count)) / count
+
+    chosen: List[bytes] = []
+    total = 0
+    for sample in sorted(unique, key=score, reverse=True):
+        if total + len(sample) > size:
+            continue
+        chosen.append(sample)
+        total += len(sample)
+    return b"".join(reversed(chosen))
+
+
+class DictionaryCompressor(Compressor):
+    """
+    Compression of many small similar values (short JSON documents...) with a
+    dictionary trained on samples of them, zlib preset dictionaries or zstd
+    dictionaries (the zstandard package has to be installed).
+
+    The dictionaries are published in the hash key, shared by every process:
+    train() adds a new version and makes it current. Each value stores the
+    version it was compressed with after the header byte, so the values
+    written with a previous dictionary are still read while and after it is
+    rotated. Versions are never removed, a reader loads a version it does not
+    know yet on its first value, refresh() makes the writers of the other
+    processes use the current one. Version 0 is no dictionary at all.
+
+    compress() keeps a reservoir of sample_size of the values it is given,
+    train() uses it when no samples are passed.
+    Use it with a small threshold: Compression(DictionaryCompressor(...), threshold=64).
+    """
+
+    def __init__(
+        self,
+        redisClient: RedisClient,
+        key: str,
+        algorithm: str = "zlib",
+        level: Optional[int] = None,
+        size: int = 32768,
+        sample_size: int = 1000,
+        priority: PriorityEnum = PriorityEnum.NORMAL,
+    ) -> None:
+        if algorithm == "zlib":
+            self.name, self.header = "zlib-dict", 0xFD
+            self._dictionary: Callable[..., Any] = _ZlibDictionary
+        elif algorithm == "zstd":
+            self.name, self.header = "zstd-dict", 0xFE
+            self._dictionary = _ZstdDictionary
+        else:
+            raise CodecNotAvailableException(
+                f"Dictionary compression {algorithm} is not supported"
+            )
+        self.redisClient = redisClient
+        self.key = key
+        self.algorithm = algorithm
+        self.level = level
+        self.size = size
+        self.sample_size = sample_size
+        self.priority = priority
+        self.version = 0
+        try:
+            self._dictionaries: Dict[int, Any] = {0: self._dictionary(None, level)}
+        except ImportError:
+            raise CodecNotAvailableException(
+                f"Dictionary compression {algorithm} requires a package which is not installed"
+            )
+        self._samples: List[bytes] = []
+        self._seen = 0
+
+    def _sample(self, data: Any) -> None:
+        self._seen += 1
+        if len(self._samples) < self.sample_size:
+            self._samples.append(bytes(data))
+            return
+        index = random.randrange(self._seen)
+        if index < self.sample_size:
+            self._samples[index] = bytes(data)
+
+    def compress(self, data: Any) -> bytes:
+        self._sample(data)
+        version = self.version
+        return _VERSION.pack(version) + self._dictionaries[version].compress(data)
+
+    def decompress(self, data: Any) -> bytes:
+        (version,) = _VERSION.unpack_from(data)
+        dictionary = self._dictionaries.get(version)
+        if dictionary is None:
+            raise UnexpectedReturnTypeException(
+                f"Compression dictionary {self.key} version {version} is not loaded"
+            )
+        return dictionary.decompress(data[_VERSION.size :])
+
+    async def prepare(self, data: Any) -> None:
+        (version,) = _VERSION.unpack_from(data)
+        if version not in self._dictionaries:
+            await self.redisClient.single_flight.do(
+                (self.key, version), lambda: self._load(version)
+            )
+
+    async def _load(self, version: int) -> None:
+        data = await self.redisClient.execute_command(
+            "HGET", self.key, f"dict:{version}", priority=self.priority
+        )
+        if data is None:
+            raise UnexpectedReturnTypeException(
+                f"Compression dictionary {self.key} has no version {version}"
+            )
+        self._dictionaries[version] = self._dictionary(data, self.level)
+
+    async def refresh(self) -> int:
+        """Compress with the current dictionary version, return it"""
+        current = await self.redisClient.execute_command(
+            "HGET", self.key, "current", priority=self.priority
+        )
+        version = int(current or 0)
+        if version not in self._dictionaries:
+            await self._load(version)
+        self.version = version
+        return version
+
+    async def train(self, samples: Optional[Sequence[bytes]] = None) -> int:
+        """
+        Train a dictionary on samples (default the reservoir of compress()),
+        publish it as a new version and compress with it, return its version.
+        """
+        samples = self._samples if samples is None else samples
+        if not samples:
+            raise ValueError("samples are required to train a dictionary")
+        if self.algorithm == "zstd":
+            import zstandard
+
+            data = zstandard.train_dictionary(
+                self.size, [bytes(sample) for sample in samples]
+            ).as_bytes()
+        else:
+            data = train_zlib_dictionary(samples, self.size)
+
+        dictionary = self._dictionary(data, self.level)
+        version = int(
+            await self.redisClient.execute_command(
+                "EVAL", _PUBLISH_SCRIPT, 1, self.key, data, priority=self.priority
+            )
+        )
+        self._dictionaries[version] = dictionary
+        self.version = version
+        return version
+
+
+_factories: Dict[str, Callable[..., Compressor]] = {
+    ZlibCompressor.name: ZlibCompressor,
+    LzmaCompressor.name: LzmaCompressor,
+    Lz4Compressor.name: Lz4Compressor,
+    ZstdCompressor.name: ZstdCompressor,
+}
+_headers: Dict[int, Callable[..., Compressor]] = {
+    factory.header: factory for factory in _factories.values()  # type: ignore
+}
+# compressors used to read, whatever the level they were written with
+_readers: Dict[int, Compressor] = {}
+
+
+def get_compressor(name: str, level: Optional[int] = None) -> Compressor:
+    factory = _factories.get(name)
+    if factory is None:
+        raise CodecNotAvailableException(f"Compression {name} is not supported")
+    try:
+        return factory(level)
+    except ImportError:
+        raise CodecNotAvailableException(
+            f"Compression {name} requires a package which is not installed"
+        )
+
+
+def _reader(header: int) -> Optional[Compressor]:
+    reader = _readers.get(header)
+    if reader is None:
+        factory = _headers.get(header)
+        if factory is None:
+            return None
+        try:
+            reader = _readers[header] = factory()
+        except ImportError:
+            raise CodecNotAvailableException(
+                f"Value is compressed with {factory.__name__} which requires a package not installed"  # type: ignore
+            )
+    return reader
+
+
+class Compression:
+    """
+    Compression of the values of a string model, set with its compression field.
+
+    Values of threshold bytes or more are compressed with algorithm (zlib,
+    lzma, lz4 or zstd) and stored behind its header byte, unless it saves
+    less than min_saving of their size. Smaller values are stored as they are.
+    Reads decompress whatever algorithm the value was written with, so the
+    algorithm and the threshold can be changed on a populated keyspace.
+
+    Compressed values are binary, the RedisClient must not use decode_responses.
+    Binary values written before compression was enabled are read unchanged
+    when their first byte is not a header (0xF8 to 0xFE) or when they do not
+    decompress. One starting with 0xF8 (raw) or with a valid compressed stream
+    is read as a framed value: rewrite such values before enabling compression.
+    The range commands (getrange, setrange, append, strlen) work on the stored
+    bytes, do not mix them with compression.
+    """
+
+    def __init__(
+        self,
+        algorithm: Union[str, Compressor] = "zlib",
+        threshold: int = 1024,
+        level: Optional[int] = None,
+        min_saving: float = 0.1,
+    ) -> None:
+        if threshold < 1:
+            raise ValueError("threshold must be greater than 0")
+        self.compressor = (
+            algorithm
+            if isinstance(algorithm, Compressor)
+            else get_compressor(algorithm, level)
+        )
+        self.threshold = threshold
+        self.min_saving = min_saving
+
+    @staticmethod
+    def _raw(data: Any) -> Any:
+        if len(data) and data[0] >= RAW_HEADER:
+            return bytes((RAW_HEADER,)) + bytes(data)
+        return data
+
+    def compress(self, value: FieldT) -> FieldT:
+        if isinstance(value, str):
+            if len(value) < self.threshold:
+                return value
+            data: Any = value.encode("utf-8")
+        elif isinstance(value, (bytes, memoryview)):
+            data = memoryview(value).cast("B")
+        else:
+            return value
+
+        if len(data) < self.threshold:
+            return value if isinstance(value, str) else self._raw(data)
+        packed = self.compressor.compress(data)
+        if len(packed) + 1 > len(data) * (1 - self.min_saving):
+            return value if isinstance(value, str) else self._raw(data)
+        return bytes((self.compressor.header,)) + packed
+
+    def _reader(self, header: int) -> Optional[Compressor]:
+        if header == self.compressor.header:
+            return self.compressor
+        return _reader(header)
+
+    async def prepare(self, value: StrBytesT) -> None:
+        if isinstance(value, bytes) and value and value[0] > RAW_HEADER:
+            reader = self._reader(value[0])
+            if reader is not None:
+                await reader.prepare(memoryview(value)[1:])
+
+    def decompress(self, value: StrBytesT) -> StrBytesT:
+        if not isinstance(value, bytes) or not value or value[0] < RAW_HEADER:
+            return value
+        if value[0] == RAW_HEADER:
+            return value[1:]
+        reader = self._reader(value[0])
+        if reader is None:
+            return value
+        try:
+            return reader.decompress(memoryview(value)[1:])
+        except UnexpectedReturnTypeException:
+            raise
+        except Exception:
+            # a binary value written before compression was enabled
+            return value
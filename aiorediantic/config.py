@@ -39,6 +39,22 @@ class RedisConfig(BaseModel):
     ssl_cert_reqs: str = "required"
     ssl_ca_certs: Optional[str] = None
     ssl_check_hostname: bool = False
+    admission_max_inflight: Optional[int] = None
+    admission_max_queue: int = 0
+    admission_queue_timeout: Optional[float] = None
+    admission_low_priority_ratio: float = 1.0
+    latency_window: float = 60.0
+    latency_relative_accuracy: float = 0.01
+    adaptive_timeout: bool = False
+    adaptive_timeout_quantile: float = 0.99
+    adaptive_timeout_multiplier: float = 3.0
+    adaptive_timeout_min: float = 0.01
+    adaptive_timeout_max: float = 5.0
+    adaptive_timeout_min_samples: int = 100
+    background_health_check_interval: Optional[float] = None
+    background_health_check_timeout: float = 1.0
+    background_health_check_latency_threshold: Optional[float] = None
+    shutdown_grace_period: float = 5.0
 
     @validator("redis_version")
     def redis_version_must_be_validate(cls, version: str) -> str:
@@ -6,3 +6,20 @@ class ExpireEnum(str, Enum):
     XX = "XX"
     GT = "GT"
     LT = "LT"
+
+
+class PriorityEnum(str, Enum):
+    HIGH = "HIGH"
+    NORMAL = "NORMAL"
+    LOW = "LOW"
+
+
+class BitUnitEnum(str, Enum):
+    BYTE = "BYTE"
+    BIT = "BIT"
+
+
+class OverflowEnum(str, Enum):
+    WRAP = "WRAP"
+    SAT = "SAT"
+    FAIL = "FAIL"
@@ -12,3 +12,15 @@ class InvalidArgumentTypeException(Exception):
 
 class UnexpectedReturnTypeException(Exception):
     pass
+
+
+class AdmissionRejectedException(Exception):
+    pass
+
+
+class ClientClosedException(Exception):
+    pass
+
+
+class CodecNotAvailableException(Exception):
+    pass
@@ -1,9 +1,13 @@
-from typing import Any, Optional, List
+from typing import Any, AsyncIterator, Optional, List, Union
+from abc import abstractmethod
 from packaging.version import Version
 
 
 from aiorediantic.types import StrBytesT, ExpiryT, FieldT, AbsExpiryT
 from aiorediantic.base.redis_key import RedisKey
+from aiorediantic.compression import Compression
+from aiorediantic.cache.local_cache import LocalCache
+from aiorediantic.cache.negative_cache import NegativeCache
 from aiorediantic.exception import (
     InvalidOptionsCombinationException,
     OldRedisVersionException,
@@ -20,10 +24,44 @@ version_7_0_0: Version = Version("7.0.0")
 version_2_6_12: Version = Version("2.6.12")
 version_6_0_0: Version = Version("6.0.0")
 version_6_2_0: Version = Version("6.2.0")
+version_2_6_0: Version = Version("2.6.0")
+version_2_4_0: Version = Version("2.4.0")
+version_2_2_0: Version = Version("2.2.0")
+version_2_0_0: Version = Version("2.0.0")
+
+# ARGV: increment command, amount, expiry in milliseconds set when the key is created
+_INCR_EXPIRE_SCRIPT = """
+local created = redis.call("EXISTS", KEYS[1]) == 0
+local value = redis.call(ARGV[1], KEYS[1], ARGV[2])
+if created then
+    redis.call("PEXPIRE", KEYS[1], ARGV[3])
+end
+return value
+"""
 
 
 class AbstractStringModel(RedisKey):
-    async def _set(
+    coalesce: bool = False
+    localCache: Optional[LocalCache] = None
+    negativeCache: Optional[NegativeCache] = None
+    compression: Optional[Compression] = None
+
+    @abstractmethod
+    def _encode(self, value: Any) -> FieldT:
+        """Value stored in key for value, raise when the model can not store it"""
+
+    @abstractmethod
+    def _parse_res(self, value: StrBytesT, get: bool = True) -> Any:
+        """Value returned to the caller for the reply value of a read (get) or write"""
+
+    async def _decompress(self, value: StrBytesT) -> StrBytesT:
+        """Stored value of key as it was set, before it is parsed"""
+        if self.compression is None:
+            return value
+        await self.compression.prepare(value)
+        return self.compression.decompress(value)
+
+    def _set_args(
         self,
         value: Any,
         nx: bool = False,
@@ -34,7 +72,8 @@ class AbstractStringModel(RedisKey):
         exat: Optional[AbsExpiryT] = None,
         pxat: Optional[AbsExpiryT] = None,
         keepttl: bool = False,
-    ) -> StrBytesT:
+    ) -> List[FieldT]:
+        """Validate the SET options and return the SET command arguments"""
         if nx and self.redisVersion < version_2_6_12:
             raise OldRedisVersionException(
                 f"Current version: {self.redisVersion} is not support NX option. Required version: {version_2_6_12}",
@@ -78,6 +117,8 @@ class AbstractStringModel(RedisKey):
                 f"Current version: {self.redisVersion} is not support NX and GET options to be used together. Required version: {version_7_0_0}",
             )
 
+        if self.compression is not None:
+            value = self.compression.compress(value)
         pieces: List[FieldT] = [value]
         if nx:
             pieces.append("NX")
@@ -116,18 +157,269 @@ class AbstractStringModel(RedisKey):
                 "EX, PX, EXAT, PXAT, KEEPTTL combination are not allow"
             )
 
-        return await self.client.execute_command(  # pyright: ignore
-            "SET", self.redisKey, *pieces
+        return ["SET", self.redisKey, *pieces]
+
+    async def _set(
+        self,
+        value: Any,
+        nx: bool = False,
+        xx: bool = False,
+        get: bool = False,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        keepttl: bool = False,
+    ) -> StrBytesT:
+        args: List[FieldT] = self._set_args(
+            value=value,
+            nx=nx,
+            xx=xx,
+            get=get,
+            ex=ex,
+            px=px,
+            exat=exat,
+            pxat=pxat,
+            keepttl=keepttl,
         )
+        try:
+            status: StrBytesT = await self.execute_command(*args)
+        finally:
+            self._invalidate_local()
+        return await self._decompress(status) if get else status
+
+    async def _incr(
+        self,
+        command: str,
+        amount: Union[int, float],
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+    ) -> Any:
+        """
+        Run the increment command (INCRBY, DECRBY, INCRBYFLOAT) with amount.
+        With ex or px, the expiry is set in the same round trip (a script) when
+        the increment creates key, the expiry of an existing key is kept.
+        """
+        if command == "INCRBYFLOAT" and self.redisVersion < version_2_6_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support INCRBYFLOAT operation. Required version: {version_2_6_0}",
+            )
+        if ex is not None and px is not None:
+            raise InvalidOptionsCombinationException(
+                "EX and PX options both can not be used together"
+            )
+        if (ex is not None or px is not None) and self.redisVersion < version_2_6_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support EX and PX options of increments. Required version: {version_2_6_0}",
+            )
+
+        try:
+            if ex is not None:
+                expiry = timedetla_to_seconds(ex) * 1000
+            elif px is not None:
+                expiry = timedetla_to_milliseconds(px)
+            else:
+                return await self.execute_command(command, self.redisKey, amount)
+            return await self.execute_command(
+                "EVAL", _INCR_EXPIRE_SCRIPT, 1, self.redisKey, command, amount, expiry
+            )
+        finally:
+            self._invalidate_local()
+
+    def _invalidate_local(self) -> None:
+        if self.localCache is not None:
+            self.localCache.invalidate(self.redisKey)
+        if self.negativeCache is not None:
+            self.negativeCache.invalidate(self.redisKey)
 
     async def _get(self) -> StrBytesT:
-        return await self.client.get(self.redisKey)  # pyright: ignore
+        negative = self.negativeCache
+        if negative is None:
+            return await self._fetch()
+
+        if negative.contains(self.redisKey):
+            return None
+
+        generation = negative.generation
+        value = await self._fetch()
+        if value is None:
+            negative.add(self.redisKey, generation=generation)
+        return value
+
+    async def _fetch(self) -> StrBytesT:
+        cache = self.localCache
+        if cache is None:
+            return await self._decompress(
+                await self.execute_command("GET", self.redisKey)
+            )
+
+        found, value = cache.get(self.redisKey)
+        if found:
+            return await self._decompress(value)
+
+        # the local copy must not outlive the key, read its ttl in the same round trip
+        ttl_command, ttl_unit = ("PTTL", 1000)
+        if self.redisVersion < version_2_6_0:
+            ttl_command, ttl_unit = ("TTL", 1)
+        generation = cache.generation
+        value, ttl = await self.redisClient.execute_pipeline(
+            [("GET", self.redisKey), (ttl_command, self.redisKey)],
+            priority=self.priority,
+            transaction=True,
+        )
+
+        # ttl is -1 when the key has no expiry and -2 when it does not exist
+        if value is not None and ttl != -2:
+            cache.set(
+                self.redisKey,
+                value,
+                ttl=None if ttl == -1 else ttl / ttl_unit,
+                generation=generation,
+            )
+        return await self._decompress(value)
+
+    async def _parsed_get(self) -> Any:
+        return self._parse_res(await self._get(), get=True)
+
+    async def _read(self) -> Any:
+        """
+        GET and decode the value of key.
+        With coalesce=True, concurrent reads of the same key by the same model type
+        wait on a single in-flight GET and share its decoded result.
+        """
+        if not self.coalesce:
+            return await self._parsed_get()
+        return await self.redisClient.single_flight.do(
+            (type(self), self.redisKey), self._parsed_get
+        )
+
+    def _getex_args(
+        self,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        persist: bool = False,
+    ) -> List[FieldT]:
+        """Validate the GETEX options and return the GETEX command arguments"""
+        if self.redisVersion < version_6_2_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support GETEX operation. Required version: {version_6_2_0}",
+            )
+
+        ttlCount = sum(option is not None for option in (ex, px, exat, pxat))
+        if ttlCount + persist > 1:
+            raise InvalidOptionsCombinationException(
+                "EX, PX, EXAT, PXAT, PERSIST combination are not allow"
+            )
+
+        pieces: List[FieldT] = []
+        if ex is not None:
+            pieces.extend(("EX", timedetla_to_seconds(ex)))
+        if px is not None:
+            pieces.extend(("PX", timedetla_to_milliseconds(px)))
+        if exat is not None:
+            pieces.extend(("EXAT", unix_to_seconds(exat)))
+        if pxat is not None:
+            pieces.extend(("PXAT", unix_to_milliseconds(pxat)))
+        if persist:
+            pieces.append("PERSIST")
+
+        return ["GETEX", self.redisKey, *pieces]
+
+    async def _getex(
+        self,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        persist: bool = False,
+    ) -> StrBytesT:
+        args: List[FieldT] = self._getex_args(
+            ex=ex, px=px, exat=exat, pxat=pxat, persist=persist
+        )
+        try:
+            return await self._decompress(await self.execute_command(*args))
+        finally:
+            # the local copies must not outlive a shortened expiry
+            self._invalidate_local()
+
+    async def _getrange(self, start: int, end: int) -> StrBytesT:
+        if self.redisVersion < version_2_4_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support GETRANGE operation. Required version: {version_2_4_0}",
+            )
+        return await self.execute_command("GETRANGE", self.redisKey, start, end)
+
+    async def _setrange(self, offset: int, value: FieldT) -> int:
+        if self.redisVersion < version_2_2_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support SETRANGE operation. Required version: {version_2_2_0}",
+            )
+        try:
+            return await self.execute_command("SETRANGE", self.redisKey, offset, value)
+        finally:
+            self._invalidate_local()
+
+    async def _append(self, value: FieldT) -> int:
+        if self.redisVersion < version_2_0_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support APPEND operation. Required version: {version_2_0_0}",
+            )
+        try:
+            return await self.execute_command("APPEND", self.redisKey, value)
+        finally:
+            self._invalidate_local()
+
+    async def strlen(self) -> int:
+        """
+        @Available since: 2.2.0
+        Get the length in bytes of the value of key.
+
+        Return
+            length of the value.
+            0 when key does not exist.
+        """
+        if self.redisVersion < version_2_2_0:
+            raise OldRedisVersionException(
+                f"Current version: {self.redisVersion} is not support STRLEN operation. Required version: {version_2_2_0}",
+            )
+        return await self.execute_command("STRLEN", self.redisKey)
+
+    async def iter_chunks(self, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """
+        @Available since: 2.4.0
+        Stream the raw value of key in chunks of chunk_size bytes (the last one
+        can be shorter) with one GETRANGE per chunk, without decoding it and
+        without holding the whole value in memory. Nothing is yielded when key
+        does not exist. A value changed while it is streamed is read as it is
+        at the time of each chunk. The RedisClient must not use decode_responses,
+        a chunk can end inside a multibyte character.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+        if self.config.decode_responses:
+            raise InvalidOptionsCombinationException(
+                "iter_chunks requires a RedisClient without decode_responses"
+            )
+        offset = 0
+        while True:
+            chunk = await self._getrange(offset, offset + chunk_size - 1)
+            if not chunk:
+                return
+            yield chunk  # type: ignore
+            if len(chunk) < chunk_size:
+                return
+            offset += chunk_size
 
     async def _getdel(self) -> StrBytesT:
         if self.redisVersion < version_6_2_0:
             raise OldRedisVersionException(
                 f"Current version: {self.redisVersion} is not support GETDEL operation. Required version: {version_6_2_0}",
             )
-        return await self.client.execute_command(  # pyright: ignore
-            "GETDEL", self.redisKey
-        )
+        try:
+            return await self._decompress(
+                await self.execute_command("GETDEL", self.redisKey)
+            )
+        finally:
+            self._invalidate_local()
@@ -8,6 +8,11 @@ from .abstract_string import AbstractStringModel
 
 
 class BoolModel(AbstractStringModel):
+    def _encode(self, value: bool) -> str:
+        if type(value) != bool:  # pyright: ignore
+            raise InvalidArgumentTypeException("BoolModel allow to set only BOOL value")
+        return "true" if value else "false"
+
     def _parse_res(self, value: StrBytesT, get: bool = True) -> BoolReturn:
         res: StrReturn = str_if_byte(value)
         if res is False:
@@ -61,11 +66,8 @@ class BoolModel(AbstractStringModel):
             Starting with Redis version 6.2.0: Added the GET, EXAT and PXAT option.
             Starting with Redis version 7.0.0: Allowed the NX and GET options to be used together.
         """
-        if type(value) != bool:  # pyright: ignore
-            raise InvalidArgumentTypeException("BoolModel allow to set only BOOL value")
-
         status: StrBytesT = await super()._set(
-            value="true" if value else "false",
+            value=self._encode(value),
             nx=nx,
             xx=xx,
             get=get,
@@ -87,8 +89,7 @@ class BoolModel(AbstractStringModel):
             bool value of key
             0 when key does not exist.
         """
-        status: StrBytesT = await super()._get()
-        return self._parse_res(status, get=True)
+        return await self._read()
 
     async def getdel(self) -> BoolReturn:
         """
@@ -101,3 +102,31 @@ class BoolModel(AbstractStringModel):
         """
         status: StrBytesT = await super()._getdel()
         return self._parse_res(status, get=True)
+
+    async def getex(
+        self,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        persist: bool = False,
+    ) -> BoolReturn:
+        """
+        @Available since: 6.2.0
+        Get the bool value of key and optionally set its expiration, in one round trip.
+
+        Return
+            bool value of key
+            0 when key does not exist.
+
+        The GETEX command supports a set of options that modify its behavior:
+            EX seconds -- Set the specified expire time, in seconds.
+            PX milliseconds -- Set the specified expire time, in milliseconds.
+            EXAT timestamp-seconds -- Set the specified Unix time at which the key will expire, in seconds.
+            PXAT timestamp-milliseconds -- Set the specified Unix time at which the key will expire, in milliseconds.
+            PERSIST -- Remove the time to live associated with the key.
+        """
+        status: StrBytesT = await super()._getex(
+            ex=ex, px=px, exat=exat, pxat=pxat, persist=persist
+        )
+        return self._parse_res(status, get=True)
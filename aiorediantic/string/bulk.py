@@ -0,0 +1,124 @@
+"""Module containing the bulk operations over string models"""
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+from aiorediantic.types import AbsExpiryT, ExpiryT, FieldT
+from aiorediantic.base.redis_client import RedisClient
+from aiorediantic.exception import InvalidOptionsCombinationException
+from .abstract_string import AbstractStringModel
+
+
+def shared_client(objs: Sequence[AbstractStringModel]) -> RedisClient:
+    """Return the RedisClient of objs, all objects must use the same one"""
+    client: RedisClient = objs[0].redisClient
+    for obj in objs:
+        if obj.redisClient is not client:
+            raise InvalidOptionsCombinationException(
+                "Bulk operations require all objects to use the same RedisClient"
+            )
+    return client
+
+
+async def get_many(objs: Sequence[AbstractStringModel]) -> List[Any]:
+    """
+    Get the values of many keys with a single MGET.
+
+    Return
+        list of the typed values, in the order of objs.
+        False/0 for the keys that do not exist, like get() of each model.
+    """
+    if not objs:
+        return []
+
+    client: RedisClient = shared_client(objs)
+    values: List[Any] = await client.execute_command(
+        "MGET", *(obj.redisKey for obj in objs), priority=objs[0].priority
+    )
+    return [
+        obj._parse_res(await obj._decompress(value), get=True)
+        for obj, value in zip(objs, values)
+    ]
+
+
+async def getex_many(
+    objs: Sequence[AbstractStringModel],
+    ex: Optional[ExpiryT] = None,
+    px: Optional[ExpiryT] = None,
+    exat: Optional[AbsExpiryT] = None,
+    pxat: Optional[AbsExpiryT] = None,
+    persist: bool = False,
+) -> List[Any]:
+    """
+    GETEX many keys in a single pipeline, every GETEX uses the same options.
+
+    Return
+        list of the getex() results of each model, in the order of objs.
+    """
+    if not objs:
+        return []
+
+    client: RedisClient = shared_client(objs)
+    commands: List[List[FieldT]] = [
+        obj._getex_args(ex=ex, px=px, exat=exat, pxat=pxat, persist=persist)
+        for obj in objs
+    ]
+    try:
+        values: List[Any] = await client.execute_pipeline(
+            commands, priority=objs[0].priority
+        )
+    finally:
+        for obj in objs:
+            obj._invalidate_local()
+    return [
+        obj._parse_res(await obj._decompress(value), get=True)
+        for obj, value in zip(objs, values)
+    ]
+
+
+async def set_many(
+    items: Sequence[Tuple[AbstractStringModel, Any]],
+    nx: bool = False,
+    xx: bool = False,
+    get: bool = False,
+    ex: Optional[ExpiryT] = None,
+    px: Optional[ExpiryT] = None,
+    exat: Optional[AbsExpiryT] = None,
+    pxat: Optional[AbsExpiryT] = None,
+    keepttl: bool = False,
+) -> List[Any]:
+    """
+    Set many (object, value) pairs in a single pipeline, every SET uses the same options.
+
+    Return
+        list of the set() results of each model, in the order of items.
+    """
+    if not items:
+        return []
+
+    objs: List[AbstractStringModel] = [obj for obj, _ in items]
+    client: RedisClient = shared_client(objs)
+    commands: List[List[FieldT]] = [
+        obj._set_args(
+            value=obj._encode(value),
+            nx=nx,
+            xx=xx,
+            get=get,
+            ex=ex,
+            px=px,
+            exat=exat,
+            pxat=pxat,
+            keepttl=keepttl,
+        )
+        for obj, value in items
+    ]
+    try:
+        statuses: List[Any] = await client.execute_pipeline(
+            commands, priority=objs[0].priority
+        )
+    finally:
+        for obj in objs:
+            obj._invalidate_local()
+    return [
+        obj._parse_res(await obj._decompress(status) if get else status, get=get)
+        for obj, status in zip(objs, statuses)
+    ]
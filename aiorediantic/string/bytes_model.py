@@ -0,0 +1,176 @@
+from typing import Optional, Union
+
+
+from aiorediantic import InvalidArgumentTypeException
+from aiorediantic.types import StrBytesT, AbsExpiryT, EncodedT, ExpiryT
+from .abstract_string import AbstractStringModel
+
+
+BytesReturn = Union[bytes, bool, None]
+
+
+class BytesModel(AbstractStringModel):
+    """
+    Binary safe model: values are written and read as raw bytes, never decoded.
+    bytes are sent as they are, bytearray and memoryview (of any format)
+    through a byte view of their buffer, without copy, get() returns the
+    reply buffer itself.
+    The RedisClient must not use decode_responses.
+    """
+
+    def _encode(self, value: Union[bytes, bytearray, memoryview]) -> EncodedT:
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, (bytearray, memoryview)):
+            # RESP frames a value with len(), the number of items of a typed view
+            return memoryview(value).cast("B")
+        raise InvalidArgumentTypeException(
+            "BytesModel allow to set only BYTES, BYTEARRAY or MEMORYVIEW value"
+        )
+
+    def _parse_res(self, value: StrBytesT, get: bool = True) -> BytesReturn:
+        if not get:
+            # SET reply: OK, None when NX/XX was not met
+            return value is not None
+        if isinstance(value, str):
+            return value.encode(self.config.encoding)
+        return value
+
+    async def set(
+        self,
+        value: Union[bytes, bytearray, memoryview],
+        nx: bool = False,
+        xx: bool = False,
+        get: bool = False,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        keepttl: bool = False,
+    ) -> BytesReturn:
+        """
+        @Available since: 1.0.0
+        Set key to hold the bytes value.
+
+        Return
+            True if SET was executed correctly.
+            False if the SET operation was not performed because the user specified the NX or XX option but the condition was not met.
+            Old bytes value stored at key.If the command is issued with the GET option.
+            None if the key did not exist.
+
+        The SET command supports a set of options that modify its behavior:
+            EX seconds -- Set the specified expire time, in seconds.
+            PX milliseconds -- Set the specified expire time, in milliseconds.
+            EXAT timestamp-seconds -- Set the specified Unix time at which the key will expire, in seconds.
+            PXAT timestamp-milliseconds -- Set the specified Unix time at which the key will expire, in milliseconds.
+            NX -- Only set the key if it does not already exist.
+            XX -- Only set the key if it already exists.
+            KEEPTTL -- Retain the time to live associated with the key.
+            GET -- Return the old bytes stored at key, or nil if key did not exist.
+
+        History
+            Starting with Redis version 2.6.12: Added the EX, PX, NX and XX options.
+            Starting with Redis version 6.0.0: Added the KEEPTTL option.
+            Starting with Redis version 6.2.0: Added the GET, EXAT and PXAT option.
+            Starting with Redis version 7.0.0: Allowed the NX and GET options to be used together.
+        """
+        status: StrBytesT = await super()._set(
+            value=self._encode(value),
+            nx=nx,
+            xx=xx,
+            get=get,
+            ex=ex,
+            px=px,
+            exat=exat,
+            pxat=pxat,
+            keepttl=keepttl,
+        )
+
+        return self._parse_res(status, get=get)
+
+    async def get(self) -> BytesReturn:
+        """
+        @Available since: 1.0.0
+        Get the bytes value of key.
+
+        Return
+            bytes value of key
+            None when key does not exist.
+        """
+        return await self._read()
+
+    async def getdel(self) -> BytesReturn:
+        """
+        @Available since: 6.2.0
+        Get the bytes value of key and delete the key.
+
+        Return
+            bytes value of key
+            None when key does not exist.
+        """
+        status: StrBytesT = await super()._getdel()
+        return self._parse_res(status, get=True)
+
+    async def getex(
+        self,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        persist: bool = False,
+    ) -> BytesReturn:
+        """
+        @Available since: 6.2.0
+        Get the bytes value of key and optionally set its expiration, in one round trip.
+
+        Return
+            bytes value of key
+            None when key does not exist.
+
+        The GETEX command supports a set of options that modify its behavior:
+            EX seconds -- Set the specified expire time, in seconds.
+            PX milliseconds -- Set the specified expire time, in milliseconds.
+            EXAT timestamp-seconds -- Set the specified Unix time at which the key will expire, in seconds.
+            PXAT timestamp-milliseconds -- Set the specified Unix time at which the key will expire, in milliseconds.
+            PERSIST -- Remove the time to live associated with the key.
+        """
+        status: StrBytesT = await super()._getex(
+            ex=ex, px=px, exat=exat, pxat=pxat, persist=persist
+        )
+        return self._parse_res(status, get=True)
+
+    async def getrange(self, start: int, end: int) -> bytes:
+        """
+        @Available since: 2.4.0
+        Get the bytes of the value of key between the offsets start and end
+        (inclusive, negative offsets count from the end).
+
+        Return
+            bytes of the range.
+            Empty bytes when key does not exist or the range is out of the value.
+        """
+        res: StrBytesT = await super()._getrange(start, end)
+        return self._parse_res(res, get=True) or b""  # type: ignore
+
+    async def setrange(
+        self, offset: int, value: Union[bytes, bytearray, memoryview]
+    ) -> int:
+        """
+        @Available since: 2.2.0
+        Overwrite the value of key from offset with value, the value is
+        padded with zero bytes when offset is beyond its end.
+
+        Return
+            length of the value after it was modified.
+        """
+        return await super()._setrange(offset, self._encode(value))
+
+    async def append(self, value: Union[bytes, bytearray, memoryview]) -> int:
+        """
+        @Available since: 2.0.0
+        Append value at the end of the value of key, key is created when it does not exist.
+
+        Return
+            length of the value after the append.
+        """
+        return await super()._append(self._encode(value))
@@ -8,6 +8,13 @@ from .abstract_string import AbstractStringModel
 
 
 class FloatModel(AbstractStringModel):
+    def _encode(self, value: float) -> float:
+        if type(value) != float:
+            raise InvalidArgumentTypeException(
+                "FloatModel allow to set only FLOAT value"
+            )
+        return value
+
     def _parse_res(self, value: StrBytesT, get: bool = True) -> FloatReturn:
         res: StrReturn = str_if_byte(value)
         try:
@@ -61,13 +68,8 @@ class FloatModel(AbstractStringModel):
             Starting with Redis version 6.2.0: Added the GET, EXAT and PXAT option.
             Starting with Redis version 7.0.0: Allowed the NX and GET options to be used together.
         """
-        if type(value) != float:
-            raise InvalidArgumentTypeException(
-                "FloatModel allow to set only FLOAT value"
-            )
-
         status: StrBytesT = await super()._set(
-            value=value,
+            value=self._encode(value),
             nx=nx,
             xx=xx,
             get=get,
@@ -89,8 +91,7 @@ class FloatModel(AbstractStringModel):
             float value of key
             False when key does not exist.
         """
-        status: StrBytesT = await super()._get()
-        return self._parse_res(status, get=True)
+        return await self._read()
 
     async def getdel(self) -> FloatReturn:
         """
@@ -103,3 +104,56 @@ class FloatModel(AbstractStringModel):
         """
         status: StrBytesT = await super()._getdel()
         return self._parse_res(status, get=True)
+
+    async def getex(
+        self,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        persist: bool = False,
+    ) -> FloatReturn:
+        """
+        @Available since: 6.2.0
+        Get the float value of key and optionally set its expiration, in one round trip.
+
+        Return
+            float value of key
+            False when key does not exist.
+
+        The GETEX command supports a set of options that modify its behavior:
+            EX seconds -- Set the specified expire time, in seconds.
+            PX milliseconds -- Set the specified expire time, in milliseconds.
+            EXAT timestamp-seconds -- Set the specified Unix time at which the key will expire, in seconds.
+            PXAT timestamp-milliseconds -- Set the specified Unix time at which the key will expire, in milliseconds.
+            PERSIST -- Remove the time to live associated with the key.
+        """
+        status: StrBytesT = await super()._getex(
+            ex=ex, px=px, exat=exat, pxat=pxat, persist=persist
+        )
+        return self._parse_res(status, get=True)
+
+    async def incrbyfloat(
+        self,
+        amount: float,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+    ) -> float:
+        """
+        @Available since: 2.6.0
+        Increment the float value of key by amount (negative to decrement),
+        a missing key is set to 0 before.
+
+        Return
+            float value of key after the increment.
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the increment creates key.
+            PX milliseconds -- Set the expire time, in milliseconds, when the increment creates key.
+            EX and PX run the increment and the expire in a single script.
+        """
+        if type(amount) not in (int, float):
+            raise InvalidArgumentTypeException(
+                "FloatModel allow to increment only by INT or FLOAT value"
+            )
+        return float(await self._incr("INCRBYFLOAT", amount, ex=ex, px=px))
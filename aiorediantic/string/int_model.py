@@ -8,6 +8,11 @@ from .abstract_string import AbstractStringModel
 
 
 class IntModel(AbstractStringModel):
+    def _encode(self, value: int) -> int:
+        if type(value) != int:
+            raise InvalidArgumentTypeException("IntModel allow to set only INT value")
+        return value
+
     def _parse_res(self, value: StrBytesT, get: bool = True) -> IntReturn:
         res: StrReturn = str_if_byte(value)
         try:
@@ -61,11 +66,8 @@ class IntModel(AbstractStringModel):
             Starting with Redis version 6.2.0: Added the GET, EXAT and PXAT option.
             Starting with Redis version 7.0.0: Allowed the NX and GET options to be used together.
         """
-        if type(value) != int:
-            raise InvalidArgumentTypeException("IntModel allow to set only INT value")
-
         status: StrBytesT = await super()._set(
-            value=value,
+            value=self._encode(value),
             nx=nx,
             xx=xx,
             get=get,
@@ -87,8 +89,7 @@ class IntModel(AbstractStringModel):
             int value of key
             False when key does not exist.
         """
-        status: StrBytesT = await super()._get()
-        return self._parse_res(status, get=True)
+        return await self._read()
 
     async def getdel(self) -> IntReturn:
         """
@@ -101,3 +102,112 @@ class IntModel(AbstractStringModel):
         """
         status: StrBytesT = await super()._getdel()
         return self._parse_res(status, get=True)
+
+    async def getex(
+        self,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        persist: bool = False,
+    ) -> IntReturn:
+        """
+        @Available since: 6.2.0
+        Get the int value of key and optionally set its expiration, in one round trip.
+
+        Return
+            int value of key
+            False when key does not exist.
+
+        The GETEX command supports a set of options that modify its behavior:
+            EX seconds -- Set the specified expire time, in seconds.
+            PX milliseconds -- Set the specified expire time, in milliseconds.
+            EXAT timestamp-seconds -- Set the specified Unix time at which the key will expire, in seconds.
+            PXAT timestamp-milliseconds -- Set the specified Unix time at which the key will expire, in milliseconds.
+            PERSIST -- Remove the time to live associated with the key.
+        """
+        status: StrBytesT = await super()._getex(
+            ex=ex, px=px, exat=exat, pxat=pxat, persist=persist
+        )
+        return self._parse_res(status, get=True)
+
+    def _amount(self, amount: int) -> int:
+        if type(amount) != int:
+            raise InvalidArgumentTypeException(
+                "IntModel allow to increment only by INT value"
+            )
+        return amount
+
+    async def incr(
+        self, ex: Optional[ExpiryT] = None, px: Optional[ExpiryT] = None
+    ) -> int:
+        """
+        @Available since: 1.0.0
+        Increment the int value of key by one, a missing key is set to 0 before.
+
+        Return
+            int value of key after the increment.
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the increment creates key.
+            PX milliseconds -- Set the expire time, in milliseconds, when the increment creates key.
+            EX and PX run the increment and the expire in a single script (Redis 2.6.0).
+        """
+        return await self.incrby(1, ex=ex, px=px)
+
+    async def incrby(
+        self,
+        amount: int,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+    ) -> int:
+        """
+        @Available since: 1.0.0
+        Increment the int value of key by amount, a missing key is set to 0 before.
+
+        Return
+            int value of key after the increment.
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the increment creates key.
+            PX milliseconds -- Set the expire time, in milliseconds, when the increment creates key.
+            EX and PX run the increment and the expire in a single script (Redis 2.6.0).
+        """
+        return int(await self._incr("INCRBY", self._amount(amount), ex=ex, px=px))
+
+    async def decr(
+        self, ex: Optional[ExpiryT] = None, px: Optional[ExpiryT] = None
+    ) -> int:
+        """
+        @Available since: 1.0.0
+        Decrement the int value of key by one, a missing key is set to 0 before.
+
+        Return
+            int value of key after the decrement.
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the decrement creates key.
+            PX milliseconds -- Set the expire time, in milliseconds, when the decrement creates key.
+            EX and PX run the decrement and the expire in a single script (Redis 2.6.0).
+        """
+        return await self.decrby(1, ex=ex, px=px)
+
+    async def decrby(
+        self,
+        amount: int,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+    ) -> int:
+        """
+        @Available since: 1.0.0
+        Decrement the int value of key by amount, a missing key is set to 0 before.
+
+        Return
+            int value of key after the decrement.
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the decrement creates key.
+            PX milliseconds -- Set the expire time, in milliseconds, when the decrement creates key.
+            EX and PX run the decrement and the expire in a single script (Redis 2.6.0).
+        """
+        return int(await self._incr("DECRBY", self._amount(amount), ex=ex, px=px))
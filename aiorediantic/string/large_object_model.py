@@ -0,0 +1,178 @@
+from typing import Any, List, Optional, Tuple, Union
+import asyncio
+import uuid
+
+
+from pydantic import PositiveInt
+
+
+from aiorediantic import InvalidArgumentTypeException, UnexpectedReturnTypeException
+from aiorediantic.types import ExpiryT, FieldT
+from aiorediantic.base.redis_model import RedisModel
+from aiorediantic.utils import str_if_byte, timedetla_to_seconds
+
+BinaryT = Union[bytes, bytearray, memoryview]
+
+
+class LargeObjectModel(RedisModel):
+    """
+    Binary payload split in chunks of chunkSize bytes, each in its own key
+    "<key>:<version>:<i>", and a manifest "<version>:<size>:<chunk size>" in key.
+
+    set() writes the chunks of a new version in a pipeline, then swaps the
+    manifest with a single SET, so readers see either the previous or the new
+    object, never a partially written one. The chunks of the previous version
+    expire after oldVersionGrace seconds, reads in progress can still finish.
+
+    get() fetches the chunks with `parallelism` concurrent MGET, on as many
+    connections, and copies them into one preallocated bytearray. It retries
+    from the manifest when a chunk is gone (the object was replaced meanwhile).
+
+    The expiry of an object is set with set(ex=...) on the manifest, the chunks
+    live oldVersionGrace seconds longer so they do not expire before it. A
+    chunk missing under an unchanged manifest reads as a missing object.
+    Chunks are raw bytes, the RedisClient must not use decode_responses.
+    """
+
+    chunkSize: PositiveInt = 256 * 1024
+    parallelism: PositiveInt = 4
+    oldVersionGrace: PositiveInt = 10
+    readAttempts: PositiveInt = 3
+
+    def chunk_key(self, version: str, index: int) -> str:
+        return f"{self.redisKey}:{version}:{index}"
+
+    def _chunk_keys(self, manifest: Tuple[str, int, int]) -> List[str]:
+        version, size, chunkSize = manifest
+        count = -(-size // chunkSize)
+        return [self.chunk_key(version, i) for i in range(count)]
+
+    @staticmethod
+    def _manifest(value: Any) -> Optional[Tuple[str, int, int]]:
+        res = str_if_byte(value)
+        if not res:
+            return None
+        try:
+            version, size, chunkSize = str(res).split(":")
+            return version, int(size), int(chunkSize)
+        except ValueError:
+            raise UnexpectedReturnTypeException(
+                f"LargeObjectModel expect a manifest but get value {res}"
+            )
+
+    async def set(self, value: BinaryT, ex: Optional[ExpiryT] = None) -> bool:
+        """
+        Store value, replacing the previous object atomically.
+        ex applies to the manifest, the chunks expire oldVersionGrace seconds later.
+
+        Return
+            True when the object was written.
+        """
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            raise InvalidArgumentTypeException(
+                "LargeObjectModel allow to set only BYTES, BYTEARRAY or MEMORYVIEW value"
+            )
+        data = memoryview(value).cast("B")
+        version = uuid.uuid4().hex[:16]
+        manifest = (version, len(data), self.chunkSize)
+        expiry: List[FieldT] = []
+        chunkExpiry: List[FieldT] = []
+        if ex is not None:
+            seconds = timedetla_to_seconds(ex)
+            expiry = ["EX", seconds]
+            chunkExpiry = ["EX", seconds + self.oldVersionGrace]
+
+        commands: List[List[FieldT]] = [
+            [
+                "SET",
+                key,
+                data[i * self.chunkSize : (i + 1) * self.chunkSize],
+                *chunkExpiry,
+            ]
+            for i, key in enumerate(self._chunk_keys(manifest))
+        ]
+        if commands:
+            await self.redisClient.execute_pipeline(commands, priority=self.priority)
+
+        # swap the manifest and read the previous one in a single MULTI/EXEC
+        previous, _ = await self.redisClient.execute_pipeline(
+            [
+                ["GET", self.redisKey],
+                ["SET", self.redisKey, "{}:{}:{}".format(*manifest), *expiry],
+            ],
+            priority=self.priority,
+            transaction=True,
+        )
+
+        old = self._manifest(previous)
+        oldKeys = [] if old is None else self._chunk_keys(old)
+        if oldKeys:
+            await self.redisClient.execute_pipeline(
+                [["EXPIRE", key, self.oldVersionGrace] for key in oldKeys],
+                priority=self.priority,
+            )
+        return True
+
+    async def _fetch(self, keys: List[str]) -> List[Any]:
+        return await self.execute_command("MGET", *keys)
+
+    async def get(self) -> Optional[bytearray]:
+        """
+        Read the object.
+
+        Return
+            bytearray of the object.
+            None when key does not exist.
+        """
+        manifest = self._manifest(await self.execute_command("GET", self.redisKey))
+        for _ in range(self.readAttempts):
+            if manifest is None:
+                return None
+
+            size = manifest[1]
+            keys = self._chunk_keys(manifest)
+            per_fetch = -(-len(keys) // self.parallelism) or 1
+            groups = [keys[i : i + per_fetch] for i in range(0, len(keys), per_fetch)]
+            results = await asyncio.gather(*(self._fetch(group) for group in groups))
+
+            result = bytearray(size)
+            view = memoryview(result)
+            complete = True
+            offset = 0
+            for chunks in results:
+                for chunk in chunks:
+                    if chunk is None:
+                        complete = False
+                        break
+                    view[offset : offset + len(chunk)] = chunk
+                    offset += len(chunk)
+            if complete and offset == size:
+                return result
+
+            current = self._manifest(await self.execute_command("GET", self.redisKey))
+            if current == manifest:
+                # chunks gone under an unchanged manifest, the object expired
+                return None
+            manifest = current
+        raise UnexpectedReturnTypeException(
+            f"LargeObjectModel could not read a complete object after {self.readAttempts} attempts"
+        )
+
+    async def exists(self) -> int:
+        """
+        Return 1 if key is exists or 0 if key is not exists.
+        """
+        return await self.execute_command("EXISTS", self.redisKey)
+
+    async def delete(self) -> int:
+        """
+        Removes the manifest and the chunks of the current object.
+        Return 1 if key is exists or 0 if key is not exists.
+        """
+        manifest = self._manifest(await self.execute_command("GET", self.redisKey))
+        keys = [] if manifest is None else self._chunk_keys(manifest)
+        res: List[Any] = await self.redisClient.execute_pipeline(
+            [["DEL", self.redisKey], *(["DEL", key] for key in keys)],
+            priority=self.priority,
+        )
+        return res[0]
@@ -0,0 +1,163 @@
+from typing import Any, Optional, Type, Union
+
+
+from pydantic import BaseModel, validator
+
+
+from aiorediantic import InvalidArgumentTypeException, UnexpectedReturnTypeException
+from aiorediantic.types import StrBytesT, AbsExpiryT, ExpiryT
+from aiorediantic.codec import Codec, get_codec
+from .abstract_string import AbstractStringModel
+
+
+PydanticReturn = Union[BaseModel, bool, None]
+
+
+class PydanticModel(AbstractStringModel):
+    """
+    Value of key is an instance of valueType, serialized with codec:
+        - a name of the codec registry (json, orjson, msgpack, pickle or a
+          registered one).
+        - None for the fastest codec installed: orjson, msgpack, then json.
+    The codec is resolved when the model is created and kept in codec, every
+    process reading or writing the keys must use the same one, pin it when
+    they do not all have the same packages installed.
+    Binary codecs (msgpack, pickle) need a RedisClient without decode_responses.
+
+    get_many() and set_many() of the bulk module work with this model as well.
+    """
+
+    valueType: Type[BaseModel]
+    codec: Optional[str] = None
+
+    @validator("codec", always=True)
+    def codec_must_be_available(cls, codec: Optional[str]) -> str:
+        return get_codec(codec).name
+
+    @property
+    def _codec(self) -> Codec:
+        return get_codec(self.codec)
+
+    def _encode(self, value: BaseModel) -> bytes:
+        if not isinstance(value, self.valueType):
+            raise InvalidArgumentTypeException(
+                f"PydanticModel allow to set only {self.valueType.__name__} value"
+            )
+        return self._codec.dumps(value.dict())
+
+    def _parse_res(self, value: StrBytesT, get: bool = True) -> PydanticReturn:
+        if not get:
+            # SET reply: OK, None when NX/XX was not met
+            return value is not None
+        if value is None:
+            return None
+        try:
+            data: Any = self._codec.loads(value)
+        except Exception as ex:
+            raise UnexpectedReturnTypeException(
+                f"PydanticModel could not decode the value with codec {self.codec}: {ex}"
+            )
+        return self.valueType.parse_obj(data)
+
+    async def set(
+        self,
+        value: BaseModel,
+        nx: bool = False,
+        xx: bool = False,
+        get: bool = False,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        keepttl: bool = False,
+    ) -> PydanticReturn:
+        """
+        @Available since: 1.0.0
+        Set key to hold the serialized value.
+
+        Return
+            True if SET was executed correctly.
+            False if the SET operation was not performed because the user specified the NX or XX option but the condition was not met.
+            Old value stored at key.If the command is issued with the GET option.
+            None if the key did not exist.
+
+        The SET command supports a set of options that modify its behavior:
+            EX seconds -- Set the specified expire time, in seconds.
+            PX milliseconds -- Set the specified expire time, in milliseconds.
+            EXAT timestamp-seconds -- Set the specified Unix time at which the key will expire, in seconds.
+            PXAT timestamp-milliseconds -- Set the specified Unix time at which the key will expire, in milliseconds.
+            NX -- Only set the key if it does not already exist.
+            XX -- Only set the key if it already exists.
+            KEEPTTL -- Retain the time to live associated with the key.
+            GET -- Return the old value stored at key, or nil if key did not exist.
+
+        History
+            Starting with Redis version 2.6.12: Added the EX, PX, NX and XX options.
+            Starting with Redis version 6.0.0: Added the KEEPTTL option.
+            Starting with Redis version 6.2.0: Added the GET, EXAT and PXAT option.
+            Starting with Redis version 7.0.0: Allowed the NX and GET options to be used together.
+        """
+        status: StrBytesT = await super()._set(
+            value=self._encode(value),
+            nx=nx,
+            xx=xx,
+            get=get,
+            ex=ex,
+            px=px,
+            exat=exat,
+            pxat=pxat,
+            keepttl=keepttl,
+        )
+
+        return self._parse_res(status, get=get)
+
+    async def get(self) -> PydanticReturn:
+        """
+        @Available since: 1.0.0
+        Get the value of key.
+
+        Return
+            valueType instance of key
+            None when key does not exist.
+        """
+        return await self._read()
+
+    async def getdel(self) -> PydanticReturn:
+        """
+        @Available since: 6.2.0
+        Get the value of key and delete the key.
+
+        Return
+            valueType instance of key
+            None when key does not exist.
+        """
+        status: StrBytesT = await super()._getdel()
+        return self._parse_res(status, get=True)
+
+    async def getex(
+        self,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        persist: bool = False,
+    ) -> PydanticReturn:
+        """
+        @Available since: 6.2.0
+        Get the value of key and optionally set its expiration, in one round trip.
+
+        Return
+            valueType instance of key
+            None when key does not exist.
+
+        The GETEX command supports a set of options that modify its behavior:
+            EX seconds -- Set the specified expire time, in seconds.
+            PX milliseconds -- Set the specified expire time, in milliseconds.
+            EXAT timestamp-seconds -- Set the specified Unix time at which the key will expire, in seconds.
+            PXAT timestamp-milliseconds -- Set the specified Unix time at which the key will expire, in milliseconds.
+            PERSIST -- Remove the time to live associated with the key.
+        """
+        status: StrBytesT = await super()._getex(
+            ex=ex, px=px, exat=exat, pxat=pxat, persist=persist
+        )
+        return self._parse_res(status, get=True)
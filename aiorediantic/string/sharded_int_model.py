@@ -0,0 +1,316 @@
+from typing import Any, Awaitable, Callable, Hashable, List, Optional
+import asyncio
+import random
+import zlib
+
+
+from pydantic import PositiveInt
+
+
+from aiorediantic import InvalidArgumentTypeException
+from aiorediantic.types import AbsExpiryT, ExpiryT
+from aiorediantic.enum import ExpireEnum
+from aiorediantic.base.redis_key import RedisKey
+from aiorediantic.utils import str_if_byte
+from .int_model import IntModel
+
+
+class ShardedIntModel(RedisKey):
+    """
+    Int counter spread over `shards` IntModel keys "<key>:shard:<i>", so a hot
+    counter does not pin a single Redis core. An increment goes to one shard,
+    chosen at random or by hashing hashKey, get() adds up every shard with a
+    single MGET.
+
+    Growing shards needs nothing, the new shards start at 0. When shrinking it,
+    set previousShards to the previous count: get(), delete() and the expiry
+    operations keep covering the surplus shards, which writers still using the
+    previous count keep writing to until they are updated. reshard() folds the
+    surplus shards into the remaining ones, it can be repeated to fold these
+    writes too.
+
+    The key operations (exists, delete, unlink, expire..., ttl, pttl, persist)
+    apply to every shard. A timeout is set on the existing shards only, pass ex
+    or px to the increments for the shards they create.
+    """
+
+    shards: PositiveInt = 8
+    previousShards: Optional[PositiveInt] = None
+
+    def shard_key(self, index: int) -> str:
+        return f"{self.redisKey}:shard:{index}"
+
+    def shard_keys(self, shards: Optional[int] = None) -> List[str]:
+        return [self.shard_key(i) for i in range(shards or self.shards)]
+
+    def shard(self, index: int) -> IntModel:
+        """IntModel of the shard index"""
+        obj = IntModel.construct(
+            redisClient=self.redisClient,
+            keyFormat=self.keyFormat,
+            redisVersion=self.redisVersion,
+            priority=self.priority,
+        )
+        obj._redisKey = self.shard_key(index)
+        return obj
+
+    def _read_shards(self) -> int:
+        """Count of the shards which may hold a part of the counter"""
+        return max(self.shards, self.previousShards or 0)
+
+    async def _each_shard(
+        self, operation: Callable[[IntModel], Awaitable[int]]
+    ) -> List[int]:
+        return await asyncio.gather(
+            *(operation(self.shard(i)) for i in range(self._read_shards()))
+        )
+
+    def _shard_index(self, hashKey: Optional[Hashable]) -> int:
+        if hashKey is None:
+            return random.randrange(self.shards)
+        return zlib.crc32(str(hashKey).encode()) % self.shards
+
+    async def incrby(
+        self,
+        amount: int,
+        hashKey: Optional[Hashable] = None,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+    ) -> int:
+        """
+        @Available since: 1.0.0
+        Increment the counter by amount.
+
+        Return
+            int value of the shard incremented (not of the counter).
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the increment creates the shard.
+            PX milliseconds -- Set the expire time, in milliseconds, when the increment creates the shard.
+        """
+        if type(amount) != int:
+            raise InvalidArgumentTypeException(
+                "ShardedIntModel allow to increment only by INT value"
+            )
+        shard = self.shard(self._shard_index(hashKey))
+        return await shard.incrby(amount, ex=ex, px=px)
+
+    async def incr(
+        self,
+        hashKey: Optional[Hashable] = None,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+    ) -> int:
+        """
+        @Available since: 1.0.0
+        Increment the counter by one.
+
+        Return
+            int value of the shard incremented (not of the counter).
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the increment creates the shard.
+            PX milliseconds -- Set the expire time, in milliseconds, when the increment creates the shard.
+        """
+        return await self.incrby(1, hashKey=hashKey, ex=ex, px=px)
+
+    async def decrby(
+        self,
+        amount: int,
+        hashKey: Optional[Hashable] = None,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+    ) -> int:
+        """
+        @Available since: 1.0.0
+        Decrement the counter by amount.
+
+        Return
+            int value of the shard decremented (not of the counter).
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the increment creates the shard.
+            PX milliseconds -- Set the expire time, in milliseconds, when the increment creates the shard.
+        """
+        if type(amount) != int:
+            raise InvalidArgumentTypeException(
+                "ShardedIntModel allow to decrement only by INT value"
+            )
+        return await self.incrby(-amount, hashKey=hashKey, ex=ex, px=px)
+
+    async def decr(
+        self,
+        hashKey: Optional[Hashable] = None,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+    ) -> int:
+        """
+        @Available since: 1.0.0
+        Decrement the counter by one.
+
+        Return
+            int value of the shard decremented (not of the counter).
+
+        Options:
+            EX seconds -- Set the expire time, in seconds, when the increment creates the shard.
+            PX milliseconds -- Set the expire time, in milliseconds, when the increment creates the shard.
+        """
+        return await self.incrby(-1, hashKey=hashKey, ex=ex, px=px)
+
+    async def get(self) -> int:
+        """
+        @Available since: 1.0.0
+        Get the value of the counter, the sum of its shards.
+
+        Return
+            int value of the counter, 0 when no shard exists.
+        """
+        values: List[Any] = await self.execute_command(
+            "MGET", *self.shard_keys(self._read_shards())
+        )
+        return sum(int(str_if_byte(value) or 0) for value in values)
+
+    async def delete(self) -> int:
+        """
+        Removes every shard of the counter.
+        Return the number of shards removed.
+        """
+        return await self.execute_command("DEL", *self.shard_keys(self._read_shards()))
+
+    async def unlink(self) -> int:
+        """
+        @Available since: 4.0.0
+        Removes every shard of the counter asynchronously.
+        Return the number of shards unlinked.
+        """
+        return sum(await self._each_shard(lambda shard: shard.unlink()))
+
+    async def exists(self) -> int:
+        """
+        Return 1 if a shard of the counter exists or 0 if none exists.
+        """
+        return int(any(await self._each_shard(lambda shard: shard.exists())))
+
+    async def expire(
+        self, seconds: ExpiryT, option: Optional[ExpireEnum] = None
+    ) -> int:
+        """
+        Set a timeout on every existing shard, see RedisKey.expire().
+        Return 1 if the timeout was set on a shard, 0 otherwise.
+        """
+        return int(
+            any(await self._each_shard(lambda shard: shard.expire(seconds, option)))
+        )
+
+    async def expireat(
+        self, epoch_in_seconds: AbsExpiryT, option: Optional[ExpireEnum] = None
+    ) -> int:
+        """
+        Set a timeout on every existing shard, see RedisKey.expireat().
+        Return 1 if the timeout was set on a shard, 0 otherwise.
+        """
+        return int(
+            any(
+                await self._each_shard(
+                    lambda shard: shard.expireat(epoch_in_seconds, option)
+                )
+            )
+        )
+
+    async def pexpire(
+        self, milliseconds: ExpiryT, option: Optional[ExpireEnum] = None
+    ) -> int:
+        """
+        @Available since: 2.6.0
+        Set a timeout on every existing shard, see RedisKey.pexpire().
+        Return 1 if the timeout was set on a shard, 0 otherwise.
+        """
+        return int(
+            any(
+                await self._each_shard(
+                    lambda shard: shard.pexpire(milliseconds, option)
+                )
+            )
+        )
+
+    async def pexpireat(
+        self, epoch_in_milliseconds: AbsExpiryT, option: Optional[ExpireEnum] = None
+    ) -> int:
+        """
+        @Available since: 2.6.0
+        Set a timeout on every existing shard, see RedisKey.pexpireat().
+        Return 1 if the timeout was set on a shard, 0 otherwise.
+        """
+        return int(
+            any(
+                await self._each_shard(
+                    lambda shard: shard.pexpireat(epoch_in_milliseconds, option)
+                )
+            )
+        )
+
+    @staticmethod
+    def _counter_ttl(ttls: List[int]) -> int:
+        if -1 in ttls:
+            return -1
+        return max(ttls)
+
+    async def ttl(self) -> int:
+        """
+        Returns the remaining time to live (in seconds) of the counter, the
+        longest of its shards.
+
+        Return
+            ttl time as as an integer if a shard is present.
+            -1 if a shard has no associated ttl.
+            -2 if no shard is present.
+        """
+        return self._counter_ttl(await self._each_shard(lambda shard: shard.ttl()))
+
+    async def pttl(self) -> int:
+        """
+        @Available since: 2.6.0
+        Returns the remaining time to live (in milliseconds) of the counter, the
+        longest of its shards.
+
+        Return
+            ttl time as as an integer if a shard is present.
+            -1 if a shard has no associated ttl.
+            -2 if no shard is present.
+        """
+        return self._counter_ttl(await self._each_shard(lambda shard: shard.pttl()))
+
+    async def persist(self) -> int:
+        """
+        Removes the ttl of every shard.
+        Return 1 if the ttl of a shard was removed, 0 otherwise.
+        """
+        return int(any(await self._each_shard(lambda shard: shard.persist())))
+
+    async def reshard(self, shards: Optional[int] = None) -> int:
+        """
+        Fold the shards [self.shards, shards) of a counter previously spread over
+        `shards` keys (default previousShards) into the shards of the current
+        count, shard i goes to i % self.shards. Each move is a MULTI/EXEC of
+        DECRBY on the surplus shard and INCRBY on its target by the value read,
+        increments made concurrently to either shard are kept.
+
+        Return the number of surplus shards moved.
+        """
+        shards = shards or self.previousShards or self.shards
+        moved = 0
+        for index in range(self.shards, shards):
+            source = self.shard_key(index)
+            value = int(str_if_byte(await self.execute_command("GET", source)) or 0)
+            if not value:
+                continue
+            await self.redisClient.execute_pipeline(
+                [
+                    ("DECRBY", source, value),
+                    ("INCRBY", self.shard_key(index % self.shards), value),
+                ],
+                priority=self.priority,
+                transaction=True,
+            )
+            moved += 1
+        return moved
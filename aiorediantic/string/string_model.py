@@ -8,7 +8,17 @@ from .abstract_string import AbstractStringModel
 
 
 class StringModel(AbstractStringModel):
+    def _encode(self, value: str) -> str:
+        if not isinstance(value, str):  # pyright: ignore
+            raise InvalidArgumentTypeException(
+                "StringModel allow to set only STRING value"
+            )
+        return value
+
     def _parse_res(self, value: StrBytesT, get: bool = True) -> StrReturn:
+        if get and value is not None and not value:
+            # an empty string stored at key, not a missing key
+            return ""
         res: StrReturn = str_if_byte(value)
         if type(res) == bool:
             return res
@@ -55,13 +65,8 @@ class StringModel(AbstractStringModel):
             Starting with Redis version 6.2.0: Added the GET, EXAT and PXAT option.
             Starting with Redis version 7.0.0: Allowed the NX and GET options to be used together.
         """
-        if not isinstance(value, str):  # pyright: ignore
-            raise InvalidArgumentTypeException(
-                "StringModel allow to set only STRING value"
-            )
-
         status: StrBytesT = await super()._set(
-            value=value,
+            value=self._encode(value),
             nx=nx,
             xx=xx,
             get=get,
@@ -83,8 +88,7 @@ class StringModel(AbstractStringModel):
             String value of key
             None when key does not exist.
         """
-        status: StrBytesT = await super()._get()
-        return self._parse_res(status, get=True)
+        return await self._read()
 
     async def getdel(self) -> StrReturn:
         """
@@ -97,3 +101,65 @@ class StringModel(AbstractStringModel):
         """
         status: StrBytesT = await super()._getdel()
         return self._parse_res(status, get=True)
+
+    async def getex(
+        self,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        persist: bool = False,
+    ) -> StrReturn:
+        """
+        @Available since: 6.2.0
+        Get the string value of key and optionally set its expiration, in one round trip.
+
+        Return
+            string value of key
+            None when key does not exist.
+
+        The GETEX command supports a set of options that modify its behavior:
+            EX seconds -- Set the specified expire time, in seconds.
+            PX milliseconds -- Set the specified expire time, in milliseconds.
+            EXAT timestamp-seconds -- Set the specified Unix time at which the key will expire, in seconds.
+            PXAT timestamp-milliseconds -- Set the specified Unix time at which the key will expire, in milliseconds.
+            PERSIST -- Remove the time to live associated with the key.
+        """
+        status: StrBytesT = await super()._getex(
+            ex=ex, px=px, exat=exat, pxat=pxat, persist=persist
+        )
+        return self._parse_res(status, get=True)
+
+    async def getrange(self, start: int, end: int) -> str:
+        """
+        @Available since: 2.4.0
+        Get the substring of the value of key between the byte offsets start
+        and end (inclusive, negative offsets count from the end).
+
+        Return
+            substring of the value.
+            Empty string when key does not exist or the range is out of the value.
+        """
+        res: StrBytesT = await super()._getrange(start, end)
+        return str(str_if_byte(res) or "")
+
+    async def setrange(self, offset: int, value: str) -> int:
+        """
+        @Available since: 2.2.0
+        Overwrite the value of key from the byte offset with value, the value is
+        padded with zero bytes when offset is beyond its end.
+
+        Return
+            length of the value after it was modified.
+        """
+        return await super()._setrange(offset, self._encode(value))
+
+    async def append(self, value: str) -> int:
+        """
+        @Available since: 2.0.0
+        Append value at the end of the value of key, key is created when it does not exist.
+
+        Return
+            length of the value after the append.
+        """
+        return await super()._append(self._encode(value))
@@ -0,0 +1,182 @@
+"""Module containing the write-behind aggregation of counter increments"""
+from typing import Dict, List, Optional, Tuple, Union
+import asyncio
+
+
+from pydantic import BaseModel
+
+
+from aiorediantic.types import FieldT
+from aiorediantic.enum import PriorityEnum
+from aiorediantic.base.redis_client import RedisClient
+from aiorediantic.exception import InvalidArgumentTypeException
+from .abstract_string import AbstractStringModel
+from .int_model import IntModel
+from .float_model import FloatModel
+
+CounterT = Union[IntModel, FloatModel]
+
+
+class WriteBehindStats(BaseModel):
+    """Counters of an IncrementBuffer"""
+
+    pending: int = 0
+    increments: int = 0
+    flushes: int = 0
+    flushed_keys: int = 0
+    failed_flushes: int = 0
+    rejected: int = 0
+
+
+class IncrementBuffer:
+    """
+    Add up the increments of IntModel/FloatModel counters in memory and write
+    them as one INCRBY (INCRBYFLOAT for FloatModel) per key, in a single
+    MULTI/EXEC pipeline:
+        - every flush_interval seconds once start() was called.
+        - when max_keys distinct keys are pending, incr() then waits for the
+          flush, which bounds the memory of the buffer.
+        - when flush() is awaited, for callers that must read their writes.
+        - when the RedisClient is closed (aclose()), started or not.
+
+    The increments of a failed flush are merged back and retried by the next
+    one. A flush failing after EXEC was sent (e.g. a timeout) may therefore be
+    applied twice, increments are at-least-once. While max_keys keys are kept
+    pending by failed flushes, incr() of a new key flushes first and raises
+    the error of the flush without buffering it (counted in rejected), so the
+    memory stays bounded while Redis is unavailable.
+    """
+
+    def __init__(
+        self,
+        redisClient: RedisClient,
+        flush_interval: float = 0.1,
+        max_keys: int = 10000,
+        priority: PriorityEnum = PriorityEnum.NORMAL,
+    ) -> None:
+        if max_keys < 1:
+            raise ValueError("max_keys must be greater than 0")
+        self.redisClient = redisClient
+        self.flush_interval = flush_interval
+        self.max_keys = max_keys
+        self.priority = priority
+        self._pending: Dict[str, Tuple[CounterT, Union[int, float]]] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._task: "Optional[asyncio.Task[None]]" = None
+        self._registered = False
+        self._stats = WriteBehindStats()
+        self._register()
+
+    def _register(self) -> None:
+        """Flush and stop on aclose() of the client, until stop() is called"""
+        if not self._registered:
+            self._registered = True
+            self.redisClient.add_close_callback(self.stop)
+
+    def stats(self) -> WriteBehindStats:
+        return self._stats.copy(update={"pending": len(self._pending)})
+
+    def pending(self, obj: CounterT) -> Union[int, float]:
+        """Amount added to the key of obj and not flushed yet"""
+        entry = self._pending.get(obj.redisKey)
+        return 0 if entry is None else entry[1]
+
+    def _add(self, obj: CounterT, amount: Union[int, float]) -> None:
+        entry = self._pending.get(obj.redisKey)
+        self._pending[obj.redisKey] = (
+            obj,
+            amount if entry is None else entry[1] + amount,
+        )
+
+    async def incr(self, obj: CounterT, amount: Union[int, float] = 1) -> None:
+        """Buffer an increment of the counter of obj"""
+        if isinstance(obj, IntModel):
+            if type(amount) != int:
+                raise InvalidArgumentTypeException(
+                    "IntModel allow to increment only by INT value"
+                )
+        elif isinstance(obj, FloatModel):
+            if type(amount) not in (int, float):
+                raise InvalidArgumentTypeException(
+                    "FloatModel allow to increment only by INT or FLOAT value"
+                )
+        else:
+            raise InvalidArgumentTypeException(
+                "IncrementBuffer allow to increment only IntModel or FloatModel"
+            )
+
+        self._register()
+        if obj.redisKey not in self._pending and len(self._pending) >= self.max_keys:
+            try:
+                await self.flush()
+            except BaseException:
+                self._stats.rejected += 1
+                raise
+        self._add(obj, amount)
+        self._stats.increments += 1
+        if len(self._pending) >= self.max_keys:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write every pending increment, return once they are applied"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+
+            commands: List[List[FieldT]] = []
+            objs: List[AbstractStringModel] = []
+            for key, (obj, amount) in pending.items():
+                command = "INCRBYFLOAT" if isinstance(obj, FloatModel) else "INCRBY"
+                commands.append([command, key, amount])
+                objs.append(obj)
+
+            try:
+                await self.redisClient.execute_pipeline(
+                    commands, priority=self.priority, transaction=True
+                )
+            except BaseException:
+                self._stats.failed_flushes += 1
+                for obj, amount in pending.values():
+                    self._add(obj, amount)
+                raise
+            finally:
+                for obj in objs:
+                    obj._invalidate_local()
+
+            self._stats.flushes += 1
+            self._stats.flushed_keys += len(commands)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                # kept pending, retried by the next flush
+                pass
+
+    def start(self) -> None:
+        """Start the periodic flush on the running loop, aclose() of the client flushes and stops it"""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+            self._register()
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and flush the pending increments"""
+        task, self._task = self._task, None
+        self._registered = False
+        self.redisClient.remove_close_callback(self.stop)
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
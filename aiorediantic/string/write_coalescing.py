@@ -0,0 +1,172 @@
+"""Module containing the coalescing of repeated writes to the same key"""
+from typing import Any, Dict, List, Optional, Set, Tuple
+import asyncio
+
+
+from pydantic import BaseModel
+
+
+from aiorediantic.types import AbsExpiryT, ExpiryT, FieldT
+from aiorediantic.enum import PriorityEnum
+from aiorediantic.base.redis_client import RedisClient
+from .abstract_string import AbstractStringModel
+
+
+class WriteCoalescerStats(BaseModel):
+    """Counters of a WriteCoalescer"""
+
+    pending: int = 0
+    writes: int = 0
+    coalesced: int = 0
+    batches: int = 0
+
+
+class _Batch:
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.writes: Dict[str, Tuple[AbstractStringModel, List[FieldT]]] = {}
+        self.done: "asyncio.Future[None]" = loop.create_future()
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.started = False
+
+
+class WriteCoalescer:
+    """
+    Hold the set() calls made within window seconds and write only the latest
+    value (with its expiry options) of each key:
+        - a single MSET when none of the writes of the batch has an expiry.
+        - otherwise a single pipeline of SET commands.
+
+    set() returns once the batch is written, the writes it superseded return
+    True as well. A batch is written early when it holds max_keys keys, and
+    the pending batch is written by aclose(), of the coalescer or of the
+    RedisClient. A cancelled set() does not cancel the write of its batch.
+    NX, XX and GET are not supported, their result depends on the order of
+    the writes which coalescing does not keep.
+    """
+
+    def __init__(
+        self,
+        redisClient: RedisClient,
+        window: float = 0.005,
+        max_keys: int = 1000,
+        priority: PriorityEnum = PriorityEnum.NORMAL,
+    ) -> None:
+        if max_keys < 1:
+            raise ValueError("max_keys must be greater than 0")
+        self.redisClient = redisClient
+        self.window = window
+        self.max_keys = max_keys
+        self.priority = priority
+        self._batch: Optional[_Batch] = None
+        self._writes: "Set[asyncio.Task[None]]" = set()
+        self._stats = WriteCoalescerStats()
+        redisClient.add_close_callback(self.aclose)
+
+    def stats(self) -> WriteCoalescerStats:
+        pending = 0 if self._batch is None else len(self._batch.writes)
+        return self._stats.copy(update={"pending": pending})
+
+    async def set(
+        self,
+        obj: AbstractStringModel,
+        value: Any,
+        ex: Optional[ExpiryT] = None,
+        px: Optional[ExpiryT] = None,
+        exat: Optional[AbsExpiryT] = None,
+        pxat: Optional[AbsExpiryT] = None,
+        keepttl: bool = False,
+    ) -> bool:
+        """Coalesced obj.set(value, ...), return True once the value (or a later one) is written"""
+        args: List[FieldT] = obj._set_args(
+            value=obj._encode(value),
+            ex=ex,
+            px=px,
+            exat=exat,
+            pxat=pxat,
+            keepttl=keepttl,
+        )
+
+        batch = self._batch
+        if batch is None:
+            loop = asyncio.get_running_loop()
+            batch = self._batch = _Batch(loop)
+            batch.timer = loop.call_later(self.window, self._start, batch)
+
+        self._stats.writes += 1
+        if obj.redisKey in batch.writes:
+            self._stats.coalesced += 1
+            # keep the insertion order of the keys in line with their last write
+            del batch.writes[obj.redisKey]
+        batch.writes[obj.redisKey] = (obj, args)
+
+        if len(batch.writes) >= self.max_keys:
+            self._start(batch)
+        # shielded, a cancelled caller must not cancel the batch of the others
+        await asyncio.shield(batch.done)
+        return True
+
+    def _start(self, batch: _Batch) -> None:
+        """Write batch in a task of its own, kept until it is done"""
+        if self._batch is batch:
+            self._batch = None
+        if batch.timer is not None:
+            batch.timer.cancel()
+        if batch.started:
+            return
+        batch.started = True
+        task = asyncio.ensure_future(self._write_later(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: _Batch) -> None:
+        writes = list(batch.writes.values())
+        try:
+            if all(len(args) == 3 for _, args in writes):
+                # plain SET key value, no expiry option
+                pieces: List[FieldT] = []
+                for _, (_, key, value) in writes:
+                    pieces.extend((key, value))
+                await self.redisClient.execute_command(
+                    "MSET", *pieces, priority=self.priority
+                )
+            else:
+                await self.redisClient.execute_pipeline(
+                    [args for _, args in writes], priority=self.priority
+                )
+        except asyncio.CancelledError:
+            batch.done.cancel()
+            raise
+        except Exception as ex:
+            batch.done.set_exception(ex)
+            # the waiters retrieve it, mark it retrieved when there are none left
+            batch.done.exception()
+            raise
+        finally:
+            for obj, _ in writes:
+                obj._invalidate_local()
+
+        self._stats.batches += 1
+        batch.done.set_result(None)
+
+    async def _write_later(self, batch: _Batch) -> None:
+        try:
+            await self._write(batch)
+        except Exception:
+            # raised to the callers waiting on the batch
+            pass
+
+    async def flush(self) -> None:
+        """Write the pending batch now, return once every started write is done"""
+        batch = self._batch
+        if batch is not None:
+            self._start(batch)
+        if self._writes:
+            await asyncio.shield(asyncio.gather(*self._writes))
+        if batch is not None:
+            # raise the error of its write, if any
+            await asyncio.shield(batch.done)
+
+    async def aclose(self) -> None:
+        """Write the pending batch and unregister from the RedisClient"""
+        self.redisClient.remove_close_callback(self.aclose)
+        await self.flush()
@@ -0,0 +1,165 @@
+"""Module containing the synchronous facade over the async models"""
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+import asyncio
+import atexit
+import functools
+import threading
+
+
+from aiorediantic.base.redis_model import RedisModel
+from aiorediantic.string.abstract_string import AbstractStringModel
+from aiorediantic.string import bulk
+
+
+T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=RedisModel)
+
+
+class BackgroundLoop:
+    """
+    An event loop running forever in a daemon thread.
+
+    Every coroutine submitted with run() executes on the same loop, so all the
+    synchronous callers share one connection pool per RedisClient.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._thread = threading.Thread(
+                        target=loop.run_forever,
+                        name="aiorediantic-background-loop",
+                        daemon=True,
+                    )
+                    self._thread.start()
+                    self._loop = loop
+        return self._loop
+
+    def run(self, coroutine: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Block until coroutine completes on the background loop and return its result"""
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "BackgroundLoop.run() can not be called from the background loop itself"
+            )
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)  # type: ignore
+        return future.result(timeout)
+
+    def stop(self) -> None:
+        """Cancel the pending tasks, stop the loop and join its thread"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+
+        async def cancel_tasks() -> None:
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(cancel_tasks(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_default_loop: Optional[BackgroundLoop] = None
+_default_loop_lock = threading.Lock()
+
+
+def default_loop() -> BackgroundLoop:
+    """Return the process wide BackgroundLoop, it is stopped at interpreter exit"""
+    global _default_loop
+    if _default_loop is None:
+        with _default_loop_lock:
+            if _default_loop is None:
+                _default_loop = BackgroundLoop()
+                atexit.register(_default_loop.stop)
+    return _default_loop
+
+
+class SyncModel(Generic[ModelT]):
+    """
+    Blocking proxy of a model: every coroutine method of the model becomes a
+    blocking method running on a BackgroundLoop.
+
+        key = SyncModel(StringModel(redisClient=client, keyFormat="user:{id}"))
+        key(id=1).set("value")
+        key(id=1).get()
+    """
+
+    def __init__(self, model: ModelT, loop: Optional[BackgroundLoop] = None) -> None:
+        self.model = model
+        self.loop = loop or default_loop()
+
+    def __call__(self, **kwargs: Any) -> "SyncModel[ModelT]":
+        return SyncModel(self.model(**kwargs), self.loop)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.model, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        method: Callable[..., Awaitable[Any]] = attr
+
+        @functools.wraps(method)
+        def blocking(*args: Any, **kwargs: Any) -> Any:
+            return self.loop.run(method(*args, **kwargs))
+
+        return blocking
+
+
+def _model(obj: Any) -> AbstractStringModel:
+    return obj.model if isinstance(obj, SyncModel) else obj
+
+
+def get_many(objs: Sequence[Any], loop: Optional[BackgroundLoop] = None) -> List[Any]:
+    """Blocking bulk.get_many(), objs can be models or SyncModel proxies"""
+    loop = loop or default_loop()
+    return loop.run(bulk.get_many([_model(obj) for obj in objs]))
+
+
+def getex_many(
+    objs: Sequence[Any],
+    loop: Optional[BackgroundLoop] = None,
+    **options: Any,
+) -> List[Any]:
+    """Blocking bulk.getex_many(), objs can be models or SyncModel proxies"""
+    loop = loop or default_loop()
+    return loop.run(bulk.getex_many([_model(obj) for obj in objs], **options))
+
+
+def set_many(
+    items: Sequence[Tuple[Any, Any]],
+    loop: Optional[BackgroundLoop] = None,
+    **options: Any,
+) -> List[Any]:
+    """Blocking bulk.set_many(), objects can be models or SyncModel proxies"""
+    loop = loop or default_loop()
+    return loop.run(
+        bulk.set_many([(_model(obj), value) for obj, value in items], **options)
+    )
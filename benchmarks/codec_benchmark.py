@@ -0,0 +1,75 @@
+"""
+Compare the codecs available here on pydantic payloads of growing size:
+encoded size and the time of dumps(value.dict()) and parse_obj(loads(data)),
+the work PydanticModel does on set() and get(). No Redis server is needed.
+
+    python -m benchmarks.codec_benchmark [--number 2000]
+"""
+
+from typing import Dict, List
+import argparse
+import datetime
+import timeit
+import uuid
+
+
+from pydantic import BaseModel
+
+
+from aiorediantic import available_codecs, get_codec
+
+
+class Line(BaseModel):
+    sku: str
+    quantity: int
+    price: float
+
+
+class Order(BaseModel):
+    id: uuid.UUID
+    customer: str
+    createdAt: datetime.datetime
+    tags: List[str]
+    attributes: Dict[str, str]
+    lines: List[Line]
+
+
+def order(lines: int) -> Order:
+    return Order(
+        id=uuid.uuid4(),
+        customer="customer@example.com",
+        createdAt=datetime.datetime(2023, 6, 1, 12, 30),
+        tags=["priority", "gift"],
+        attributes={f"attribute-{i}": f"value-{i}" for i in range(min(lines, 20))},
+        lines=[
+            Line(sku=f"SKU-{i:06d}", quantity=i % 7 + 1, price=i * 1.25)
+            for i in range(lines)
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000, help="runs per measure")
+    args = parser.parse_args()
+
+    print(f"{'payload':>8} {'codec':>8} {'bytes':>8} {'dumps us':>9} {'loads us':>9}")
+    for size in (1, 10, 100, 1000):
+        value = order(size)
+        number = max(args.number // size, 10)
+        for name in available_codecs():
+            codec = get_codec(name)
+            data = codec.dumps(value.dict())
+            assert Order.parse_obj(codec.loads(data)) == value
+            dumps = timeit.timeit(lambda: codec.dumps(value.dict()), number=number)
+            loads = timeit.timeit(
+                lambda: Order.parse_obj(codec.loads(data)), number=number
+            )
+            print(
+                f"{size:>8} {name:>8} {len(data):>8} "
+                f"{dumps / number * 1e6:>9.1f} {loads / number * 1e6:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import pytest
+import asyncio
+
+
+from aiorediantic import (
+    RedisClient,
+    RedisConfig,
+    StringModel,
+    PriorityEnum,
+    AdmissionRejectedException,
+)
+from aiorediantic.base.admission import AdmissionController, AdmissionStats
+from ..conftest import conf, high_version
+
+
+@pytest.mark.asyncio
+async def testAdmissionController_shouldAdmit_whenBelowMaxInflight() -> None:
+    # Arrange
+    controller = AdmissionController(max_inflight=2)
+
+    # Act
+    await controller.acquire()
+    await controller.acquire()
+
+    # Assert
+    stats: AdmissionStats = controller.stats()
+    assert stats.inflight == 2
+    assert stats.admitted == 2
+    assert stats.rejected == 0
+
+
+@pytest.mark.asyncio
+async def testAdmissionController_shouldRaiseException_whenQueueIsFull() -> None:
+    # Arrange
+    controller = AdmissionController(max_inflight=1, max_queue=0)
+    await controller.acquire()
+
+    # Act
+    with pytest.raises(AdmissionRejectedException) as ex_info:
+        await controller.acquire()
+
+    # Assert
+    assert ex_info.type == AdmissionRejectedException
+    assert controller.stats().rejected_queue_full == 1
+
+
+@pytest.mark.asyncio
+async def testAdmissionController_shouldRejectLowPriority_whenAboveLowPriorityLimit() -> (
+    None
+):
+    # Arrange
+    controller = AdmissionController(
+        max_inflight=4, max_queue=10, low_priority_ratio=0.5
+    )
+    await controller.acquire()
+    await controller.acquire()
+
+    # Act
+    with pytest.raises(AdmissionRejectedException):
+        await controller.acquire(PriorityEnum.LOW)
+    await controller.acquire(PriorityEnum.NORMAL)
+
+    # Assert
+    stats: AdmissionStats = controller.stats()
+    assert stats.inflight == 3
+    assert stats.queued == 0
+    assert stats.rejected_low_priority == 1
+
+
+@pytest.mark.asyncio
+async def testAdmissionController_shouldRaiseException_whenQueueTimeoutExpires() -> (
+    None
+):
+    # Arrange
+    controller = AdmissionController(max_inflight=1, max_queue=1, queue_timeout=0.01)
+    await controller.acquire()
+
+    # Act
+    with pytest.raises(AdmissionRejectedException):
+        await controller.acquire()
+
+    # Assert
+    stats: AdmissionStats = controller.stats()
+    assert stats.queued == 0
+    assert stats.rejected_queue_timeout == 1
+
+
+@pytest.mark.asyncio
+async def testAdmissionController_shouldWakeHighPriorityFirst_whenSlotIsReleased() -> (
+    None
+):
+    # Arrange
+    controller = AdmissionController(max_inflight=1, max_queue=2)
+    await controller.acquire()
+    order: list = []
+
+    async def waiter(priority: PriorityEnum) -> None:
+        async with controller.admit(priority):
+            order.append(priority)
+
+    normal = asyncio.ensure_future(waiter(PriorityEnum.NORMAL))
+    high = asyncio.ensure_future(waiter(PriorityEnum.HIGH))
+    await asyncio.sleep(0)
+
+    # Act
+    controller.release()
+    await asyncio.gather(normal, high)
+
+    # Assert
+    assert order == [PriorityEnum.HIGH, PriorityEnum.NORMAL]
+    stats: AdmissionStats = controller.stats()
+    assert stats.inflight == 0
+    assert stats.queued == 0
+    assert stats.queued_total == 2
+
+
+@pytest.mark.asyncio
+async def testLowPriorityModel_shouldRaiseException_whenClientIsSaturated() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, admission_max_inflight=1, **conf))  # type: ignore
+    model = StringModel(
+        redisClient=redis, keyFormat="{keyname}", priority=PriorityEnum.LOW
+    )
+    obj: StringModel = model(keyname="admission-low-priority")
+    await redis.admission.acquire()  # type: ignore
+
+    # Act
+    with pytest.raises(AdmissionRejectedException) as ex_info:
+        await obj.get()
+
+    # Assert
+    assert ex_info.type == AdmissionRejectedException
+    assert redis.admission.stats().rejected_low_priority == 1  # type: ignore
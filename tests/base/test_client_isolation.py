@@ -0,0 +1,107 @@
+import pytest
+import asyncio
+import gc
+import os
+import threading
+from typing import List
+
+
+import aioredis
+from aiorediantic import RedisClient, RedisConfig
+from ..conftest import conf, high_version
+
+
+async def current_client(redis: RedisClient) -> aioredis.Redis:
+    return redis.client
+
+
+@pytest.mark.asyncio
+async def testClient_shouldReturnSameClient_whenCalledFromSameLoop() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+
+    # Act
+    first: aioredis.Redis = redis.client
+    second: aioredis.Redis = await current_client(redis)
+
+    # Assert
+    assert first is second
+
+
+def testClient_shouldCreateSeparateClients_whenCalledFromDifferentLoops() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+
+    # Act
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    first: aioredis.Redis = first_loop.run_until_complete(current_client(redis))
+    second: aioredis.Redis = second_loop.run_until_complete(current_client(redis))
+    first_loop.close()
+    second_loop.close()
+
+    # Assert
+    assert first is not second
+    assert first.connection_pool is not second.connection_pool
+
+
+def testClient_shouldCreateSeparateClients_whenCalledFromDifferentThreads() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    clients: List[aioredis.Redis] = []
+
+    def worker() -> None:
+        clients.append(asyncio.run(current_client(redis)))
+
+    # Act
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert len(clients) == 2
+    assert clients[0] is not clients[1]
+
+
+@pytest.mark.asyncio
+async def testClient_shouldCreateNewClient_whenProcessIsForked(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    parent: aioredis.Redis = redis.client
+    redis.latency_sketch("GET").record(0.001)
+    child_pid: int = os.getpid() + 1
+
+    # Act
+    monkeypatch.setattr(os, "getpid", lambda: child_pid)
+    child: aioredis.Redis = redis.client
+
+    # Assert
+    assert child is not parent
+    assert redis.latency == {}
+
+
+def testClient_shouldDropLoopState_whenLoopIsClosed() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    async def use() -> None:
+        loop = asyncio.get_running_loop()
+        loops.append(loop)
+        await current_client(redis)
+        # like its connections, a loop bound object of the state keeps the loop alive
+        redis._state().drained = loop.create_future()
+
+    # Act
+    for _ in range(5):
+        asyncio.run(use())
+
+    gc.collect()
+
+    # Assert
+    assert len(loops) == 5
+    assert list(redis._states) == [loops[-1]]
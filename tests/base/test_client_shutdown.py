@@ -0,0 +1,93 @@
+import pytest
+import asyncio
+from typing import List
+
+
+from aiorediantic import (
+    RedisClient,
+    RedisConfig,
+    PriorityEnum,
+    ClientClosedException,
+)
+from ..conftest import conf, high_version
+
+
+@pytest.mark.asyncio
+async def testAsyncContextManager_shouldRunCloseCallbacks_whenExit() -> None:
+    # Arrange
+    calls: List[str] = []
+
+    async def flush() -> None:
+        calls.append("flush")
+
+    # Act
+    async with RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf)) as redis:  # type: ignore
+        redis.add_close_callback(flush)
+
+    # Assert
+    assert calls == ["flush"]
+
+
+@pytest.mark.asyncio
+async def testAclose_shouldRejectNewCommands_whileDraining() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    release = asyncio.Event()
+
+    async def inflight() -> None:
+        async with redis._operation(PriorityEnum.NORMAL):  # pyright: ignore
+            await release.wait()
+
+    task = asyncio.ensure_future(inflight())
+    await asyncio.sleep(0)
+    closing = asyncio.ensure_future(redis.aclose(grace_period=5))
+    await asyncio.sleep(0)
+
+    # Act
+    with pytest.raises(ClientClosedException) as ex_info:
+        await redis.execute_command("GET", "shutdown-key")
+    release.set()
+    await asyncio.gather(task, closing)
+
+    # Assert
+    assert ex_info.type == ClientClosedException
+    assert closing.done()
+
+
+@pytest.mark.asyncio
+async def testAclose_shouldReturn_whenGracePeriodExpires() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    release = asyncio.Event()
+
+    async def inflight() -> None:
+        async with redis._operation(PriorityEnum.NORMAL):  # pyright: ignore
+            await release.wait()
+
+    task = asyncio.ensure_future(inflight())
+    await asyncio.sleep(0)
+
+    # Act
+    await asyncio.wait_for(redis.aclose(grace_period=0.01), 1)
+
+    # Assert
+    assert not task.done()
+    release.set()
+    await task
+
+
+@pytest.mark.asyncio
+async def testAclose_shouldDrainInflightCommand_beforeClosingPool() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    task = asyncio.ensure_future(
+        redis.execute_command("BLPOP", "shutdown-empty-list", 0.2)
+    )
+    await asyncio.sleep(0.05)
+
+    # Act
+    await redis.aclose(grace_period=5)
+
+    # Assert
+    assert task.done()
+    assert task.result() is None
@@ -0,0 +1,60 @@
+import pytest
+
+
+from aiorediantic import RedisClient, RedisConfig
+from aiorediantic.base.health import HealthStatus
+from aiorediantic.base.redis_key import RedisKey
+from ..conftest import conf, high_version
+
+
+@pytest.mark.asyncio
+async def testHealthCheck_shouldBeUnhealthy_whenRedisIsUnreachable() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, host="127.0.0.1", port=1, background_health_check_interval=60))  # type: ignore
+
+    # Act
+    await redis.health.check()  # type: ignore
+
+    # Assert
+    status: HealthStatus = redis.health.status()  # type: ignore
+    assert redis.healthy is False
+    assert status.rounds == 1
+    assert status.failed_rounds == 1
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def testHealthCheck_shouldRecordRoundTripTime_whenIdleConnectionIsPinged() -> (
+    None
+):
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, background_health_check_interval=60, **conf))  # type: ignore
+    key = RedisKey(redisClient=redis, keyFormat="{keyname}")
+    obj: RedisKey = key(keyname="health-check-key")
+    await obj.exists()
+
+    # Act
+    await redis.health.check()  # type: ignore
+
+    # Assert
+    status: HealthStatus = redis.health.status()  # type: ignore
+    assert redis.healthy is True
+    assert status.checks == 1
+    assert status.evicted == 0
+    assert len(status.connections) == 1
+    assert status.latency is not None
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def testHealthCheck_shouldBeUnhealthy_whenLatencyCrossesThreshold() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, background_health_check_interval=60, background_health_check_latency_threshold=0, **conf))  # type: ignore
+
+    # Act
+    await redis.health.check()  # type: ignore
+
+    # Assert
+    assert redis.health.latency is not None  # type: ignore
+    assert redis.healthy is False
+    await redis.aclose()
@@ -0,0 +1,112 @@
+import pytest
+from typing import List, Optional
+
+
+from aiorediantic import RedisClient, RedisConfig
+from aiorediantic.base.latency import LatencySketch, LatencySnapshot
+from ..conftest import conf, high_version
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def testLatencySketch_shouldReturnNone_whenNoSampleRecorded() -> None:
+    # Arrange
+    sketch = LatencySketch()
+
+    # Act
+    actual: Optional[float] = sketch.quantile(0.99)
+
+    # Assert
+    assert actual is None
+    assert sketch.count == 0
+
+
+@pytest.mark.parametrize("q", [0.5, 0.9, 0.99])
+def testLatencySketch_shouldEstimateQuantile_withinRelativeAccuracy(q: float) -> None:
+    # Arrange
+    sketch = LatencySketch(relative_accuracy=0.01)
+    samples: List[float] = [i / 10000 for i in range(1, 1001)]
+    for sample in samples:
+        sketch.record(sample)
+
+    # Act
+    actual: Optional[float] = sketch.quantile(q)
+
+    # Assert
+    excepted: float = samples[int(q * (len(samples) - 1))]
+    assert actual is not None
+    assert abs(actual - excepted) <= excepted * 0.01
+
+
+def testLatencySketch_shouldDropSamples_whenOlderThanTwoWindows() -> None:
+    # Arrange
+    clock = FakeClock()
+    sketch = LatencySketch(window=10, clock=clock)
+    sketch.record(0.5)
+
+    # Act
+    clock.now = 15
+    count_previous_window: int = sketch.count
+    clock.now = 35
+    count_expired_window: int = sketch.count
+
+    # Assert
+    assert count_previous_window == 1
+    assert count_expired_window == 0
+
+
+def testLatencySketch_snapshot_shouldExportBucketsAndQuantiles() -> None:
+    # Arrange
+    sketch = LatencySketch()
+    for _ in range(10):
+        sketch.record(0.002)
+
+    # Act
+    actual: LatencySnapshot = sketch.snapshot(quantiles=[0.5])
+
+    # Assert
+    assert actual.count == 10
+    assert sum(actual.buckets.values()) == 10
+    assert abs(actual.quantiles[0.5] - 0.002) <= 0.002 * 0.01
+
+
+@pytest.mark.parametrize(
+    "latency, excepted",
+    [
+        pytest.param(0.001, 0.01, id="floor"),
+        pytest.param(0.1, 0.3, id="p99*k"),
+        pytest.param(10.0, 5.0, id="ceiling"),
+    ],
+)
+def testTimeoutFor_shouldReturnClampedQuantileTimesMultiplier(
+    latency: float, excepted: float
+) -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, adaptive_timeout=True, adaptive_timeout_min_samples=10, **conf))  # type: ignore
+    for _ in range(10):
+        redis.latency_sketch("GET").record(latency)
+
+    # Act
+    actual: Optional[float] = redis.timeout_for("GET")
+
+    # Assert
+    assert actual is not None
+    assert abs(actual - excepted) <= excepted * 0.01
+
+
+def testTimeoutFor_shouldReturnNone_whenNotEnoughSamples() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, adaptive_timeout=True, **conf))  # type: ignore
+    redis.latency_sketch("GET").record(0.1)
+
+    # Act
+    actual: Optional[float] = redis.timeout_for("GET")
+
+    # Assert
+    assert actual is None
@@ -0,0 +1,36 @@
+import pytest
+
+
+from aiorediantic import RedisClient, RedisConfig
+from aiorediantic.base.redis_key import RedisKey
+from aiorediantic.string.abstract_string import AbstractStringModel
+from ..conftest import conf, high_version
+
+
+def testCallOperation_shouldReturnNewObject_whenCalledWithDifferentVars() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    key = RedisKey(redisClient=redis, keyFormat="user:{id}")
+
+    # Act
+    first: RedisKey = key(id=1)
+    second: RedisKey = key(id=2)
+
+    # Assert
+    assert first is not second
+    assert first.redisKey == "user:1"
+    assert second.redisKey == "user:2"
+    assert first.redisClient is redis
+    assert second.redisClient is redis
+
+
+def testAbstractStringModel_shouldRaiseTypeError_whenInstantiated() -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+
+    # Act
+    with pytest.raises(TypeError) as exc_info:
+        AbstractStringModel(redisClient=redis, keyFormat="user:{id}")  # type: ignore
+
+    # Assert
+    assert "_encode" in str(exc_info.value)
@@ -0,0 +1,90 @@
+import pytest
+import asyncio
+from typing import List
+
+
+from aiorediantic.base.single_flight import SingleFlight, SingleFlightStats
+
+
+@pytest.mark.asyncio
+async def testSingleFlight_shouldRunCallOnce_whenCalledConcurrentlyWithSameKey() -> (
+    None
+):
+    # Arrange
+    group = SingleFlight()
+    calls: List[int] = []
+
+    async def call() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    # Act
+    actual: List[str] = await asyncio.gather(
+        *(group.do("key", call) for _ in range(10))
+    )
+
+    # Assert
+    stats: SingleFlightStats = group.stats()
+    assert actual == ["value"] * 10
+    assert len(calls) == 1
+    assert stats.executed == 1
+    assert stats.coalesced == 9
+    assert stats.inflight == 0
+
+
+@pytest.mark.asyncio
+async def testSingleFlight_shouldRunCallAgain_whenPreviousCallFinished() -> None:
+    # Arrange
+    group = SingleFlight()
+
+    async def call() -> int:
+        return 1
+
+    # Act
+    await group.do("key", call)
+    await group.do("key", call)
+
+    # Assert
+    assert group.stats().executed == 2
+    assert group.stats().coalesced == 0
+
+
+@pytest.mark.asyncio
+async def testSingleFlight_shouldShareException_withEveryCaller() -> None:
+    # Arrange
+    group = SingleFlight()
+
+    async def call() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError("failed")
+
+    # Act
+    actual = await asyncio.gather(
+        *(group.do("key", call) for _ in range(3)), return_exceptions=True
+    )
+
+    # Assert
+    assert all(isinstance(result, ValueError) for result in actual)
+
+
+@pytest.mark.asyncio
+async def testSingleFlight_shouldNotCancelSharedCall_whenOneCallerIsCancelled() -> None:
+    # Arrange
+    group = SingleFlight()
+
+    async def call() -> str:
+        await asyncio.sleep(0.01)
+        return "value"
+
+    first = asyncio.ensure_future(group.do("key", call))
+    second = asyncio.ensure_future(group.do("key", call))
+    await asyncio.sleep(0)
+
+    # Act
+    first.cancel()
+    actual: str = await second
+
+    # Assert
+    assert first.cancelled()
+    assert actual == "value"
@@ -0,0 +1,189 @@
+import pytest
+from typing import Any, List
+
+
+from aiorediantic import (
+    RedisClient,
+    BitmapModel,
+    BitUnitEnum,
+    InvalidArgumentTypeException,
+    InvalidOptionsCombinationException,
+    OldRedisVersionException,
+)
+
+
+@pytest.mark.asyncio
+async def testBitmapSetbitOperation_shouldReturnPreviousValue_whenFlagSet(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-setbit")
+    await obj.delete()
+
+    # Act
+    first: bool = await obj.setbit(1000, True)
+    second: bool = await obj.setbit(1000, True)
+
+    # Assert
+    assert first is False
+    assert second is True
+    assert await obj.getbit(1000) is True
+    assert await obj.getbit(999) is False
+    assert await obj.getbit(10**6) is False
+
+
+@pytest.mark.asyncio
+async def testBitmapSetbitsOperation_shouldSetAllFlags_inOneCommand(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-setbits")
+    await obj.delete()
+    await obj.setbit(3, True)
+
+    # Act
+    previous: List[bool] = await obj.setbits({1: True, 3: False, 7: True})
+    actual: List[bool] = await obj.getbits([0, 1, 3, 7, 100])
+
+    # Assert
+    assert previous == [False, True, False]
+    assert actual == [False, True, False, True, False]
+
+
+@pytest.mark.asyncio
+async def testBitmapBitcountOperation_shouldCountFlagsSet(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-bitcount")
+    await obj.delete()
+    await obj.setbits({0: True, 5: True, 9: True, 17: True})
+
+    # Act
+    total: int = await obj.bitcount()
+    firstByte: int = await obj.bitcount(0, 0)
+    firstBits: int = await obj.bitcount(0, 9, unit=BitUnitEnum.BIT)
+
+    # Assert
+    assert total == 4
+    assert firstByte == 2
+    assert firstBits == 3
+
+
+@pytest.mark.asyncio
+async def testBitmapBitposOperation_shouldReturnFirstOffset_ofBit(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-bitpos")
+    await obj.delete()
+    await obj.setbits({0: True, 1: True, 12: True})
+
+    # Act
+    firstSet: int = await obj.bitpos(True, 1)
+    firstClear: int = await obj.bitpos(False)
+
+    # Assert
+    assert firstSet == 12
+    assert firstClear == 2
+
+
+@pytest.mark.asyncio
+async def testBitmapBitcountOperation_shouldReturnZero_whenKeyNotExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-not-exists")
+
+    # Act
+    actual: int = await obj.bitcount()
+
+    # Assert
+    assert actual == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offset", [-1, 1.5, "1", None, True])
+async def testBitmapSetbitOperation_shouldRaiseInvalidArgumentTypeException_whenOffsetIsInvalid(
+    redis_client: RedisClient, offset: Any
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-wrong-offset")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as exc_info:
+        await obj.setbit(offset, True)
+
+    # Assert
+    assert exc_info.type == InvalidArgumentTypeException
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", [1, 0, "true", None])
+async def testBitmapSetbitsOperation_shouldRaiseInvalidArgumentTypeException_whenValueIsNotBool(
+    redis_client: RedisClient, value: Any
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-wrong-value")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as exc_info:
+        await obj.setbits({1: value})
+
+    # Assert
+    assert exc_info.type == InvalidArgumentTypeException
+
+
+@pytest.mark.asyncio
+async def testBitmapBitcountOperation_shouldRaiseInvalidOptionsCombinationException_whenOnlyStartPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-start-only")
+
+    # Act
+    with pytest.raises(InvalidOptionsCombinationException) as exc_info:
+        await obj.bitcount(start=1)
+
+    # Assert
+    assert exc_info.type == InvalidOptionsCombinationException
+
+
+@pytest.mark.asyncio
+async def testBitmapBitcountOperation_shouldRaiseOldRedisVersionException_whenBitUnitPassInOldRedisVersion(
+    redis_client_6_2_0: RedisClient,
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client_6_2_0, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-bit-old-version")
+
+    # Act
+    with pytest.raises(OldRedisVersionException) as exc_info:
+        await obj.bitcount(0, 1, unit=BitUnitEnum.BIT)
+
+    # Assert
+    assert exc_info.type == OldRedisVersionException
+
+
+@pytest.mark.asyncio
+async def testBitmapGetbitsOperation_shouldRaiseOldRedisVersionException_whenUsedInOldRedisVersion(
+    redis_client_2_6_0: RedisClient,
+) -> None:
+    # Arrange
+    bitmapKey = BitmapModel(redisClient=redis_client_2_6_0, keyFormat="{keyname}")
+    obj: BitmapModel = bitmapKey(keyname="bitmap-bitfield-old-version")
+
+    # Act
+    with pytest.raises(OldRedisVersionException) as exc_info:
+        await obj.getbits([1])
+
+    # Assert
+    assert exc_info.type == OldRedisVersionException
@@ -0,0 +1,181 @@
+import pytest
+from array import array
+from typing import Any, List, Optional
+from pydantic import ValidationError
+
+
+from aiorediantic import (
+    RedisClient,
+    IntArrayModel,
+    OverflowEnum,
+    InvalidArgumentTypeException,
+    OldRedisVersionException,
+)
+
+
+@pytest.mark.parametrize("encoding", ["u64", "i65", "u0", "x8", "8", "u"])
+def testIntArrayModel_shouldRaiseValidationError_whenEncodingIsInvalid(
+    redis_client: RedisClient, encoding: str
+) -> None:
+    # Act
+    with pytest.raises(ValidationError) as exc_info:
+        IntArrayModel(redisClient=redis_client, keyFormat="{keyname}", encoding=encoding)  # type: ignore
+
+    # Assert
+    assert exc_info.type == ValidationError
+
+
+@pytest.mark.asyncio
+async def testIntArraySetOperation_shouldReturnPreviousValue_whenElementSet(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    arrayKey = IntArrayModel(redisClient=redis_client, keyFormat="{keyname}", encoding="u16")  # type: ignore
+    obj: IntArrayModel = arrayKey(keyname="int-array-set")
+    await obj.delete()
+
+    # Act
+    first: Optional[int] = await obj.set(3, 500)
+    second: Optional[int] = await obj.set(3, 65535)
+
+    # Assert
+    assert first == 0
+    assert second == 500
+    assert await obj.get(3) == 65535
+    assert await obj.get(100) == 0
+
+
+@pytest.mark.asyncio
+async def testIntArrayIncrbyManyOperation_shouldSaturate_whenOverflowIsSat(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    arrayKey = IntArrayModel(redisClient=redis_client, keyFormat="{keyname}", encoding="u8", overflow=OverflowEnum.SAT)  # type: ignore
+    obj: IntArrayModel = arrayKey(keyname="int-array-sat")
+    await obj.delete()
+    await obj.set_many({0: 250, 1: 5})
+
+    # Act
+    actual: List[Optional[int]] = await obj.incrby_many({0: 10, 1: -10, 2: 7})
+
+    # Assert
+    assert actual == [255, 0, 7]
+
+
+@pytest.mark.asyncio
+async def testIntArrayIncrbyOperation_shouldReturnNone_whenOverflowIsFail(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    arrayKey = IntArrayModel(redisClient=redis_client, keyFormat="{keyname}", encoding="i8", overflow=OverflowEnum.FAIL)  # type: ignore
+    obj: IntArrayModel = arrayKey(keyname="int-array-fail")
+    await obj.delete()
+    await obj.set(0, 120)
+
+    # Act
+    actual: Optional[int] = await obj.incrby(0, 10)
+
+    # Assert
+    assert actual is None
+    assert await obj.get(0) == 120
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "encoding", ["u8", "i16", "i32", "i64", "u5", "i12", "i24", "u48"]
+)
+async def testIntArrayValuesOperation_shouldReturnArray_ofEveryElement(
+    redis_client: RedisClient, encoding: str
+) -> None:
+    # Arrange
+    arrayKey = IntArrayModel(redisClient=redis_client, keyFormat="{keyname}", encoding=encoding)  # type: ignore
+    obj: IntArrayModel = arrayKey(keyname="int-array-values")
+    await obj.delete()
+    expected = [(i % 15) * (-1 if encoding[0] == "i" and i % 2 else 1) for i in range(40)]
+    await obj.set_many(dict(enumerate(expected)))
+
+    # Act
+    everything: "array[int]" = await obj.values()
+    window: "array[int]" = await obj.values(start=10, count=40)
+
+    # Assert
+    assert isinstance(everything, array)
+    assert list(everything)[:40] == expected
+    assert list(window) == expected[10:] + [0] * 10
+    assert await obj.get_many([1, 2, 39]) == [expected[1], expected[2], expected[39]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "encoding, expected",
+    [
+        ("i24", [-(2**23), 2**23 - 1, -1, 0]),
+        ("u48", [2**48 - 1, 2**47, 1, 0]),
+    ],
+)
+async def testIntArrayValuesOperation_shouldKeepFullRange_whenWidthHasNoTypecode(
+    redis_client: RedisClient, encoding: str, expected: List[int]
+) -> None:
+    # Arrange
+    arrayKey = IntArrayModel(redisClient=redis_client, keyFormat="{keyname}", encoding=encoding)  # type: ignore
+    obj: IntArrayModel = arrayKey(keyname=f"int-array-values-{encoding}")
+    await obj.delete()
+    await obj.set_many(dict(enumerate(expected)))
+
+    # Act
+    actual: "array[int]" = await obj.values()
+
+    # Assert
+    assert list(actual) == expected
+
+
+@pytest.mark.asyncio
+async def testIntArrayValuesNumpyOperation_shouldReturnNdarray(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    numpy = pytest.importorskip("numpy")
+    arrayKey = IntArrayModel(redisClient=redis_client, keyFormat="{keyname}", encoding="u16")  # type: ignore
+    obj: IntArrayModel = arrayKey(keyname="int-array-numpy")
+    await obj.delete()
+    await obj.set_many({0: 1, 1: 300, 2: 65535})
+
+    # Act
+    actual = await obj.values_numpy()
+
+    # Assert
+    assert actual.dtype == numpy.uint16
+    assert actual.tolist() == [1, 300, 65535]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", [None, "1", 1.5, True])
+async def testIntArraySetOperation_shouldRaiseInvalidArgumentTypeException_whenValueIsNotInt(
+    redis_client: RedisClient, value: Any
+) -> None:
+    # Arrange
+    arrayKey = IntArrayModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntArrayModel = arrayKey(keyname="int-array-wrong-type")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as exc_info:
+        await obj.set(0, value)
+
+    # Assert
+    assert exc_info.type == InvalidArgumentTypeException
+
+
+@pytest.mark.asyncio
+async def testIntArrayGetOperation_shouldRaiseOldRedisVersionException_whenUsedInOldRedisVersion(
+    redis_client_2_6_0: RedisClient,
+) -> None:
+    # Arrange
+    arrayKey = IntArrayModel(redisClient=redis_client_2_6_0, keyFormat="{keyname}")
+    obj: IntArrayModel = arrayKey(keyname="int-array-old-version")
+
+    # Act
+    with pytest.raises(OldRedisVersionException) as exc_info:
+        await obj.get(0)
+
+    # Assert
+    assert exc_info.type == OldRedisVersionException
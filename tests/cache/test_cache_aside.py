@@ -0,0 +1,127 @@
+import pytest
+import asyncio
+
+
+from aiorediantic import RedisClient, StringModel, IntModel, cached
+
+
+def testCached_shouldRaiseValueError_whenKeyFieldIsNotAnArgument(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="user:{user_id}")
+
+    # Act
+    with pytest.raises(ValueError) as ex_info:
+
+        @cached(key, ex=5)
+        async def load(name: str) -> str:
+            return name
+
+    # Assert
+    assert ex_info.type == ValueError
+
+
+@pytest.mark.asyncio
+async def testCached_shouldCallFunctionOnce_whenCalledTwice(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    calls: list[int] = []
+    key = IntModel(redisClient=redis_client, keyFormat="cache-aside:{user_id}")
+
+    @cached(key, ex=5)
+    async def load(user_id: int, scale: int = 10) -> int:
+        calls.append(user_id)
+        return user_id * scale
+
+    await load.invalidate(1)  # type: ignore
+
+    # Act
+    first = await load(1)
+    second = await load(user_id=1)
+
+    # Assert
+    assert first == 10
+    assert second == 10
+    assert calls == [1]
+    assert await key(user_id=1).get() == 10
+
+
+@pytest.mark.asyncio
+async def testCached_shouldCallFunctionOnce_whenMissedConcurrently(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    calls: list[str] = []
+    key = StringModel(redisClient=redis_client, keyFormat="cache-aside:{name}")
+
+    @cached(key, ex=5, poll_interval=0.01)
+    async def load(name: str) -> str:
+        calls.append(name)
+        await asyncio.sleep(0.05)
+        return name.upper()
+
+    await load.invalidate("stampede")  # type: ignore
+
+    # Act
+    actual = await asyncio.gather(*(load("stampede") for _ in range(20)))
+
+    # Assert
+    assert actual == ["STAMPEDE"] * 20
+    assert calls == ["stampede"]
+    assert await key(name="stampede:lock").exists() == 0
+
+
+@pytest.mark.asyncio
+async def testCached_shouldWaitForLockHolder_whenKeyIsLocked(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    calls: list[str] = []
+    key = StringModel(redisClient=redis_client, keyFormat="cache-aside:{name}")
+
+    @cached(key, ex=5, poll_interval=0.01)
+    async def load(name: str) -> str:
+        calls.append(name)
+        return "computed"
+
+    await load.invalidate("locked")  # type: ignore
+    # another worker holds the lock and fills the key
+    await key(name="locked:lock").set("other", px=1000)
+
+    async def other_worker() -> None:
+        await asyncio.sleep(0.05)
+        await key(name="locked").set("from-other", ex=5)
+
+    # Act
+    actual, _ = await asyncio.gather(load("locked"), other_worker())
+
+    # Assert
+    assert actual == "from-other"
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def testCached_shouldReturnCachedEmptyString_whenCalledTwice(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    calls: list[str] = []
+    key = StringModel(redisClient=redis_client, keyFormat="cache-aside-empty:{name}")
+
+    @cached(key, ex=5)
+    async def load(name: str) -> str:
+        calls.append(name)
+        return ""
+
+    await load.invalidate("empty")  # type: ignore
+
+    # Act
+    first = await load("empty")
+    second = await load("empty")
+
+    # Assert
+    assert first == ""
+    assert second == ""
+    assert calls == ["empty"]
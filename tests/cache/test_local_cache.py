@@ -0,0 +1,103 @@
+import pytest
+import time as mod_time
+from typing import Any, Tuple
+
+
+from aiorediantic import LocalCache
+from aiorediantic.cache.local_cache import LocalCacheStats
+
+
+def testLocalCache_shouldReturnValue_whenKeyIsCached() -> None:
+    # Arrange
+    cache = LocalCache()
+    cache.set("key", b"value")
+
+    # Act
+    actual: Tuple[bool, Any] = cache.get("key")
+
+    # Assert
+    assert actual == (True, b"value")
+    assert cache.stats().hits == 1
+
+
+def testLocalCache_shouldMiss_whenEntryExpired() -> None:
+    # Arrange
+    cache = LocalCache()
+    cache.set("key", b"value", ttl=0.01)
+    mod_time.sleep(0.02)
+
+    # Act
+    actual: Tuple[bool, Any] = cache.get("key")
+
+    # Assert
+    stats: LocalCacheStats = cache.stats()
+    assert actual == (False, None)
+    assert stats.expirations == 1
+    assert stats.entries == 0
+
+
+def testLocalCache_shouldEvictLeastRecentlyUsed_whenMaxEntriesReached() -> None:
+    # Arrange
+    cache = LocalCache(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+
+    # Act
+    cache.set("c", b"3")
+
+    # Assert
+    assert cache.get("a")[0] is True
+    assert cache.get("b")[0] is False
+    assert cache.get("c")[0] is True
+    assert cache.stats().evictions == 1
+
+
+def testLocalCache_shouldEvict_whenMaxBytesReached() -> None:
+    # Arrange
+    cache = LocalCache(max_bytes=15)
+    cache.set("a", b"123456789")
+
+    # Act
+    cache.set("b", b"123456789")
+
+    # Assert
+    stats: LocalCacheStats = cache.stats()
+    assert stats.entries == 1
+    assert stats.bytes == 10
+    assert cache.get("b")[0] is True
+
+
+@pytest.mark.parametrize(
+    "local_ttl, key_ttl, excepted",
+    [(None, None, None), (10.0, None, 10.0), (10.0, 2.0, 2.0), (1.0, 2.0, 1.0)],
+)
+def testLocalCache_shouldExpireNoLaterThanBothTtl(
+    local_ttl: float, key_ttl: float, excepted: float
+) -> None:
+    # Arrange
+    cache = LocalCache(ttl=local_ttl)
+
+    # Act
+    cache.set("key", b"value", ttl=key_ttl)
+
+    # Assert
+    _, expires_at, _ = cache._entries["key"]  # pyright: ignore
+    if excepted is None:
+        assert expires_at is None
+    else:
+        assert abs(expires_at - mod_time.monotonic() - excepted) < 0.1
+
+
+def testLocalCache_shouldNotStore_whenInvalidatedDuringFetch() -> None:
+    # Arrange
+    cache = LocalCache()
+    generation: int = cache.generation
+
+    # Act
+    cache.invalidate("key")
+    stored: bool = cache.set("key", b"stale", generation=generation)
+
+    # Assert
+    assert stored is False
+    assert cache.get("key") == (False, None)
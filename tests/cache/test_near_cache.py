@@ -0,0 +1,94 @@
+import pytest
+import asyncio
+
+
+from aiorediantic import (
+    RedisClient,
+    StringModel,
+    LocalCache,
+    NegativeCache,
+    NearCacheInvalidator,
+)
+from aiorediantic.cache.near_cache import key_pattern
+from aiorediantic.types import StrReturn
+
+
+def testKeyPattern_shouldReplaceFieldsWithWildcard_whenKeyFormatHasFields() -> None:
+    # Act
+    actual = key_pattern("user:{id}:profile:{name}")
+
+    # Assert
+    assert actual == "user:*:profile:*"
+
+
+def testKeyPattern_shouldEscapeGlobCharacters_whenKeyFormatContainsThem() -> None:
+    # Act
+    actual = key_pattern("tag[{id}]?*")
+
+    # Assert
+    assert actual == "tag\\[*\\]\\?\\*"
+
+
+@pytest.mark.asyncio
+async def testNearCacheInvalidator_shouldCollectCachesAndPatterns_whenCreated(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = LocalCache()
+    negative = NegativeCache()
+    user = StringModel(redisClient=redis_client, keyFormat="user:{id}", localCache=cache, negativeCache=negative)  # type: ignore
+    name = StringModel(redisClient=redis_client, keyFormat="name:{id}", localCache=cache)  # type: ignore
+
+    # Act
+    invalidator = NearCacheInvalidator(redis_client, [user, name])
+
+    # Assert
+    assert invalidator.caches == [cache, negative]
+    assert invalidator.patterns == ["__keyspace@0__:name:*", "__keyspace@0__:user:*"]
+
+
+@pytest.mark.asyncio
+async def testNearCacheInvalidator_shouldInvalidateLocalCache_whenKeyChangedByAnotherClient(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = LocalCache()
+    key = StringModel(redisClient=redis_client, keyFormat="near:{keyname}", localCache=cache)  # type: ignore
+    obj: StringModel = key(keyname="near-cache-key")
+    invalidator = NearCacheInvalidator(redis_client, [key], configure_server=True)
+    invalidator.start()
+    for _ in range(100):
+        if invalidator.stats().subscribed:
+            break
+        await asyncio.sleep(0.01)
+    await obj.set("value", ex=5)
+    await obj.get()
+
+    # Act
+    await obj.client.set(obj.redisKey, "changed")  # pyright: ignore
+    for _ in range(100):
+        if invalidator.stats().invalidations:
+            break
+        await asyncio.sleep(0.01)
+    actual: StrReturn = await obj.get()
+
+    # Assert
+    assert actual == "changed"
+    await invalidator.stop()
+    assert invalidator.running is False
+
+
+@pytest.mark.asyncio
+async def testNearCacheInvalidator_shouldStop_whenClientIsClosed(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="near:{keyname}", localCache=LocalCache())  # type: ignore
+    invalidator = NearCacheInvalidator(redis_client, [key], reconnect_delay=0.01)
+    invalidator.start()
+
+    # Act
+    await redis_client.aclose()
+
+    # Assert
+    assert invalidator.running is False
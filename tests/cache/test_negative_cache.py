@@ -0,0 +1,52 @@
+import pytest
+import time as mod_time
+
+
+from aiorediantic import NegativeCache
+
+
+def testNegativeCache_shouldContainKey_whenAdded() -> None:
+    # Arrange
+    cache = NegativeCache()
+
+    # Act
+    cache.add("missing-key")
+
+    # Assert
+    assert cache.contains("missing-key") is True
+    assert cache.contains("other-key") is False
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def testNegativeCache_shouldForgetKey_afterTtl() -> None:
+    # Arrange
+    cache = NegativeCache(ttl=0.01)
+    cache.add("missing-key")
+
+    # Act
+    mod_time.sleep(0.02)
+
+    # Assert
+    assert cache.contains("missing-key") is False
+
+
+def testNegativeCache_shouldForgetKey_whenInvalidated() -> None:
+    # Arrange
+    cache = NegativeCache()
+    cache.add("missing-key")
+
+    # Act
+    cache.invalidate("missing-key")
+
+    # Assert
+    assert cache.contains("missing-key") is False
+
+
+def testNegativeCache_shouldRaiseValueError_whenTtlIsNotPositive() -> None:
+    # Act
+    with pytest.raises(ValueError) as ex_info:
+        NegativeCache(ttl=0)
+
+    # Assert
+    assert ex_info.type == ValueError
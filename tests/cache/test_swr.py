@@ -0,0 +1,142 @@
+import pytest
+import asyncio
+import time as mod_time
+
+
+from aiorediantic import RedisClient, StringModel, IntModel, stale_while_revalidate
+from aiorediantic.cache.swr import pack, unpack, should_refresh
+
+
+def testPack_shouldRoundTrip_whenValueContainsSeparator() -> None:
+    # Act
+    actual = unpack(pack("a:b:c", 0.25, 1700000000.5))
+
+    # Assert
+    assert actual == (0.25, 1700000000.5, "a:b:c")
+
+
+def testUnpack_shouldReturnNone_whenValueIsNotAnEnvelope() -> None:
+    # Act
+    actual = unpack("plain value")
+
+    # Assert
+    assert actual is None
+
+
+def testShouldRefresh_shouldReturnTrue_whenSoftExpiryPassed() -> None:
+    # Act
+    actual = should_refresh(delta=0.0, expiry=100.0, now=100.0)
+
+    # Assert
+    assert actual is True
+
+
+def testShouldRefresh_shouldReturnFalse_whenFarFromSoftExpiry() -> None:
+    # Act
+    actual = should_refresh(delta=0.1, expiry=1000.0, now=100.0, rand=lambda: 0.5)
+
+    # Assert
+    assert actual is False
+
+
+def testShouldRefresh_shouldRefreshEarlier_whenComputationIsSlower() -> None:
+    # Arrange
+    draws = [i / 1000 for i in range(1000)]
+
+    # Act
+    fast = sum(should_refresh(0.1, 100.5, now=100.0, rand=lambda: d) for d in draws)
+    slow = sum(should_refresh(1.0, 100.5, now=100.0, rand=lambda: d) for d in draws)
+
+    # Assert
+    assert 0 < fast < slow < 1000
+
+
+@pytest.mark.asyncio
+async def testStaleWhileRevalidate_shouldCallFunctionOnce_whenValueIsFresh(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    calls: list[int] = []
+    key = IntModel(redisClient=redis_client, keyFormat="swr:{user_id}")
+
+    @stale_while_revalidate(key, ttl=60, stale_ttl=60)
+    async def load(user_id: int) -> int:
+        calls.append(user_id)
+        return user_id * 10
+
+    await load.invalidate(1)  # type: ignore
+
+    # Act
+    first = await load(1)
+    second = await load(1)
+
+    # Assert
+    assert first == 10
+    assert second == 10
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def testStaleWhileRevalidate_shouldServeStaleAndRefresh_whenSoftExpired(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    calls: list[str] = []
+    key = StringModel(redisClient=redis_client, keyFormat="swr:{name}")
+
+    @stale_while_revalidate(key, ttl=0, stale_ttl=60)
+    async def load(name: str) -> str:
+        calls.append(name)
+        return f"{name}-{len(calls)}"
+
+    await load.invalidate("stale")  # type: ignore
+    await load("stale")
+
+    # Act
+    stale = await load("stale")
+    for _ in range(100):
+        if len(calls) == 2:
+            break
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+    raw = await key(name="stale").get()
+
+    # Assert
+    assert stale == "stale-1"
+    assert calls == ["stale", "stale"]
+    assert isinstance(raw, str) and raw.endswith(":stale-2")
+    assert unpack(raw)[1] <= mod_time.time()  # type: ignore
+
+
+@pytest.mark.asyncio
+async def testStaleWhileRevalidate_shouldKeepNewerValue_whenRefreshIsSlower(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    release = asyncio.Event()
+    calls: list[str] = []
+    key = StringModel(redisClient=redis_client, keyFormat="swr:{name}")
+
+    @stale_while_revalidate(key, ttl=0, stale_ttl=60)
+    async def load(name: str) -> str:
+        calls.append(name)
+        if len(calls) > 1:
+            await release.wait()
+        return f"{name}-{len(calls)}"
+
+    await load.invalidate("slow")  # type: ignore
+    await load("slow")
+    await load("slow")
+    for _ in range(100):
+        if len(calls) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    # Act
+    await key(name="slow").set(pack("newer", 0.0, mod_time.time() + 60))
+    release.set()
+    await asyncio.sleep(0.05)
+
+    # Assert
+    assert calls == ["slow", "slow"]
+    assert unpack(str(await key(name="slow").get()))[2] == "newer"  # type: ignore
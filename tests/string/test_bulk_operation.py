@@ -0,0 +1,94 @@
+import pytest
+from typing import Any, List
+
+
+from aiorediantic import (
+    RedisClient,
+    RedisConfig,
+    StringModel,
+    IntModel,
+    BoolModel,
+    InvalidOptionsCombinationException,
+    get_many,
+    getex_many,
+    set_many,
+)
+from ..conftest import conf, high_version
+
+
+@pytest.mark.asyncio
+async def testSetManyOperation_shouldSetAllValues_whenObjectsHaveDifferentTypes(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    string = StringModel(redisClient=redis_client, keyFormat="bulk-string-{id}")
+    integer = IntModel(redisClient=redis_client, keyFormat="bulk-int-{id}")
+    boolean = BoolModel(redisClient=redis_client, keyFormat="bulk-bool-{id}")
+
+    # Act
+    actual: List[Any] = await set_many(
+        [(string(id=1), "value"), (integer(id=1), 12), (boolean(id=1), True)], ex=5
+    )
+
+    # Assert
+    assert actual == [True, True, 1]
+    assert await string(id=1).get() == "value"
+    assert await integer(id=1).get() == 12
+    assert await boolean(id=1).get() is True
+
+
+@pytest.mark.asyncio
+async def testGetManyOperation_shouldReturnTypedValues_inOrderOfObjects(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    integer = IntModel(redisClient=redis_client, keyFormat="bulk-get-int-{id}")
+    await integer(id=1).set(1, ex=5)
+    await integer(id=3).set(3, ex=5)
+
+    # Act
+    actual: List[Any] = await get_many([integer(id=i) for i in range(1, 4)])
+
+    # Assert
+    assert actual == [1, False, 3]
+    assert type(actual[0]) == int
+
+
+@pytest.mark.asyncio
+async def testGetManyOperation_shouldRaiseException_whenObjectsUseDifferentClients() -> (
+    None
+):
+    # Arrange
+    first = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    second = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    objs = [
+        StringModel(redisClient=first, keyFormat="bulk-{id}")(id=1),
+        StringModel(redisClient=second, keyFormat="bulk-{id}")(id=2),
+    ]
+
+    # Act
+    with pytest.raises(InvalidOptionsCombinationException) as ex_info:
+        await get_many(objs)
+
+    # Assert
+    assert ex_info.type == InvalidOptionsCombinationException
+
+
+@pytest.mark.asyncio
+async def testGetExManyOperation_shouldReturnValuesAndSetExpiry_inOrderOfObjects(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    integer = IntModel(redisClient=redis_client, keyFormat="bulk-getex-int-{id}")
+    await integer(id=1).set(1)
+    await integer(id=3).set(3)
+
+    # Act
+    actual: List[Any] = await getex_many(
+        [integer(id=i) for i in range(1, 4)], ex=100
+    )
+
+    # Assert
+    assert actual == [1, False, 3]
+    assert 0 < await integer(id=1).ttl() <= 100
+    assert 0 < await integer(id=3).ttl() <= 100
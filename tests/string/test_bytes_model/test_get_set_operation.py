@@ -0,0 +1,154 @@
+import pytest
+from array import array
+from aioredis.connection import Connection
+
+
+from aiorediantic import RedisClient, BytesModel, InvalidArgumentTypeException
+
+
+@pytest.mark.asyncio
+async def testBytesSetOperation_shouldRaiseException_whenValueIsStr(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bytesKey = BytesModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BytesModel = bytesKey(keyname="bytes-set-str")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException):
+        await obj.set("value")  # type: ignore
+
+
+@pytest.mark.asyncio
+async def testBytesEncode_shouldNotCopy_whenBytearrayPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    obj = BytesModel(redisClient=redis_client, keyFormat="bytes-encode")
+    value = bytearray(b"\x00\x01\x02")
+
+    # Act
+    actual = obj._encode(value)
+
+    # Assert
+    assert isinstance(actual, memoryview)
+    assert actual.obj is value
+
+
+@pytest.mark.asyncio
+async def testBytesEncode_shouldFrameByteLength_whenTypedMemoryviewPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    obj = BytesModel(redisClient=redis_client, keyFormat="bytes-encode-typed")
+    value = array("i", [1, 2, 3])
+
+    # Act
+    actual = obj._encode(memoryview(value))
+    command = b"".join(
+        bytes(part) for part in Connection().pack_command("SET", "k", actual)
+    )
+
+    # Assert
+    assert len(actual) == len(value.tobytes())
+    assert command.endswith(
+        b"$%d\r\n" % len(value.tobytes()) + value.tobytes() + b"\r\n"
+    )
+
+
+@pytest.mark.asyncio
+async def testBytesGetOperation_shouldReturnSameBytes_whenSetTypedMemoryview(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bytesKey = BytesModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BytesModel = bytesKey(keyname="bytes-get-typed")
+    value = array("i", [1, -2, 3])
+    await obj.set(memoryview(value))
+
+    # Act
+    actual = await obj.get()
+
+    # Assert
+    assert actual == value.tobytes()
+
+
+@pytest.mark.asyncio
+async def testBytesParseRes_shouldReturnRawBytes_whenReplyIsBinary(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    obj = BytesModel(redisClient=redis_client, keyFormat="bytes-parse")
+    value = b"\xff\x00\xfe"
+
+    # Act
+    actual = obj._parse_res(value)
+
+    # Assert
+    assert actual is value
+
+
+@pytest.mark.asyncio
+async def testBytesGetOperation_shouldReturnBinaryValue_whenSetMemoryview(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bytesKey = BytesModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BytesModel = bytesKey(keyname="bytes-get-memoryview")
+    value = bytes(range(256))
+    await obj.set(memoryview(value))
+
+    # Act
+    actual = await obj.get()
+
+    # Assert
+    assert actual == value
+
+
+@pytest.mark.asyncio
+async def testBytesGetOperation_shouldReturnEmptyBytes_whenSetEmptyValue(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bytesKey = BytesModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BytesModel = bytesKey(keyname="bytes-get-empty")
+    await obj.set(b"")
+
+    # Act
+    actual = await obj.get()
+
+    # Assert
+    assert actual == b""
+
+
+@pytest.mark.asyncio
+async def testBytesGetOperation_shouldReturnNone_whenKeyNotExist(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bytesKey = BytesModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BytesModel = bytesKey(keyname="bytes-get-missing")
+    await obj.delete()
+
+    # Act
+    actual = await obj.get()
+
+    # Assert
+    assert actual is None
+
+
+@pytest.mark.asyncio
+async def testBytesAppendOperation_shouldExtendValue_whenBytearrayPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    bytesKey = BytesModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: BytesModel = bytesKey(keyname="bytes-append")
+    await obj.set(b"\x00\x01")
+
+    # Act
+    length: int = await obj.append(bytearray(b"\x02"))
+
+    # Assert
+    assert length == 3
+    assert await obj.getrange(0, -1) == b"\x00\x01\x02"
@@ -0,0 +1,97 @@
+import pytest
+from typing import Any
+from dirty_equals import IsFloat
+
+
+from aiorediantic import (
+    RedisClient,
+    FloatModel,
+    InvalidArgumentTypeException,
+    OldRedisVersionException,
+)
+
+
+@pytest.mark.asyncio
+async def testFloatIncrbyfloatOperation_shouldAddAmount_whenKeyExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    floatKey = FloatModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: FloatModel = floatKey(keyname="float-incrbyfloat-exists")
+    await obj.set(10.5, ex=5)
+
+    # Act
+    actual: float = await obj.incrbyfloat(0.25)
+
+    # Assert
+    expected = 10.75
+    assert actual == IsFloat & expected
+    assert await obj.get() == 10.75
+
+
+@pytest.mark.asyncio
+async def testFloatIncrbyfloatOperation_shouldSubtract_whenAmountIsNegative(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    floatKey = FloatModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: FloatModel = floatKey(keyname="float-incrbyfloat-negative")
+    await obj.set(1.5, ex=5)
+
+    # Act
+    actual: float = await obj.incrbyfloat(-1.5)
+
+    # Assert
+    assert type(actual) == float
+    assert actual == 0.0
+
+
+@pytest.mark.asyncio
+async def testFloatIncrbyfloatOperation_shouldSetExpiry_whenIncrementCreatesKey(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    floatKey = FloatModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: FloatModel = floatKey(keyname="float-incrbyfloat-ex-new")
+    await obj.delete()
+
+    # Act
+    actual: float = await obj.incrbyfloat(2.5, ex=100)
+
+    # Assert
+    expected = 2.5
+    assert actual == IsFloat & expected
+    assert 95 < await obj.ttl() <= 100
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("amount", [None, "1.5", b"1", True])
+async def testFloatIncrbyfloatOperation_shouldRaiseInvalidArgumentTypeException_whenAmountIsNotNumber(
+    redis_client: RedisClient, amount: Any
+) -> None:
+    # Arrange
+    floatKey = FloatModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: FloatModel = floatKey(keyname="float-incrbyfloat-wrong-type")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as exc_info:
+        await obj.incrbyfloat(amount)
+
+    # Assert
+    assert exc_info.type == InvalidArgumentTypeException
+
+
+@pytest.mark.asyncio
+async def testFloatIncrbyfloatOperation_shouldRaiseOldRedisVersionException_whenUsedInOldRedisVersion(
+    redis_client_1_2_0: RedisClient,
+) -> None:
+    # Arrange
+    floatKey = FloatModel(redisClient=redis_client_1_2_0, keyFormat="{keyname}")
+    obj: FloatModel = floatKey(keyname="float-incrbyfloat-old-version")
+
+    # Act
+    with pytest.raises(OldRedisVersionException) as exc_info:
+        await obj.incrbyfloat(1.5)
+
+    # Assert
+    assert exc_info.type == OldRedisVersionException
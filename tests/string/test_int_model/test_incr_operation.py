@@ -0,0 +1,169 @@
+import pytest
+from typing import Any
+from datetime import timedelta
+from dirty_equals import IsInt
+
+
+from aiorediantic import (
+    RedisClient,
+    IntModel,
+    InvalidArgumentTypeException,
+    InvalidOptionsCombinationException,
+    OldRedisVersionException,
+)
+
+
+@pytest.mark.asyncio
+async def testIntIncrOperation_shouldReturnOne_whenKeyNotExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-incr-not-exists")
+    await obj.delete()
+
+    # Act
+    actual: int = await obj.incr()
+
+    # Assert
+    expected = 1
+    assert actual == IsInt & expected
+    assert await obj.ttl() == -1
+
+
+@pytest.mark.asyncio
+async def testIntIncrbyOperation_shouldAddAmount_whenKeyExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-incrby-exists")
+    await obj.set(40, ex=5)
+
+    # Act
+    actual: int = await obj.incrby(2)
+
+    # Assert
+    expected = 42
+    assert actual == IsInt & expected
+    assert await obj.get() == 42
+
+
+@pytest.mark.asyncio
+async def testIntDecrOperation_shouldReturnZero_whenValueIsOne(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-decr-exists")
+    await obj.set(1, ex=5)
+
+    # Act
+    actual: int = await obj.decr()
+
+    # Assert
+    assert type(actual) == int
+    assert actual == 0
+
+
+@pytest.mark.asyncio
+async def testIntDecrbyOperation_shouldSubtractAmount_whenKeyExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-decrby-exists")
+    await obj.set(10, ex=5)
+
+    # Act
+    actual: int = await obj.decrby(15)
+
+    # Assert
+    expected = -5
+    assert actual == IsInt & expected
+
+
+@pytest.mark.asyncio
+async def testIntIncrOperation_shouldSetExpiry_whenIncrementCreatesKey(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-incr-ex-new")
+    await obj.delete()
+
+    # Act
+    first: int = await obj.incr(ex=timedelta(seconds=100))
+    second: int = await obj.incrby(2, px=5000)
+
+    # Assert
+    assert first == 1
+    assert second == 3
+    assert 95 < await obj.ttl() <= 100
+
+
+@pytest.mark.asyncio
+async def testIntIncrOperation_shouldKeepNoExpiry_whenKeyExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-incr-ex-exists")
+    await obj.set(5)
+
+    # Act
+    actual: int = await obj.incr(ex=100)
+
+    # Assert
+    assert actual == 6
+    assert await obj.ttl() == -1
+    await obj.delete()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("amount", [None, "1", 1.5, True])
+async def testIntIncrbyOperation_shouldRaiseInvalidArgumentTypeException_whenAmountIsNotInt(
+    redis_client: RedisClient, amount: Any
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-incrby-wrong-type")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as exc_info:
+        await obj.incrby(amount)
+
+    # Assert
+    assert exc_info.type == InvalidArgumentTypeException
+
+
+@pytest.mark.asyncio
+async def testIntIncrOperation_shouldRaiseInvalidOptionsCombinationException_whenExAndPxPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-incr-ex-px")
+
+    # Act
+    with pytest.raises(InvalidOptionsCombinationException) as exc_info:
+        await obj.incr(ex=1, px=1000)
+
+    # Assert
+    assert exc_info.type == InvalidOptionsCombinationException
+
+
+@pytest.mark.asyncio
+async def testIntIncrOperation_shouldRaiseOldRedisVersionException_whenExPassInOldRedisVersion(
+    redis_client_1_2_0: RedisClient,
+) -> None:
+    # Arrange
+    intKey = IntModel(redisClient=redis_client_1_2_0, keyFormat="{keyname}")
+    obj: IntModel = intKey(keyname="int-incr-ex-old-version")
+
+    # Act
+    with pytest.raises(OldRedisVersionException) as exc_info:
+        await obj.incr(ex=1)
+
+    # Assert
+    assert exc_info.type == OldRedisVersionException
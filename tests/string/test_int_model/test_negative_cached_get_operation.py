@@ -0,0 +1,45 @@
+import pytest
+
+
+from aiorediantic import RedisClient, IntModel, NegativeCache
+from aiorediantic.types import IntReturn
+
+
+@pytest.mark.asyncio
+async def testNegativeCachedGetOperation_shouldNotReadRedis_whenKeyKnownMissing(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = NegativeCache(ttl=5)
+    key = IntModel(redisClient=redis_client, keyFormat="{keyname}", negativeCache=cache)
+    obj: IntModel = key(keyname="negative-cached-get-key")
+    await obj.delete()
+    await obj.get()
+    # create the key behind the cache
+    await obj.client.set(obj.redisKey, 1, ex=5)  # pyright: ignore
+
+    # Act
+    actual: IntReturn = await obj.get()
+
+    # Assert
+    assert actual is False
+    assert cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def testNegativeCachedGetOperation_shouldReadRedis_whenKeyIsSetLocally(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = NegativeCache(ttl=5)
+    key = IntModel(redisClient=redis_client, keyFormat="{keyname}", negativeCache=cache)
+    obj: IntModel = key(keyname="negative-cached-get-key-set")
+    await obj.delete()
+    await obj.get()
+
+    # Act
+    await obj.set(10, ex=5)
+    actual: IntReturn = await obj.get()
+
+    # Assert
+    assert actual == 10
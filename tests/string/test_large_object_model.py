@@ -0,0 +1,139 @@
+import pytest
+import asyncio
+import os
+from typing import Any, Optional
+
+
+from aiorediantic import (
+    RedisClient,
+    LargeObjectModel,
+    InvalidArgumentTypeException,
+)
+
+
+@pytest.mark.asyncio
+async def testLargeObjectModel_shouldRoundTripPayload_acrossChunks(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    objectKey = LargeObjectModel(redisClient=redis_client, keyFormat="{keyname}", chunkSize=1000, parallelism=3)  # type: ignore
+    obj: LargeObjectModel = objectKey(keyname="large-object")
+    payload = os.urandom(10_500)
+
+    # Act
+    await obj.set(memoryview(payload), ex=5)
+    actual: Optional[bytearray] = await obj.get()
+
+    # Assert
+    assert isinstance(actual, bytearray)
+    assert actual == payload
+    assert await obj.delete() == 1
+    assert await obj.get() is None
+
+
+@pytest.mark.asyncio
+async def testLargeObjectModel_shouldExpireOldChunks_whenObjectReplaced(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    objectKey = LargeObjectModel(redisClient=redis_client, keyFormat="{keyname}", chunkSize=4)  # type: ignore
+    obj: LargeObjectModel = objectKey(keyname="large-object-replace")
+    await obj.set(b"first value")
+    version = str(await obj.client.get(obj.redisKey), "utf-8").split(":")[0]  # pyright: ignore
+
+    # Act
+    await obj.set(b"second value")
+
+    # Assert
+    assert await obj.get() == b"second value"
+    assert 0 < await obj.client.ttl(obj.chunk_key(version, 0)) <= obj.oldVersionGrace  # pyright: ignore
+    await obj.delete()
+
+
+@pytest.mark.asyncio
+async def testLargeObjectModel_shouldNeverReturnPartialObject_whenWrittenConcurrently(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    objectKey = LargeObjectModel(redisClient=redis_client, keyFormat="{keyname}", chunkSize=64)  # type: ignore
+    obj: LargeObjectModel = objectKey(keyname="large-object-concurrent")
+    payloads = [bytes([i]) * 1000 for i in range(10)]
+    await obj.set(payloads[0], ex=5)
+
+    # Act
+    results: Any = await asyncio.gather(
+        *(obj.set(payload, ex=5) for payload in payloads[1:]),
+        *(obj.get() for _ in range(20)),
+    )
+
+    # Assert
+    assert all(result in payloads for result in results[9:])
+
+
+@pytest.mark.asyncio
+async def testLargeObjectModel_shouldReturnNone_whenChunkIsGoneUnderLiveManifest(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    objectKey = LargeObjectModel(redisClient=redis_client, keyFormat="{keyname}", chunkSize=4)  # type: ignore
+    obj: LargeObjectModel = objectKey(keyname="large-object-expired-chunk")
+    await obj.set(b"0123456789", ex=5)
+    manifest: Any = obj._manifest(await obj.execute_command("GET", obj.redisKey))
+    await obj.execute_command("DEL", obj._chunk_keys(manifest)[1])
+
+    # Act
+    actual: Optional[bytearray] = await obj.get()
+
+    # Assert
+    assert actual is None
+
+
+@pytest.mark.asyncio
+async def testLargeObjectModel_shouldExpireChunksAfterManifest_whenExPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    objectKey = LargeObjectModel(redisClient=redis_client, keyFormat="{keyname}", chunkSize=4)  # type: ignore
+    obj: LargeObjectModel = objectKey(keyname="large-object-chunk-ttl")
+
+    # Act
+    await obj.set(b"0123456789", ex=5)
+
+    # Assert
+    manifest: Any = obj._manifest(await obj.execute_command("GET", obj.redisKey))
+    for key in obj._chunk_keys(manifest):
+        assert await obj.execute_command("TTL", key) > await obj.execute_command(
+            "TTL", obj.redisKey
+        )
+
+
+@pytest.mark.asyncio
+async def testLargeObjectModel_shouldReturnEmptyBytearray_whenPayloadIsEmpty(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    objectKey = LargeObjectModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: LargeObjectModel = objectKey(keyname="large-object-empty")
+
+    # Act
+    await obj.set(b"", ex=5)
+
+    # Assert
+    assert await obj.get() == bytearray()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", [None, "text", 12])
+async def testLargeObjectModel_shouldRaiseInvalidArgumentTypeException_whenValueIsNotBinary(
+    redis_client: RedisClient, value: Any
+) -> None:
+    # Arrange
+    objectKey = LargeObjectModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: LargeObjectModel = objectKey(keyname="large-object-wrong-type")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as exc_info:
+        await obj.set(value)
+
+    # Assert
+    assert exc_info.type == InvalidArgumentTypeException
@@ -0,0 +1,123 @@
+import pytest
+from typing import List
+from pydantic import BaseModel
+
+
+from aiorediantic import (
+    RedisClient,
+    PydanticModel,
+    CodecNotAvailableException,
+    InvalidArgumentTypeException,
+    get_many,
+    set_many,
+)
+
+
+class Profile(BaseModel):
+    name: str
+    tags: List[str] = []
+
+
+class Other(BaseModel):
+    name: str
+
+
+@pytest.mark.asyncio
+async def testPydanticModel_shouldPinDefaultCodec_whenCodecIsNone(
+    redis_client: RedisClient,
+) -> None:
+    # Act
+    obj = PydanticModel(
+        redisClient=redis_client, keyFormat="profile", valueType=Profile
+    )
+
+    # Assert
+    assert obj.codec in ("orjson", "msgpack", "json")
+
+
+@pytest.mark.asyncio
+async def testPydanticModel_shouldRaiseException_whenCodecIsNotRegistered(
+    redis_client: RedisClient,
+) -> None:
+    # Act
+    with pytest.raises(CodecNotAvailableException):
+        PydanticModel(
+            redisClient=redis_client,
+            keyFormat="profile",
+            valueType=Profile,
+            codec="not-registered",
+        )
+
+
+@pytest.mark.asyncio
+async def testPydanticSetOperation_shouldRaiseException_whenValueIsOtherType(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    profileKey = PydanticModel(
+        redisClient=redis_client, keyFormat="{keyname}", valueType=Profile
+    )
+    obj: PydanticModel = profileKey(keyname="pydantic-set-other")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException):
+        await obj.set(Other(name="other"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", ["json", "pickle"])
+async def testPydanticGetOperation_shouldReturnModel_whenValueIsSet(
+    redis_client: RedisClient, codec: str
+) -> None:
+    # Arrange
+    profileKey = PydanticModel(
+        redisClient=redis_client, keyFormat="{keyname}", valueType=Profile, codec=codec
+    )
+    obj: PydanticModel = profileKey(keyname="pydantic-get")
+    value = Profile(name="name", tags=["a", "b"])
+    await obj.set(value)
+
+    # Act
+    actual = await obj.get()
+
+    # Assert
+    assert actual == value
+
+
+@pytest.mark.asyncio
+async def testPydanticGetOperation_shouldReturnNone_whenKeyNotExist(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    profileKey = PydanticModel(
+        redisClient=redis_client, keyFormat="{keyname}", valueType=Profile
+    )
+    obj: PydanticModel = profileKey(keyname="pydantic-get-missing")
+    await obj.delete()
+
+    # Act
+    actual = await obj.get()
+
+    # Assert
+    assert actual is None
+
+
+@pytest.mark.asyncio
+async def testPydanticGetManyOperation_shouldReturnModels_whenSetMany(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    profileKey = PydanticModel(
+        redisClient=redis_client, keyFormat="{keyname}", valueType=Profile
+    )
+    objs: List[PydanticModel] = [
+        profileKey(keyname=f"pydantic-many-{i}") for i in range(3)
+    ]
+    values = [Profile(name=str(i)) for i in range(3)]
+    await set_many(list(zip(objs, values)))
+
+    # Act
+    actual = await get_many(objs)
+
+    # Assert
+    assert actual == values
@@ -0,0 +1,84 @@
+import pytest
+
+
+from aiorediantic import RedisClient, ShardedIntModel
+
+
+@pytest.mark.asyncio
+async def testShardedIntExpireOperation_shouldSetTimeoutOnEveryShard_whenShardsExist(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=4)  # type: ignore
+    obj: ShardedIntModel = counterKey(keyname="sharded-expire")
+    await obj.delete()
+    for i in range(4):
+        await obj.incr(hashKey=i)
+
+    # Act
+    actual = await obj.expire(100)
+
+    # Assert
+    assert actual == 1
+    assert 95 < await obj.ttl() <= 100
+    for i in range(4):
+        assert await obj.shard(i).ttl() in (-2, *range(96, 101))
+    await obj.delete()
+
+
+@pytest.mark.asyncio
+async def testShardedIntPersistOperation_shouldRemoveTimeout_whenShardsExpire(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=4)  # type: ignore
+    obj: ShardedIntModel = counterKey(keyname="sharded-persist")
+    await obj.delete()
+    await obj.incrby(5, ex=100)
+
+    # Act
+    actual = await obj.persist()
+
+    # Assert
+    assert actual == 1
+    assert await obj.ttl() == -1
+    assert await obj.get() == 5
+    await obj.delete()
+
+
+@pytest.mark.asyncio
+async def testShardedIntIncrOperation_shouldSetTimeout_whenIncrementCreatesShard(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=4)  # type: ignore
+    obj: ShardedIntModel = counterKey(keyname="sharded-incr-ex")
+    await obj.delete()
+
+    # Act
+    await obj.incr(hashKey="worker-1", ex=100)
+
+    # Assert
+    assert 95 < await obj.ttl() <= 100
+    await obj.delete()
+
+
+@pytest.mark.asyncio
+async def testShardedIntExistsOperation_shouldReturnZero_whenNoShardExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=4)  # type: ignore
+    obj: ShardedIntModel = counterKey(keyname="sharded-exists")
+    await obj.delete()
+
+    # Act
+    before = await obj.exists()
+    await obj.incr()
+    after = await obj.exists()
+
+    # Assert
+    assert before == 0
+    assert after == 1
+    assert await obj.ttl() == -1
+    await obj.delete()
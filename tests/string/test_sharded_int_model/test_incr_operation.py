@@ -0,0 +1,94 @@
+import pytest
+from typing import Any
+
+
+from aiorediantic import (
+    RedisClient,
+    ShardedIntModel,
+    InvalidArgumentTypeException,
+)
+
+
+@pytest.mark.asyncio
+async def testShardedIntModel_shouldBuildShardKeys_fromRedisKey(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="hits:{route}", shards=3)  # type: ignore
+
+    # Act
+    actual = counterKey(route="home").shard_keys()
+
+    # Assert
+    assert actual == ["hits:home:shard:0", "hits:home:shard:1", "hits:home:shard:2"]
+
+
+@pytest.mark.asyncio
+async def testShardedIntIncrOperation_shouldSumAllShards_whenIncrementedManyTimes(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=4)  # type: ignore
+    obj: ShardedIntModel = counterKey(keyname="sharded-incr")
+    await obj.delete()
+
+    # Act
+    for _ in range(100):
+        await obj.incr()
+    await obj.incrby(10)
+    await obj.decrby(5)
+    await obj.decr()
+
+    # Assert
+    assert await obj.get() == 104
+    assert await obj.delete() > 1
+
+
+@pytest.mark.asyncio
+async def testShardedIntIncrOperation_shouldUseSameShard_whenHashKeyIsSame(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=16)  # type: ignore
+    obj: ShardedIntModel = counterKey(keyname="sharded-hashed")
+    await obj.delete()
+
+    # Act
+    values = [await obj.incr(hashKey="worker-1") for _ in range(5)]
+
+    # Assert
+    assert values == [1, 2, 3, 4, 5]
+    assert await obj.get() == 5
+
+
+@pytest.mark.asyncio
+async def testShardedIntGetOperation_shouldReturnZero_whenNoShardExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: ShardedIntModel = counterKey(keyname="sharded-not-exists")
+
+    # Act
+    actual: int = await obj.get()
+
+    # Assert
+    assert type(actual) == int
+    assert actual == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("amount", [None, "1", 1.5, True])
+async def testShardedIntIncrbyOperation_shouldRaiseInvalidArgumentTypeException_whenAmountIsNotInt(
+    redis_client: RedisClient, amount: Any
+) -> None:
+    # Arrange
+    counterKey = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: ShardedIntModel = counterKey(keyname="sharded-wrong-type")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as exc_info:
+        await obj.incrby(amount)
+
+    # Assert
+    assert exc_info.type == InvalidArgumentTypeException
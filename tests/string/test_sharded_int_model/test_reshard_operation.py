@@ -0,0 +1,72 @@
+import pytest
+
+
+from aiorediantic import RedisClient, ShardedIntModel
+
+
+@pytest.mark.asyncio
+async def testShardedIntReshardOperation_shouldKeepCount_whenShardsShrink(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    wide = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=8)  # type: ignore
+    narrow = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=3)  # type: ignore
+    before: ShardedIntModel = wide(keyname="sharded-reshard")
+    after: ShardedIntModel = narrow(keyname="sharded-reshard")
+    await before.delete()
+    for i in range(8):
+        await before.incrby(i + 1, hashKey=i)
+
+    # Act
+    moved = await after.reshard(8)
+
+    # Assert
+    assert moved > 0
+    assert await after.get() == 36
+    assert await before.get() == 36
+    await before.delete()
+
+
+@pytest.mark.asyncio
+async def testShardedIntReshardOperation_shouldKeepCount_whenShardsGrow(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    narrow = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=2)  # type: ignore
+    wide = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=6)  # type: ignore
+    before: ShardedIntModel = narrow(keyname="sharded-grow")
+    after: ShardedIntModel = wide(keyname="sharded-grow")
+    await after.delete()
+    await before.incrby(7)
+
+    # Act
+    moved = await after.reshard(2)
+    await after.incrby(3)
+
+    # Assert
+    assert moved == 0
+    assert await after.get() == 10
+    await after.delete()
+
+
+@pytest.mark.asyncio
+async def testShardedIntGetOperation_shouldCountSurplusShards_whenPreviousShardsIsSet(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    wide = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=8)  # type: ignore
+    narrow = ShardedIntModel(redisClient=redis_client, keyFormat="{keyname}", shards=2, previousShards=8)  # type: ignore
+    before: ShardedIntModel = wide(keyname="sharded-previous")
+    after: ShardedIntModel = narrow(keyname="sharded-previous")
+    await before.delete()
+    for i in range(8):
+        await before.incrby(i + 1, hashKey=i)
+
+    # Act
+    actual = await after.get()
+
+    # Assert
+    assert actual == 36
+    assert await after.reshard() > 0
+    assert await after.get() == 36
+    assert await after.delete() == 8
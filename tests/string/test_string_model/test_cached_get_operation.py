@@ -0,0 +1,82 @@
+import pytest
+
+
+from aiorediantic import RedisClient, StringModel, LocalCache
+from aiorediantic.types import StrReturn
+
+
+@pytest.mark.asyncio
+async def testCachedGetOperation_shouldServeFromLocalCache_whenReadTwice(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = LocalCache()
+    key = StringModel(redisClient=redis_client, keyFormat="{keyname}", localCache=cache)
+    obj: StringModel = key(keyname="cached-get-key")
+    await obj.set("value", ex=5)
+    await obj.get()
+    # change the value behind the cache
+    await obj.client.set(obj.redisKey, "changed")  # pyright: ignore
+
+    # Act
+    actual: StrReturn = await obj.get()
+
+    # Assert
+    assert actual == "value"
+    assert cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def testCachedGetOperation_shouldReadRedis_whenKeyIsSetLocally(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = LocalCache()
+    key = StringModel(redisClient=redis_client, keyFormat="{keyname}", localCache=cache)
+    obj: StringModel = key(keyname="cached-get-key-set")
+    await obj.set("value", ex=5)
+    await obj.get()
+
+    # Act
+    await obj.set("changed", ex=5)
+    actual: StrReturn = await obj.get()
+
+    # Assert
+    assert actual == "changed"
+
+
+@pytest.mark.asyncio
+async def testCachedGetOperation_shouldExpireLocalCopy_whenKeyHasTtl(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = LocalCache()
+    key = StringModel(redisClient=redis_client, keyFormat="{keyname}", localCache=cache)
+    obj: StringModel = key(keyname="cached-get-key-ttl")
+    await obj.set("value", px=200)
+
+    # Act
+    await obj.get()
+
+    # Assert
+    _, expires_at, _ = cache._entries[obj.redisKey]  # pyright: ignore
+    assert expires_at is not None
+
+
+@pytest.mark.asyncio
+async def testCachedGetOperation_shouldReadRedis_whenKeyIsDeletedLocally(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = LocalCache()
+    key = StringModel(redisClient=redis_client, keyFormat="{keyname}", localCache=cache)
+    obj: StringModel = key(keyname="cached-get-key-delete")
+    await obj.set("value", ex=5)
+    await obj.get()
+
+    # Act
+    await obj.delete()
+    actual: StrReturn = await obj.get()
+
+    # Assert
+    assert actual is False
@@ -0,0 +1,42 @@
+import pytest
+import asyncio
+from typing import List
+
+
+from aiorediantic import RedisClient, StringModel
+from aiorediantic.types import StrReturn
+
+
+@pytest.mark.asyncio
+async def testCoalescedGetOperation_shouldSendSingleGet_whenReadConcurrently(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="{keyname}", coalesce=True)
+    obj: StringModel = key(keyname="coalesced-get-key")
+    await obj.set("value", ex=5)
+
+    # Act
+    actual: List[StrReturn] = await asyncio.gather(
+        *(key(keyname="coalesced-get-key").get() for _ in range(20))
+    )
+
+    # Assert
+    assert actual == ["value"] * 20
+    assert redis_client.single_flight.stats().executed == 1
+    assert redis_client.single_flight.stats().coalesced == 19
+
+
+@pytest.mark.asyncio
+async def testCoalescedGetOperation_shouldReturnFalse_whenKeyNotExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="{keyname}", coalesce=True)
+    obj: StringModel = key(keyname="coalesced-get-key-not-exists")
+
+    # Act
+    actual: StrReturn = await obj.get()
+
+    # Assert
+    assert actual is False
@@ -0,0 +1,143 @@
+import pytest
+import json
+from packaging.version import Version
+
+
+from aiorediantic import (
+    RedisClient,
+    StringModel,
+    Compression,
+    DictionaryCompressor,
+    get_many,
+)
+from tests.conftest import high_version
+
+use_version = Version(high_version)
+v6_2_0 = Version("6.2.0")
+text = "compressible text payload " * 100
+
+
+@pytest.mark.asyncio
+async def testStringCompression_shouldStoreCompressedValue_whenValueIsAboveThreshold(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(
+        redisClient=redis_client, keyFormat="{keyname}", compression=Compression()
+    )
+    obj: StringModel = strKey(keyname="str-compression-set")
+
+    # Act
+    await obj.set(text)
+
+    # Assert
+    assert await obj.strlen() < len(text)
+    assert await obj.get() == text
+
+
+@pytest.mark.asyncio
+async def testStringCompression_shouldReadUncompressedValue_whenSetWithoutCompression(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    plain: StringModel = StringModel(redisClient=redis_client, keyFormat="{keyname}")(
+        keyname="str-compression-plain"
+    )
+    compressed: StringModel = StringModel(
+        redisClient=redis_client, keyFormat="{keyname}", compression=Compression()
+    )(keyname="str-compression-plain")
+    await plain.set(text)
+
+    # Act
+    actual = await compressed.get()
+
+    # Assert
+    assert actual == text
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    use_version < v6_2_0,
+    reason="skip test because used version is below 6.2.0 redis version",
+)
+async def testStringCompression_shouldDecompress_whenGetdel(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(
+        redisClient=redis_client, keyFormat="{keyname}", compression=Compression()
+    )
+    obj: StringModel = strKey(keyname="str-compression-getdel")
+    await obj.set(text)
+
+    # Act
+    actual = await obj.getdel()
+
+    # Assert
+    assert actual == text
+    assert await obj.exists() == 0
+
+
+@pytest.mark.asyncio
+async def testStringCompression_shouldDecompress_whenGetMany(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(
+        redisClient=redis_client, keyFormat="{keyname}", compression=Compression()
+    )
+    objs = [strKey(keyname=f"str-compression-many-{i}") for i in range(2)]
+    await objs[0].set(text)
+    await objs[1].set("short")
+
+    # Act
+    actual = await get_many(objs)
+
+    # Assert
+    assert actual == [text, "short"]
+
+
+def document(index: int) -> str:
+    return json.dumps(
+        {"id": index, "name": f"user-{index}", "email": f"user{index}@example.com"}
+    )
+
+
+@pytest.mark.asyncio
+async def testStringDictionaryCompression_shouldReadOldValues_whenDictionaryIsRotated(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    await redis_client.execute_command("DEL", "str-compression-dict")
+    writer = DictionaryCompressor(redis_client, "str-compression-dict")
+    strKey = StringModel(
+        redisClient=redis_client,
+        keyFormat="{keyname}",
+        compression=Compression(writer, threshold=32),
+    )
+    first: StringModel = strKey(keyname="str-compression-dict-1")
+    second: StringModel = strKey(keyname="str-compression-dict-2")
+    await writer.train([document(i).encode() for i in range(100)])
+    await first.set(document(1000))
+    await writer.train([document(i).encode() for i in range(100, 200)])
+    await second.set(document(1001))
+
+    # a reader of another process knows none of the dictionaries yet
+    reader: StringModel = StringModel(
+        redisClient=redis_client,
+        keyFormat="{keyname}",
+        compression=Compression(
+            DictionaryCompressor(redis_client, "str-compression-dict"), threshold=32
+        ),
+    )
+
+    # Act
+    actual = await get_many(
+        [
+            reader(keyname="str-compression-dict-1"),
+            reader(keyname="str-compression-dict-2"),
+        ]
+    )
+
+    # Assert
+    assert actual == [document(1000), document(1001)]
@@ -0,0 +1,136 @@
+import pytest
+from datetime import timedelta
+from packaging.version import Version
+from dirty_equals import IsPositiveInt
+
+
+from aiorediantic import (
+    RedisClient,
+    StringModel,
+    LocalCache,
+    InvalidOptionsCombinationException,
+    OldRedisVersionException,
+)
+from aiorediantic.types import StrReturn
+from tests.conftest import high_version
+
+
+use_version = Version(high_version)
+v6_2_0 = Version("6.2.0")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    use_version < v6_2_0,
+    reason="skip test because used version is below 6.2.0 redis version",
+)
+async def testStringGetExOperation_shouldReturnValueAndSetExpiry_whenExPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-getex-ex")
+    await obj.set("value")
+
+    # Act
+    actual: StrReturn = await obj.getex(ex=timedelta(seconds=100))
+
+    # Assert
+    assert actual == "value"
+    assert await obj.ttl() == IsPositiveInt
+    assert await obj.ttl() <= 100
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    use_version < v6_2_0,
+    reason="skip test because used version is below 6.2.0 redis version",
+)
+async def testStringGetExOperation_shouldRemoveExpiry_whenPersistPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-getex-persist")
+    await obj.set("value", ex=100)
+
+    # Act
+    actual: StrReturn = await obj.getex(persist=True)
+
+    # Assert
+    assert actual == "value"
+    assert await obj.ttl() == -1
+    await obj.delete()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    use_version < v6_2_0,
+    reason="skip test because used version is below 6.2.0 redis version",
+)
+async def testStringGetExOperation_shouldReturnFalse_whenKeyNotExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-getex-not-exists")
+
+    # Act
+    actual: StrReturn = await obj.getex(px=1000)
+
+    # Assert
+    assert actual is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    use_version < v6_2_0,
+    reason="skip test because used version is below 6.2.0 redis version",
+)
+async def testStringGetExOperation_shouldInvalidateLocalCache_whenExpiryChanges(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    cache = LocalCache()
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}", localCache=cache)  # type: ignore
+    obj: StringModel = strKey(keyname="str-getex-cached")
+    await obj.set("value", ex=100)
+    await obj.get()
+
+    # Act
+    await obj.getex(ex=1)
+
+    # Assert
+    assert cache.get(obj.redisKey) == (False, None)
+
+
+@pytest.mark.asyncio
+async def testStringGetExOperation_shouldRaiseInvalidOptionsCombinationException_whenExAndPersistPass(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-getex-ex-persist")
+
+    # Act
+    with pytest.raises(InvalidOptionsCombinationException) as exc_info:
+        await obj.getex(ex=1, persist=True)
+
+    # Assert
+    assert exc_info.type == InvalidOptionsCombinationException
+
+
+@pytest.mark.asyncio
+async def testStringGetExOperation_shouldRaiseOldRedisVersionException_whenUsedInOldRedisVersion(
+    redis_client_2_6_0: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client_2_6_0, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-getex-old-version")
+
+    # Act
+    with pytest.raises(OldRedisVersionException) as exc_info:
+        await obj.getex(ex=1)
+
+    # Assert
+    assert exc_info.type == OldRedisVersionException
@@ -0,0 +1,180 @@
+import pytest
+from typing import List
+
+
+from aiorediantic import (
+    RedisClient,
+    RedisConfig,
+    StringModel,
+    LocalCache,
+    InvalidArgumentTypeException,
+    InvalidOptionsCombinationException,
+    OldRedisVersionException,
+)
+from tests.conftest import conf, high_version
+
+
+@pytest.mark.asyncio
+async def testStringGetRangeOperation_shouldReturnSubstring_whenKeyExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-getrange")
+    await obj.set("Hello World", ex=5)
+
+    # Act
+    head: str = await obj.getrange(0, 4)
+    tail: str = await obj.getrange(-5, -1)
+
+    # Assert
+    assert head == "Hello"
+    assert tail == "World"
+
+
+@pytest.mark.asyncio
+async def testStringGetRangeOperation_shouldReturnEmptyString_whenKeyNotExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-getrange-not-exists")
+
+    # Act
+    actual: str = await obj.getrange(0, 10)
+
+    # Assert
+    assert actual == ""
+
+
+@pytest.mark.asyncio
+async def testStringSetRangeOperation_shouldOverwriteFromOffset(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-setrange")
+    await obj.set("Hello World", ex=5)
+
+    # Act
+    length: int = await obj.setrange(6, "Redis")
+
+    # Assert
+    assert length == 11
+    assert await obj.get() == "Hello Redis"
+
+
+@pytest.mark.asyncio
+async def testStringAppendOperation_shouldAppendValue_andInvalidateLocalCache(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}", localCache=LocalCache())  # type: ignore
+    obj: StringModel = strKey(keyname="str-append")
+    await obj.set("Hello", ex=5)
+    await obj.get()
+
+    # Act
+    length: int = await obj.append(" World")
+
+    # Assert
+    assert length == 11
+    assert await obj.strlen() == 11
+    assert await obj.get() == "Hello World"
+
+
+@pytest.mark.asyncio
+async def testStringAppendOperation_shouldRaiseInvalidArgumentTypeException_whenValueIsNotString(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-append-wrong-type")
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as exc_info:
+        await obj.append(b"bytes")  # type: ignore
+
+    # Assert
+    assert exc_info.type == InvalidArgumentTypeException
+
+
+@pytest.mark.asyncio
+async def testStringIterChunksOperation_shouldStreamValue_inFixedSizeChunks(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-iter-chunks")
+    value = "0123456789" * 1000 + "tail"
+    await obj.set(value, ex=5)
+
+    # Act
+    chunks: List[bytes] = [chunk async for chunk in obj.iter_chunks(4096)]
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [4096, 4096, 1812]
+    assert all(type(chunk) == bytes for chunk in chunks)
+    assert b"".join(chunks).decode() == value
+
+
+@pytest.mark.asyncio
+async def testStringIterChunksOperation_shouldKeepBytes_whenChunkSplitsMultibyteCharacter(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-iter-chunks-multibyte")
+    value = "é€" * 100
+    await obj.set(value, ex=5)
+
+    # Act
+    chunks: List[bytes] = [chunk async for chunk in obj.iter_chunks(4)]
+
+    # Assert
+    assert all(len(chunk) == 4 for chunk in chunks[:-1])
+    assert b"".join(chunks) == value.encode()
+
+
+@pytest.mark.asyncio
+async def testStringIterChunksOperation_shouldRaiseInvalidOptionsCombinationException_whenClientDecodesResponses() -> None:
+    # Arrange
+    async with RedisClient(config=RedisConfig.construct(redis_version=high_version, decode_responses=True, **conf)) as redis:  # type: ignore
+        obj: StringModel = StringModel(redisClient=redis, keyFormat="{keyname}")(
+            keyname="str-iter-chunks-decoded"
+        )
+
+        # Act
+        with pytest.raises(InvalidOptionsCombinationException):
+            [chunk async for chunk in obj.iter_chunks()]
+
+
+@pytest.mark.asyncio
+async def testStringIterChunksOperation_shouldYieldNothing_whenKeyNotExists(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-iter-chunks-not-exists")
+
+    # Act
+    chunks: List[bytes] = [chunk async for chunk in obj.iter_chunks()]
+
+    # Assert
+    assert chunks == []
+
+
+@pytest.mark.asyncio
+async def testStringGetRangeOperation_shouldRaiseOldRedisVersionException_whenUsedInOldRedisVersion(
+    redis_client_1_2_0: RedisClient,
+) -> None:
+    # Arrange
+    strKey = StringModel(redisClient=redis_client_1_2_0, keyFormat="{keyname}")
+    obj: StringModel = strKey(keyname="str-getrange-old-version")
+
+    # Act
+    with pytest.raises(OldRedisVersionException) as exc_info:
+        await obj.getrange(0, 1)
+
+    # Assert
+    assert exc_info.type == OldRedisVersionException
@@ -0,0 +1,185 @@
+import pytest
+from typing import Any
+
+
+from aiorediantic import (
+    RedisClient,
+    IntModel,
+    FloatModel,
+    StringModel,
+    InvalidArgumentTypeException,
+    IncrementBuffer,
+)
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldAddUpIncrements_whenNotFlushed(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = IntModel(redisClient=redis_client, keyFormat="write-behind-{id}")
+    buffer = IncrementBuffer(redis_client)
+
+    # Act
+    for _ in range(10):
+        await buffer.incr(key(id=1), 2)
+    await buffer.incr(key(id=2))
+
+    # Assert
+    assert buffer.pending(key(id=1)) == 20
+    assert buffer.pending(key(id=2)) == 1
+    assert buffer.stats().pending == 2
+    assert buffer.stats().increments == 11
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldRaiseInvalidArgumentTypeException_whenAmountIsNotInt(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = IntModel(redisClient=redis_client, keyFormat="write-behind-{id}")
+    buffer = IncrementBuffer(redis_client)
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as ex_info:
+        await buffer.incr(key(id=1), 1.5)
+
+    # Assert
+    assert ex_info.type == InvalidArgumentTypeException
+    assert buffer.stats().pending == 0
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldRaiseInvalidArgumentTypeException_whenModelIsNotCounter(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="write-behind-{id}")
+    buffer = IncrementBuffer(redis_client)
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as ex_info:
+        await buffer.incr(key(id=1), 1)  # type: ignore
+
+    # Assert
+    assert ex_info.type == InvalidArgumentTypeException
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldWriteSums_whenFlushed(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    integer = IntModel(redisClient=redis_client, keyFormat="write-behind-int-{id}")
+    floating = FloatModel(redisClient=redis_client, keyFormat="write-behind-float-{id}")  # type: ignore
+    await integer(id=1).set(5, ex=5)
+    await floating(id=1).set(0.5, ex=5)
+    buffer = IncrementBuffer(redis_client)
+    for _ in range(100):
+        await buffer.incr(integer(id=1), 1)
+    await buffer.incr(floating(id=1), 1.25)
+
+    # Act
+    await buffer.flush()
+
+    # Assert
+    assert await integer(id=1).get() == 105
+    assert await floating(id=1).get() == 1.75
+    assert buffer.stats().pending == 0
+    assert buffer.stats().flushed_keys == 2
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldFlush_whenMaxKeysReached(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = IntModel(redisClient=redis_client, keyFormat="write-behind-max-{id}")
+    await key(id=1).delete()
+    await key(id=2).delete()
+    buffer = IncrementBuffer(redis_client, max_keys=2)
+
+    # Act
+    await buffer.incr(key(id=1), 3)
+    await buffer.incr(key(id=2), 4)
+
+    # Assert
+    assert buffer.stats().pending == 0
+    assert await key(id=1).get() == 3
+    assert await key(id=2).get() == 4
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldRejectNewKey_whenFlushFailedAtMaxKeys(
+    redis_client: RedisClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    async def execute_pipeline(self: RedisClient, *args: Any, **kwargs: Any) -> None:
+        raise ConnectionError("Redis is unavailable")
+
+    monkeypatch.setattr(RedisClient, "execute_pipeline", execute_pipeline)
+    key = IntModel(redisClient=redis_client, keyFormat="write-behind-down-{id}")
+    buffer = IncrementBuffer(redis_client, max_keys=2)
+    await buffer.incr(key(id=1), 1)
+    with pytest.raises(ConnectionError):
+        await buffer.incr(key(id=2), 1)
+
+    # Act
+    with pytest.raises(ConnectionError):
+        await buffer.incr(key(id=3), 1)
+
+    # Assert
+    assert buffer.stats().pending == 2
+    assert buffer.stats().failed_flushes == 2
+    assert buffer.stats().rejected == 1
+    assert buffer.pending(key(id=3)) == 0
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldFlush_whenClientIsClosed(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = IntModel(redisClient=redis_client, keyFormat="write-behind-close-{id}")
+    await key(id=1).delete()
+    buffer = IncrementBuffer(redis_client, flush_interval=60)
+    buffer.start()
+    await buffer.incr(key(id=1), 7)
+
+    # Act
+    await redis_client.aclose()
+
+    # Assert
+    assert buffer.running is False
+    assert await key(id=1).get() == 7
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldRegisterCloseCallback_whenCreated(
+    redis_client: RedisClient,
+) -> None:
+    # Act
+    buffer = IncrementBuffer(redis_client)
+
+    # Assert
+    assert buffer.stop in redis_client._close_callbacks
+    assert buffer.running is False
+
+
+@pytest.mark.asyncio
+async def testIncrementBuffer_shouldFlush_whenClientIsClosedWithoutStart(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = IntModel(redisClient=redis_client, keyFormat="write-behind-close-{id}")
+    await key(id=2).delete()
+    buffer = IncrementBuffer(redis_client, flush_interval=60)
+    await buffer.incr(key(id=2), 5)
+
+    # Act
+    await redis_client.aclose()
+
+    # Assert
+    assert buffer.pending(key(id=2)) == 0
+    assert await key(id=2).get() == 5
@@ -0,0 +1,127 @@
+import pytest
+import asyncio
+
+
+from aiorediantic import (
+    RedisClient,
+    StringModel,
+    IntModel,
+    InvalidArgumentTypeException,
+    WriteCoalescer,
+)
+
+
+@pytest.mark.asyncio
+async def testWriteCoalescer_shouldRaiseInvalidArgumentTypeException_whenValueHasWrongType(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = IntModel(redisClient=redis_client, keyFormat="coalesced-{id}")
+    writer = WriteCoalescer(redis_client)
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as ex_info:
+        await writer.set(key(id=1), "value")
+
+    # Assert
+    assert ex_info.type == InvalidArgumentTypeException
+    assert writer.stats().pending == 0
+
+
+@pytest.mark.asyncio
+async def testWriteCoalescer_shouldWriteLatestValue_whenKeySetManyTimes(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="coalesced-{id}")
+    writer = WriteCoalescer(redis_client, window=0.01)
+
+    # Act
+    actual = await asyncio.gather(
+        *(writer.set(key(id=1), f"value-{i}") for i in range(50)),
+        writer.set(key(id=2), "other"),
+    )
+
+    # Assert
+    assert actual == [True] * 51
+    assert await key(id=1).get() == "value-49"
+    assert await key(id=2).get() == "other"
+    assert writer.stats().writes == 51
+    assert writer.stats().coalesced == 49
+    assert writer.stats().batches == 1
+
+
+@pytest.mark.asyncio
+async def testWriteCoalescer_shouldKeepExpiry_whenLatestWriteHasEx(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="coalesced-ttl-{id}")
+    writer = WriteCoalescer(redis_client, window=0.01)
+
+    # Act
+    await asyncio.gather(
+        writer.set(key(id=1), "first"),
+        writer.set(key(id=1), "last", ex=100),
+        writer.set(key(id=2), "plain"),
+    )
+
+    # Assert
+    assert await key(id=1).get() == "last"
+    assert 0 < await key(id=1).ttl() <= 100
+    assert await key(id=2).ttl() == -1
+
+
+@pytest.mark.asyncio
+async def testWriteCoalescer_shouldWriteBatch_whenMaxKeysReached(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="coalesced-max-{id}")
+    writer = WriteCoalescer(redis_client, window=60, max_keys=2)
+
+    # Act
+    await asyncio.wait_for(
+        asyncio.gather(writer.set(key(id=1), "one"), writer.set(key(id=2), "two")),
+        timeout=1,
+    )
+
+    # Assert
+    assert await key(id=1).get() == "one"
+    assert await key(id=2).get() == "two"
+
+
+@pytest.mark.asyncio
+async def testWriteCoalescer_shouldUnregisterCloseCallback_whenClosed(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    writer = WriteCoalescer(redis_client)
+
+    # Act
+    await writer.aclose()
+
+    # Assert
+    assert writer.aclose not in redis_client._close_callbacks
+    assert writer.stats().pending == 0
+
+
+@pytest.mark.asyncio
+async def testWriteCoalescer_shouldWriteBatch_whenCallerReachingMaxKeysIsCancelled(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    key = StringModel(redisClient=redis_client, keyFormat="coalesced-cancel-{id}")
+    writer = WriteCoalescer(redis_client, window=10, max_keys=2)
+    first = asyncio.ensure_future(writer.set(key(id=1), "first"))
+    await asyncio.sleep(0)
+
+    # Act
+    second = asyncio.ensure_future(writer.set(key(id=2), "second"))
+    await asyncio.sleep(0)
+    second.cancel()
+
+    # Assert
+    assert await first is True
+    assert await key(id=1).get() == "first"
+    assert await key(id=2).get() == "second"
@@ -0,0 +1,67 @@
+import pytest
+import datetime
+import uuid
+from pydantic import BaseModel
+
+
+from aiorediantic import codec as codec_module
+from aiorediantic import (
+    Codec,
+    CodecNotAvailableException,
+    available_codecs,
+    get_codec,
+    register_codec,
+)
+
+
+class Item(BaseModel):
+    id: uuid.UUID
+    name: str
+    createdAt: datetime.datetime
+
+
+def testGetCodec_shouldReturnAvailableCodec_whenNameIsNone() -> None:
+    # Act
+    actual: Codec = get_codec()
+
+    # Assert
+    assert actual.name in ("orjson", "msgpack", "json")
+    assert actual.name in available_codecs()
+
+
+@pytest.mark.parametrize("name", ["json", "pickle"])
+def testCodec_shouldRoundTripModel_whenValueHasNonJsonTypes(name: str) -> None:
+    # Arrange
+    codec: Codec = get_codec(name)
+    item = Item(id=uuid.uuid4(), name="naïve", createdAt=datetime.datetime.now())
+
+    # Act
+    actual = Item.parse_obj(codec.loads(codec.dumps(item.dict())))
+
+    # Assert
+    assert actual == item
+
+
+def testGetCodec_shouldRaiseException_whenCodecIsNotRegistered() -> None:
+    # Act
+    with pytest.raises(CodecNotAvailableException):
+        get_codec("not-registered")
+
+
+def testGetCodec_shouldRaiseException_whenCodecPackageIsMissing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    def factory() -> Codec:
+        raise ImportError("missing")
+
+    monkeypatch.setattr(codec_module, "_factories", dict(codec_module._factories))
+    monkeypatch.setattr(codec_module, "_codecs", dict(codec_module._codecs))
+    register_codec("missing-package", factory)
+
+    # Act
+    with pytest.raises(CodecNotAvailableException):
+        get_codec("missing-package")
+
+    # Assert
+    assert "missing-package" not in available_codecs()
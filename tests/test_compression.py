@@ -0,0 +1,186 @@
+import pytest
+import json
+from typing import Any
+import os
+import zlib
+
+
+from aiorediantic import (
+    Compression,
+    Compressor,
+    CodecNotAvailableException,
+    DictionaryCompressor,
+    RedisClient,
+    UnexpectedReturnTypeException,
+)
+from aiorediantic.compression import RAW_HEADER, train_zlib_dictionary
+
+text = '{"name": "value", "items": [1, 2, 3]} ' * 100
+
+
+@pytest.mark.parametrize("algorithm", ["zlib", "lzma"])
+def testCompression_shouldRoundTrip_whenValueIsAboveThreshold(algorithm: str) -> None:
+    # Arrange
+    compression = Compression(algorithm, threshold=1024)
+
+    # Act
+    stored = compression.compress(text)
+
+    # Assert
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(text)
+    assert compression.decompress(stored) == text.encode()
+
+
+def testCompression_shouldStoreValueAsIs_whenValueIsBelowThreshold() -> None:
+    # Arrange
+    compression = Compression(threshold=1024)
+
+    # Act
+    stored = compression.compress("short value")
+
+    # Assert
+    assert stored == "short value"
+
+
+def testCompression_shouldStoreValueAsIs_whenCompressionDoesNotSave() -> None:
+    # Arrange
+    compression = Compression(threshold=16)
+    value = bytes(b % 0xF0 for b in os.urandom(2048))
+
+    # Act
+    stored = compression.compress(value)
+
+    # Assert
+    assert bytes(stored) == value  # type: ignore
+    assert compression.decompress(bytes(stored)) == value  # type: ignore
+
+
+def testCompression_shouldFrameBinaryValue_whenValueStartsWithHeaderByte() -> None:
+    # Arrange
+    compression = Compression(threshold=1024)
+    value = bytes([0xFF, 0x00, 0x01])
+
+    # Act
+    stored = compression.compress(value)
+
+    # Assert
+    assert stored == bytes([RAW_HEADER]) + value
+    assert compression.decompress(stored) == value  # type: ignore
+
+
+def testCompression_shouldReadAnyAlgorithm_whenAlgorithmChanged() -> None:
+    # Arrange
+    stored = Compression("lzma").compress(text)
+
+    # Act
+    actual = Compression("zlib").decompress(stored)  # type: ignore
+
+    # Assert
+    assert actual == text.encode()
+
+
+def testCompression_shouldReturnValueAsIs_whenHeaderIsUnknown() -> None:
+    # Arrange
+    compression = Compression(threshold=1024)
+    value = bytes([0xFF, 0xD8, 0xFF, 0xE0]) + b"JFIF"
+
+    # Act
+    actual = compression.decompress(value)
+
+    # Assert
+    assert actual == value
+
+
+@pytest.mark.parametrize("header", [0xF9, 0xFA])
+def testCompression_shouldReturnValueAsIs_whenValueDoesNotDecompress(
+    header: int,
+) -> None:
+    # Arrange
+    compression = Compression(threshold=1024)
+    value = bytes([header]) + b"not a compressed stream"
+
+    # Act
+    actual = compression.decompress(value)
+
+    # Assert
+    assert actual == value
+
+
+def testCompressor_shouldRaiseTypeError_whenDecompressIsNotImplemented() -> None:
+    # Arrange
+    class PartialCompressor(Compressor):
+        def compress(self, data: Any) -> bytes:
+            return bytes(data)
+
+    # Act
+    with pytest.raises(TypeError) as exc_info:
+        PartialCompressor()  # type: ignore
+
+    # Assert
+    assert "decompress" in str(exc_info.value)
+
+
+def testCompression_shouldRaiseException_whenAlgorithmIsNotSupported() -> None:
+    # Act
+    with pytest.raises(CodecNotAvailableException):
+        Compression("brotli")
+
+
+def document(index: int) -> bytes:
+    return json.dumps(
+        {
+            "id": index,
+            "name": f"user-{index}",
+            "email": f"user{index}@example.com",
+            "settings": {"theme": "dark", "language": "en", "notifications": True},
+            "createdAt": "2023-06-01T12:30:00Z",
+        }
+    ).encode()
+
+
+def testTrainZlibDictionary_shouldCompressBetterThanZlib_whenValuesAreSimilar() -> None:
+    # Arrange
+    dictionary = train_zlib_dictionary([document(i) for i in range(200)])
+    value = document(1000)
+
+    # Act
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15, zdict=dictionary)
+    actual = compressor.compress(value) + compressor.flush()
+
+    # Assert
+    assert len(dictionary) <= 32768
+    assert len(actual) < len(zlib.compress(value)) // 2
+
+
+@pytest.mark.asyncio
+async def testDictionaryCompressor_shouldRoundTrip_whenNoDictionaryIsTrained(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    compression = Compression(
+        DictionaryCompressor(redis_client, "compression-dict"), threshold=64
+    )
+    value = document(1)
+
+    # Act
+    stored = compression.compress(value)
+
+    # Assert
+    assert stored[0] == 0xFD  # type: ignore
+    assert compression.decompress(stored) == value  # type: ignore
+
+
+@pytest.mark.asyncio
+async def testDictionaryCompressor_shouldRaiseException_whenVersionIsNotLoaded(
+    redis_client: RedisClient,
+) -> None:
+    # Arrange
+    compression = Compression(
+        DictionaryCompressor(redis_client, "compression-dict"), threshold=64
+    )
+    stored = bytes([0xFD]) + (7).to_bytes(4, "big") + b"payload"
+
+    # Act
+    with pytest.raises(UnexpectedReturnTypeException):
+        compression.decompress(stored)
@@ -0,0 +1,105 @@
+import pytest
+import asyncio
+import threading
+from typing import List
+
+
+from aiorediantic import (
+    RedisClient,
+    RedisConfig,
+    StringModel,
+    InvalidArgumentTypeException,
+)
+from aiorediantic.sync import BackgroundLoop, SyncModel, get_many, set_many
+from .conftest import conf, high_version
+
+
+@pytest.fixture()
+def background_loop():
+    loop = BackgroundLoop()
+    yield loop
+    loop.stop()
+
+
+async def running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def testBackgroundLoop_shouldRunAllCoroutinesOnSameLoop_whenCalledFromThreads(
+    background_loop: BackgroundLoop,
+) -> None:
+    # Arrange
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    def worker() -> None:
+        loops.append(background_loop.run(running_loop()))
+
+    # Act
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert len(loops) == 3
+    assert all(loop is background_loop.loop for loop in loops)
+
+
+def testSyncModel_shouldRaiseException_whenWrongTypeIsSet(
+    background_loop: BackgroundLoop,
+) -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    key = SyncModel(
+        StringModel(redisClient=redis, keyFormat="{keyname}"), background_loop
+    )
+
+    # Act
+    with pytest.raises(InvalidArgumentTypeException) as ex_info:
+        key(keyname="sync-wrong-type").set(1)  # type: ignore
+
+    # Assert
+    assert ex_info.type == InvalidArgumentTypeException
+
+
+def testSyncModel_shouldSetAndGetValue_whenCalledWithoutEventLoop(
+    background_loop: BackgroundLoop,
+) -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    key = SyncModel(
+        StringModel(redisClient=redis, keyFormat="{keyname}"), background_loop
+    )
+    obj = key(keyname="sync-set-get")
+
+    # Act
+    status = obj.set("value", ex=5)
+    actual = obj.get()
+
+    # Assert
+    assert status is True
+    assert actual == "value"
+    background_loop.run(redis.aclose())
+
+
+def testSyncBulk_shouldSetAndGetManyValues_whenCalledWithoutEventLoop(
+    background_loop: BackgroundLoop,
+) -> None:
+    # Arrange
+    redis = RedisClient(config=RedisConfig.construct(redis_version=high_version, **conf))  # type: ignore
+    key = SyncModel(
+        StringModel(redisClient=redis, keyFormat="sync-bulk-{id}"), background_loop
+    )
+    objs = [key(id=i) for i in range(3)]
+
+    # Act
+    statuses = set_many(
+        [(obj, str(i)) for i, obj in enumerate(objs)], loop=background_loop, ex=5
+    )
+    actual = get_many(objs, loop=background_loop)
+
+    # Assert
+    assert statuses == [True, True, True]
+    assert actual == ["0", "1", "2"]
+    background_loop.run(redis.aclose())